@@ -1,30 +1,81 @@
 """Simple Thermostat integration for Home Assistant."""
+import asyncio
 import logging
 from pathlib import Path
 import voluptuous as vol
 
 from homeassistant.components.http import StaticPathConfig
+from homeassistant.const import ATTR_ENTITY_ID, ENTITY_MATCH_ALL
 from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.helpers.service import async_extract_referenced_entity_ids
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.helpers.config_validation as cv
 
-_LOGGER = logging.getLogger(__name__)
+from .const import DOMAIN
+from .coordinator import async_get_coordinator
+from .scheduler import (
+    DEFAULT_BURST,
+    DEFAULT_RATE,
+    DEFAULT_STARTUP_JITTER,
+    async_get_scheduler,
+)
+from .websocket_api import async_register_websocket_commands
 
-DOMAIN = "simple_thermostat"
+_LOGGER = logging.getLogger(__name__)
 
 SERVICE_SET_PRESET_TEMPERATURE = "set_preset_temperature"
 
-SET_PRESET_TEMPERATURE_SCHEMA = vol.Schema({
-    vol.Required("entity_id"): cv.entity_id,
-    vol.Optional("away_temp"): vol.Coerce(float),
-    vol.Optional("present_temp"): vol.Coerce(float),
-    vol.Optional("cosy_temp"): vol.Coerce(float),
+CONF_COMMAND_RATE = "command_rate"
+CONF_COMMAND_BURST = "command_burst"
+CONF_STARTUP_JITTER = "startup_jitter"
+
+CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(DOMAIN): vol.Schema({
+            vol.Optional(CONF_COMMAND_RATE, default=DEFAULT_RATE): vol.All(
+                vol.Coerce(float), vol.Range(min=0.1)
+            ),
+            vol.Optional(CONF_COMMAND_BURST, default=DEFAULT_BURST): vol.All(
+                vol.Coerce(int), vol.Range(min=1)
+            ),
+            vol.Optional(CONF_STARTUP_JITTER, default=DEFAULT_STARTUP_JITTER): vol.All(
+                vol.Coerce(float), vol.Range(min=0)
+            ),
+        }),
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+# Preset temperature attribute -> service field of the relative change
+PRESET_TEMPERATURE_FIELDS = {
+    "away_temp": "away_temp_delta",
+    "present_temp": "present_temp_delta",
+    "cosy_temp": "cosy_temp_delta",
+}
+
+# Targets entities, devices or areas (and labels/floors where HA supports them)
+SET_PRESET_TEMPERATURE_SCHEMA = cv.make_entity_service_schema({
+    vol.Exclusive("away_temp", "away_temp"): vol.Coerce(float),
+    vol.Exclusive("away_temp_delta", "away_temp"): vol.Coerce(float),
+    vol.Exclusive("present_temp", "present_temp"): vol.Coerce(float),
+    vol.Exclusive("present_temp_delta", "present_temp"): vol.Coerce(float),
+    vol.Exclusive("cosy_temp", "cosy_temp"): vol.Coerce(float),
+    vol.Exclusive("cosy_temp_delta", "cosy_temp"): vol.Coerce(float),
 })
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType):
     """Set up the Simple Thermostat component."""
 
+    # House-wide outbound command budget (shared by all rooms)
+    if DOMAIN in config:
+        conf = config[DOMAIN]
+        async_get_scheduler(hass).async_configure(
+            conf[CONF_COMMAND_RATE],
+            conf[CONF_COMMAND_BURST],
+            conf[CONF_STARTUP_JITTER],
+        )
+
     # Register the custom Lovelace card
     www_path = Path(__file__).parent / "www"
 
@@ -44,47 +95,55 @@ async def async_setup(hass: HomeAssistant, config: ConfigType):
 
     async def async_set_preset_temperature(call: ServiceCall):
         """Handle the set_preset_temperature service call."""
-        entity_id = call.data.get("entity_id")
-
-        # Get the climate entity
-        climate_entity = None
-        for component in hass.data.get("entity_components", {}).values():
-            if hasattr(component, "entities"):
-                for entity in component.entities:
-                    if entity.entity_id == entity_id:
-                        climate_entity = entity
-                        break
-            if climate_entity:
-                break
-
-        if not climate_entity:
-            _LOGGER.error("Entity %s not found", entity_id)
+        coordinator = async_get_coordinator(hass)
+
+        # Resolve the targeted thermostats
+        if call.data.get(ATTR_ENTITY_ID) == ENTITY_MATCH_ALL:
+            thermostats = coordinator.get_thermostats()
+        else:
+            selected = async_extract_referenced_entity_ids(hass, call)
+            thermostats = [
+                thermostat
+                for entity_id in sorted(selected.referenced | selected.indirectly_referenced)
+                if (thermostat := coordinator.get_thermostat(entity_id)) is not None
+            ]
+
+        if not thermostats:
+            _LOGGER.error("No Simple Thermostat matched %s", call.data)
             return
 
-        # Update preset temperatures
-        if "away_temp" in call.data:
-            climate_entity._away_temp = call.data["away_temp"]
-        if "present_temp" in call.data:
-            climate_entity._present_temp = call.data["present_temp"]
-        if "cosy_temp" in call.data:
-            climate_entity._cosy_temp = call.data["cosy_temp"]
-
-        # Update target temp if current preset was modified
-        climate_entity._update_target_temp_from_preset()
-
-        # Re-apply heating control with new temperature
-        if climate_entity._hvac_mode == "heat":
-            await climate_entity._async_control_heating()
-
-        # Update state
-        climate_entity.async_write_ha_state()
-
-        _LOGGER.info(
-            "%s: Preset temperatures updated - away: %s, present: %s, cosy: %s",
-            climate_entity.name,
-            climate_entity._away_temp,
-            climate_entity._present_temp,
-            climate_entity._cosy_temp,
+        # Update preset temperatures of all rooms in one pass
+        for climate_entity in thermostats:
+            for attr, delta_field in PRESET_TEMPERATURE_FIELDS.items():
+                if attr in call.data:
+                    setattr(climate_entity, f"_{attr}", call.data[attr])
+                elif delta_field in call.data:
+                    # Repeated changes stay inside the entity's temperature range
+                    temperature = round(
+                        getattr(climate_entity, f"_{attr}") + call.data[delta_field], 1
+                    )
+                    setattr(
+                        climate_entity,
+                        f"_{attr}",
+                        min(max(temperature, climate_entity.min_temp), climate_entity.max_temp),
+                    )
+
+            # Update target temp if current preset was modified
+            climate_entity._update_target_temp_from_preset()
+            # Persist the edit (rapid changes collapse into one write)
+            climate_entity._async_schedule_save()
+
+            _LOGGER.info(
+                "%s: Preset temperatures updated - away: %s, present: %s, cosy: %s",
+                climate_entity.name,
+                climate_entity._away_temp,
+                climate_entity._present_temp,
+                climate_entity._cosy_temp,
+            )
+
+        # Re-apply heating control in all rooms concurrently (one state write each)
+        await asyncio.gather(
+            *(climate_entity._control_actor.async_refresh() for climate_entity in thermostats)
         )
 
     hass.services.async_register(
@@ -94,4 +153,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType):
         schema=SET_PRESET_TEMPERATURE_SCHEMA,
     )
 
+    # Details for the card (kept out of the recorder)
+    async_register_websocket_commands(hass)
+
     return True
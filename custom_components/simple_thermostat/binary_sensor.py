@@ -1,7 +1,7 @@
 """Binary sensor platform for Simple Thermostat."""
 import logging
 
-from homeassistant.components.binary_sensor import BinarySensorEntity
+from .sensor_registry import PLATFORM_BINARY_SENSOR, async_get_sensor_registry
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -11,8 +11,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     if discovery_info is None:
         return
 
-    sensors = discovery_info.get("sensors", [])
-    binary_sensors = [s for s in sensors if isinstance(s, BinarySensorEntity)]
-
-    if binary_sensors:
-        async_add_entities(binary_sensors, update_before_add=True)
+    # Entities of all rooms are handed over by the domain-wide registry
+    async_get_sensor_registry(hass).async_register_platform(
+        PLATFORM_BINARY_SENSOR, async_add_entities
+    )
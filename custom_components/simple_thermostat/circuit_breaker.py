@@ -0,0 +1,125 @@
+"""Circuit Breaker - Temporarily skips TRVs that keep failing."""
+import asyncio
+from datetime import timedelta
+import logging
+from time import monotonic
+from typing import Callable, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_RESET_TIMEOUT = timedelta(minutes=5)
+
+
+class CircuitBreakers:
+    """Per-device circuit breakers for one thermostat.
+
+    After ``failure_threshold`` consecutive failed calls a device's breaker
+    opens and calls to it are skipped. Once ``reset_timeout`` has passed the
+    breaker is half-open: the next call goes through as a probe, closing the
+    breaker on success and re-opening it on failure. ``update_callback`` is
+    called when a breaker turns half-open (nothing else happens at that time).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: timedelta = DEFAULT_RESET_TIMEOUT,
+        update_callback: Optional[Callable[[], None]] = None,
+    ):
+        """Initialize CircuitBreakers."""
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._reset_seconds = reset_timeout.total_seconds()
+        self._update_callback = update_callback
+
+        # entity_id -> {"consecutive": int, "failures": int, "opened_at": monotonic | None}
+        self._devices: dict[str, dict] = {}
+        # entity_id -> timer firing when the open breaker turns half-open
+        self._half_open_timers: dict[str, asyncio.TimerHandle] = {}
+
+        self.skipped_count = 0
+
+    def allow(self, entity_id: str) -> bool:
+        """Return True if a call to the device may be made (counts skipped calls)."""
+        if self.get_state(entity_id) == STATE_OPEN:
+            self.skipped_count += 1
+            return False
+        return True
+
+    def get_state(self, entity_id: str) -> str:
+        """Return the breaker state of a device."""
+        device = self._devices.get(entity_id)
+        if device is None or device["opened_at"] is None:
+            return STATE_CLOSED
+        if monotonic() - device["opened_at"] >= self._reset_seconds:
+            return STATE_HALF_OPEN
+        return STATE_OPEN
+
+    def record_success(self, entity_id: str):
+        """Record a successful call; closes the breaker."""
+        device = self._devices.get(entity_id)
+        if device is None:
+            return
+        if device["opened_at"] is not None:
+            _LOGGER.info("%s: %s responds again, closing circuit breaker", self.name, entity_id)
+        device["consecutive"] = 0
+        device["opened_at"] = None
+        self._cancel_half_open_timer(entity_id)
+
+    def record_failure(self, entity_id: str):
+        """Record a failed call; opens the breaker at the threshold or after a failed probe."""
+        device = self._devices.setdefault(
+            entity_id, {"consecutive": 0, "failures": 0, "opened_at": None}
+        )
+        device["consecutive"] += 1
+        device["failures"] += 1
+
+        probe_failed = device["opened_at"] is not None
+        if probe_failed or device["consecutive"] >= self._failure_threshold:
+            if not probe_failed:
+                _LOGGER.warning(
+                    "%s: %s failed %d times in a row, skipping it for %d s",
+                    self.name,
+                    entity_id,
+                    device["consecutive"],
+                    self._reset_seconds,
+                )
+            device["opened_at"] = monotonic()
+            self._arm_half_open_timer(entity_id)
+
+    def get_stats(self) -> dict:
+        """Return breaker states and failure counts of devices that ever failed."""
+        return {
+            "trv_breakers": {
+                entity_id: self.get_state(entity_id) for entity_id in self._devices
+            },
+            "trv_failures": {
+                entity_id: device["failures"] for entity_id, device in self._devices.items()
+            },
+            "commands_breaker_skipped": self.skipped_count,
+        }
+
+    def _arm_half_open_timer(self, entity_id: str):
+        """Call update_callback once the device's breaker turns half-open."""
+        self._cancel_half_open_timer(entity_id)
+        if self._update_callback is not None:
+            self._half_open_timers[entity_id] = asyncio.get_running_loop().call_later(
+                self._reset_seconds, self._async_half_open, entity_id
+            )
+
+    def _cancel_half_open_timer(self, entity_id: str):
+        """Cancel a pending half-open timer of a device, if any."""
+        timer = self._half_open_timers.pop(entity_id, None)
+        if timer is not None:
+            timer.cancel()
+
+    def _async_half_open(self, entity_id: str):
+        """Report a breaker that just turned half-open."""
+        self._half_open_timers.pop(entity_id, None)
+        self._update_callback()
@@ -2,6 +2,7 @@
 import asyncio
 import logging
 from datetime import timedelta
+from time import monotonic
 
 import voluptuous as vol
 
@@ -12,7 +13,6 @@ from homeassistant.components.climate import (
     HVACMode,
 )
 from homeassistant.const import (
-    ATTR_ENTITY_ID,
     ATTR_TEMPERATURE,
     CONF_NAME,
     CONF_UNIQUE_ID,
@@ -21,17 +21,31 @@ from homeassistant.const import (
     STATE_UNKNOWN,
     UnitOfTemperature,
 )
-from homeassistant.core import callback
+from homeassistant.core import HassJob, callback
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.discovery import async_load_platform
-from homeassistant.helpers.event import (
-    async_track_state_change_event,
-    async_track_time_interval,
-)
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.restore_state import RestoreEntity
-
-from .sensor import async_create_sensors
+import homeassistant.util.dt as dt_util
+
+from .circuit_breaker import CircuitBreakers
+from .command_cache import CommandCache
+from .confirmation import ConfirmationTracker
+from .control_actor import ControlActor
+from .coordinator import async_get_coordinator
+from .fanout import CommandFanout, DEFAULT_CALL_TIMEOUT, DEFAULT_MAX_CONCURRENCY
+from .metrics import ControlMetrics
+from .sensor import DIAGNOSTICS_FULL, DIAGNOSTICS_LEVELS, async_create_sensors
+from .sensor_registry import async_get_sensor_registry
 from .preset_manager import PresetManager
+from .profiles import DEFAULT_PROFILE, PROFILES, VALUE_TOLERANCE, get_profile
+from .scheduler import (
+    PRIORITY_CONTROL,
+    PRIORITY_INIT,
+    PRIORITY_SAFETY,
+    async_get_scheduler,
+)
+from .storage import async_get_state_store
+from .transport import DEFAULT_TRANSPORT, TRANSPORTS, create_transport
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -54,6 +68,19 @@ CONF_OUTDOOR_TEMP_SENSOR = "outdoor_temp_sensor"
 CONF_GLOBAL_AWAY_SENSOR = "global_away_sensor"
 CONF_PRESENCE_AWAY_DELAY = "presence_away_delay"
 CONF_OUTDOOR_TEMP_THRESHOLD = "outdoor_temp_threshold"
+CONF_MAX_CONCURRENT_COMMANDS = "max_concurrent_commands"
+CONF_COMMAND_REASSERT_INTERVAL = "command_reassert_interval"
+CONF_CONTROL_DEBOUNCE = "control_debounce"
+CONF_DIAGNOSTICS = "diagnostics"
+CONF_MIN_MODE_DWELL = "min_mode_dwell"
+CONF_DEVICE_PROFILE = "device_profile"
+CONF_TRANSPORT = "transport"
+CONF_MQTT_GROUP = "mqtt_group"
+CONF_REMOTE_TEMP_DELTA = "remote_temp_delta"
+CONF_REMOTE_TEMP_MAX_AGE = "remote_temp_max_age"
+CONF_COMMAND_TIMEOUT = "command_timeout"
+CONF_COMMAND_RETRIES = "command_retries"
+CONF_CONTROL_METRICS = "control_metrics"
 
 DEFAULT_NAME = "Simple Thermostat"
 DEFAULT_BINARY_THRESHOLD = 0.5
@@ -62,6 +89,16 @@ DEFAULT_SYNC_REMOTE_TEMP = True
 DEFAULT_INITIAL_PRESET = "present"
 DEFAULT_PRESENCE_AWAY_DELAY = 15
 DEFAULT_OUTDOOR_TEMP_THRESHOLD = 20.0
+DEFAULT_MAX_CONCURRENT_COMMANDS = DEFAULT_MAX_CONCURRENCY
+DEFAULT_COMMAND_REASSERT_INTERVAL = 30
+DEFAULT_CONTROL_DEBOUNCE = 2.0
+DEFAULT_DIAGNOSTICS = DIAGNOSTICS_FULL
+DEFAULT_MIN_MODE_DWELL = 0  # seconds, 0 = switch as soon as the hysteresis band allows
+DEFAULT_REMOTE_TEMP_DELTA = 0.2  # °C change that is sent to the TRVs right away
+DEFAULT_REMOTE_TEMP_MAX_AGE = 25  # minutes until an unchanged value is re-sent
+DEFAULT_COMMAND_TIMEOUT = DEFAULT_CALL_TIMEOUT
+DEFAULT_COMMAND_RETRIES = 2
+DEFAULT_CONTROL_METRICS = False
 
 PRESET_AWAY = "away"
 PRESET_PRESENT = "present"
@@ -73,7 +110,19 @@ CONTROL_MODE_BINARY_COOL = "binary_cool"
 CONTROL_MODE_PROPORTIONAL = "proportional"
 CONTROL_MODE_OFF = "off"
 
-REMOTE_TEMP_SYNC_INTERVAL = timedelta(minutes=25)
+# Modes chosen by the control loop (mode switches are counted between these)
+ACTIVE_CONTROL_MODES = (
+    CONTROL_MODE_BINARY_HEAT,
+    CONTROL_MODE_PROPORTIONAL,
+    CONTROL_MODE_BINARY_COOL,
+)
+
+# How often the remote temperature keep-alive is checked (sends only when due)
+REMOTE_TEMP_CHECK_INTERVAL = timedelta(minutes=1)
+# Keep-alive is sent at least this long before the device's remote temperature expires
+REMOTE_TEMP_TIMEOUT_MARGIN = timedelta(minutes=5)
+# Fallback sweep in case a valve/TRV state change event was missed
+SAFETY_SWEEP_INTERVAL = timedelta(minutes=5)
 
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
     {
@@ -88,6 +137,7 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
                     vol.Schema({
                         vol.Required("id"): cv.string,
                         vol.Optional("name"): cv.string,
+                        vol.Optional("profile"): vol.In(PROFILES),
                     })
                 )
             ]
@@ -129,6 +179,35 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
         # Tuning parameters
         vol.Optional(CONF_PRESENCE_AWAY_DELAY, default=DEFAULT_PRESENCE_AWAY_DELAY): vol.Coerce(int),
         vol.Optional(CONF_OUTDOOR_TEMP_THRESHOLD, default=DEFAULT_OUTDOOR_TEMP_THRESHOLD): vol.Coerce(float),
+        vol.Optional(CONF_MAX_CONCURRENT_COMMANDS, default=DEFAULT_MAX_CONCURRENT_COMMANDS): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(CONF_COMMAND_REASSERT_INTERVAL, default=DEFAULT_COMMAND_REASSERT_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=0)
+        ),
+        vol.Optional(CONF_CONTROL_DEBOUNCE, default=DEFAULT_CONTROL_DEBOUNCE): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+        vol.Optional(CONF_DIAGNOSTICS, default=DEFAULT_DIAGNOSTICS): vol.In(DIAGNOSTICS_LEVELS),
+        vol.Optional(CONF_MIN_MODE_DWELL, default=DEFAULT_MIN_MODE_DWELL): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+        vol.Optional(CONF_DEVICE_PROFILE, default=DEFAULT_PROFILE): vol.In(PROFILES),
+        vol.Optional(CONF_TRANSPORT, default=DEFAULT_TRANSPORT): vol.In(TRANSPORTS),
+        vol.Optional(CONF_MQTT_GROUP): cv.string,
+        vol.Optional(CONF_REMOTE_TEMP_DELTA, default=DEFAULT_REMOTE_TEMP_DELTA): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+        vol.Optional(CONF_REMOTE_TEMP_MAX_AGE, default=DEFAULT_REMOTE_TEMP_MAX_AGE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(CONF_COMMAND_TIMEOUT, default=DEFAULT_COMMAND_TIMEOUT): vol.All(
+            vol.Coerce(float), vol.Range(min=1)
+        ),
+        vol.Optional(CONF_COMMAND_RETRIES, default=DEFAULT_COMMAND_RETRIES): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=5)
+        ),
+        vol.Optional(CONF_CONTROL_METRICS, default=DEFAULT_CONTROL_METRICS): cv.boolean,
     }
 )
 
@@ -150,6 +229,8 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     # Support simplified trv_ids configuration
     trv_ids_config = config.get(CONF_TRV_IDS)
     trv_names = []
+    device_profile = config.get(CONF_DEVICE_PROFILE, DEFAULT_PROFILE)
+    trv_profiles = []
     if trv_ids_config:
         # Parse TRV config (supports both string and dict format)
         trv_ids = []
@@ -158,13 +239,19 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
                 # Backward compatibility: simple string
                 trv_ids.append(trv_config)
                 trv_names.append(None)
+                trv_profiles.append(device_profile)
             elif isinstance(trv_config, dict):
-                # New format: {id: "...", name: "..."}
+                # New format: {id: "...", name: "...", profile: "..."}
                 trv_ids.append(trv_config["id"])
                 trv_names.append(trv_config.get("name"))
-
-        # Auto-construct valve and climate entities from TRV IDs
-        valve_entities = [f"number.{trv_id}_pi_heating_demand" for trv_id in trv_ids]
+                trv_profiles.append(trv_config.get("profile", device_profile))
+
+        # Auto-construct valve and climate entities from TRV IDs (valve naming per device profile;
+        # None for TRVs whose profile has no valve entity, so the list stays aligned per TRV)
+        valve_entities = [
+            get_profile(profile).get_valve_entity(trv_id)
+            for trv_id, profile in zip(trv_ids, trv_profiles)
+        ]
         climate_entities = [f"climate.{trv_id}" for trv_id in trv_ids]
         _LOGGER.info(f"Auto-constructed entities from trv_ids: valves={valve_entities}, climates={climate_entities}, names={trv_names}")
     else:
@@ -172,6 +259,7 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         valve_entities = config.get(CONF_VALVE_ENTITIES)
         climate_entities = config.get(CONF_CLIMATE_ENTITIES)
         trv_ids = []
+        trv_profiles = [device_profile] * len(climate_entities or [])
 
     away_temp = config.get(CONF_AWAY_TEMP)
     present_temp = config.get(CONF_PRESENT_TEMP)
@@ -190,6 +278,16 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     global_away_sensor = config.get(CONF_GLOBAL_AWAY_SENSOR)
     presence_away_delay = config.get(CONF_PRESENCE_AWAY_DELAY)
     outdoor_temp_threshold = config.get(CONF_OUTDOOR_TEMP_THRESHOLD)
+    max_concurrent_commands = config.get(CONF_MAX_CONCURRENT_COMMANDS)
+    command_reassert_interval = config.get(CONF_COMMAND_REASSERT_INTERVAL)
+    control_debounce = config.get(CONF_CONTROL_DEBOUNCE)
+    min_mode_dwell = config.get(CONF_MIN_MODE_DWELL)
+    transport = config.get(CONF_TRANSPORT, DEFAULT_TRANSPORT)
+    mqtt_group = config.get(CONF_MQTT_GROUP)
+    remote_temp_delta = config.get(CONF_REMOTE_TEMP_DELTA, DEFAULT_REMOTE_TEMP_DELTA)
+    remote_temp_max_age = config.get(CONF_REMOTE_TEMP_MAX_AGE, DEFAULT_REMOTE_TEMP_MAX_AGE)
+    command_timeout = config.get(CONF_COMMAND_TIMEOUT, DEFAULT_COMMAND_TIMEOUT)
+    command_retries = config.get(CONF_COMMAND_RETRIES, DEFAULT_COMMAND_RETRIES)
 
     thermostat = SimpleThermostat(
         hass,
@@ -213,37 +311,65 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
         global_away_sensor,
         presence_away_delay,
         outdoor_temp_threshold,
+        max_concurrent_commands,
+        command_reassert_interval,
+        control_debounce,
+        min_mode_dwell,
+        trv_profiles,
+        transport,
+        mqtt_group,
+        remote_temp_delta,
+        remote_temp_max_age,
+        command_timeout,
+        command_retries,
     )
 
     async_add_entities([thermostat])
 
-    # Create diagnostic sensors
-    sensors = await async_create_sensors(hass, thermostat)
+    # Create diagnostic sensors (as many as the diagnostics level asks for)
+    sensors = await async_create_sensors(
+        hass,
+        thermostat,
+        config.get(CONF_DIAGNOSTICS, DEFAULT_DIAGNOSTICS),
+        config.get(CONF_CONTROL_METRICS, DEFAULT_CONTROL_METRICS),
+    )
     if sensors:
-        # Load sensor platforms (non-blocking)
-        hass.async_create_task(
-            async_load_platform(
-                hass,
-                "sensor",
-                "simple_thermostat",
-                {"sensors": sensors},
-                config
-            )
-        )
-        hass.async_create_task(
-            async_load_platform(
-                hass,
-                "binary_sensor",
-                "simple_thermostat",
-                {"sensors": sensors},
-                config
-            )
-        )
+        # Sensor platforms are loaded once for all rooms (non-blocking)
+        async_get_sensor_registry(hass).async_add_sensors(sensors, config)
 
 
 class SimpleThermostat(ClimateEntity, RestoreEntity):
     """Simple Thermostat with hybrid control strategy."""
 
+    # Bulky or fast-changing attributes; the card reads them via the websocket API
+    _unrecorded_attributes = frozenset(
+        {
+            "action_history",
+            "schedule",
+            "valve_positions",
+            "trv_internal_temps",
+            "trv_target_temps",
+            "commands_sent",
+            "commands_skipped",
+            "command_queue_depth",
+            "command_queue_peak",
+            "commands_rate_limited",
+            "command_wait_avg_ms",
+            "command_wait_max_ms",
+            "state_writes_suppressed",
+            "mode_switches",
+            "mode_switches_held",
+            "command_retries",
+            "command_timeouts",
+            "commands_breaker_skipped",
+            "trv_breakers",
+            "trv_failures",
+            "commands_confirmed",
+            "commands_unconfirmed",
+            "trv_confirm_latency_ms",
+        }
+    )
+
     def __init__(
         self,
         hass,
@@ -267,15 +393,35 @@ class SimpleThermostat(ClimateEntity, RestoreEntity):
         global_away_sensor=None,
         presence_away_delay=DEFAULT_PRESENCE_AWAY_DELAY,
         outdoor_temp_threshold=DEFAULT_OUTDOOR_TEMP_THRESHOLD,
+        max_concurrent_commands=DEFAULT_MAX_CONCURRENT_COMMANDS,
+        command_reassert_interval=DEFAULT_COMMAND_REASSERT_INTERVAL,
+        control_debounce=DEFAULT_CONTROL_DEBOUNCE,
+        min_mode_dwell=DEFAULT_MIN_MODE_DWELL,
+        trv_profiles=None,
+        transport=DEFAULT_TRANSPORT,
+        mqtt_group=None,
+        remote_temp_delta=DEFAULT_REMOTE_TEMP_DELTA,
+        remote_temp_max_age=DEFAULT_REMOTE_TEMP_MAX_AGE,
+        command_timeout=DEFAULT_COMMAND_TIMEOUT,
+        command_retries=DEFAULT_COMMAND_RETRIES,
     ):
         """Initialize the thermostat."""
         self.hass = hass
         self._attr_name = f"ST {name}"
         self._attr_unique_id = unique_id
         self._temp_sensor = temp_sensor
-        self._valve_entities = valve_entities
         self._climate_entities = climate_entities
+        # Valve entity per TRV (aligned with climate_entities, None if the TRV has none)
+        self._trv_valve_entities = [
+            valve_entities[idx] if valve_entities and idx < len(valve_entities) else None
+            for idx in range(len(climate_entities))
+        ]
+        self._valve_entities = [
+            valve_entity for valve_entity in (valve_entities or []) if valve_entity is not None
+        ]
         self._trv_names = trv_names or []
+        # Device profile per TRV (aligned with climate_entities)
+        self._trv_profiles = [get_profile(profile) for profile in (trv_profiles or [])]
 
         # Log configuration for debugging
         _LOGGER.info(
@@ -288,9 +434,16 @@ class SimpleThermostat(ClimateEntity, RestoreEntity):
         self._away_temp = away_temp
         self._present_temp = present_temp
         self._cosy_temp = cosy_temp
+        # YAML values - stored preset edits only win while these are unchanged
+        self._configured_preset_temps = [away_temp, present_temp, cosy_temp]
         self._binary_threshold = binary_threshold
         self._hysteresis = hysteresis
         self._sync_remote_temp = sync_remote_temp
+        # Remote temperature is sent on a delta, otherwise only as a keep-alive
+        self._remote_temp_delta = remote_temp_delta
+        self._remote_temp_max_age = timedelta(minutes=remote_temp_max_age)
+        self._remote_temp_sent = None
+        self._remote_temp_sent_at = None
         self._initial_preset = initial_preset
 
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
@@ -327,10 +480,80 @@ class SimpleThermostat(ClimateEntity, RestoreEntity):
         self._trv_target_temps = {}  # trv_index -> temp
         self._last_control_mode = None
 
+        # Mode switching: hysteresis band, minimum time in a mode and counters
+        self._min_mode_dwell = timedelta(seconds=min_mode_dwell)
+        self._mode_entered_at = None
+        self._mode_switches = 0
+        self._mode_switches_held = 0  # switches prevented by hysteresis/dwell
+        self._held_mode = None  # mode a switch is currently being held back from
+
+        # House-wide rate limit and priorities for Zigbee traffic
+        self._scheduler = async_get_scheduler(hass)
+
+        # Commanded vs. reported values; confirmed by state change events
+        self._confirmations = ConfirmationTracker(
+            self._attr_name, update_callback=self._async_command_stats_changed
+        )
+
+        # Unresponsive TRVs are skipped for a while instead of stalling every cycle
+        self._breakers = CircuitBreakers(
+            self._attr_name, update_callback=self._async_command_stats_changed
+        )
+
+        # Latency histograms and throughput counters of the control loop
+        self._metrics = ControlMetrics(self._attr_name)
+
+        # Batched, concurrent TRV command sending (bounded by timeouts and retries)
+        self._fanout = CommandFanout(
+            hass,
+            self._attr_name,
+            max_concurrent_commands,
+            self._scheduler,
+            command_timeout,
+            command_retries,
+            self._breakers,
+            self._metrics,
+        )
+
+        # Manual mode and remote temperature go through the Zigbee stack
+        self._transport = create_transport(
+            hass, self._attr_name, transport, self._scheduler, mqtt_group, climate_entities
+        )
+
+        # Skip commands the TRVs already have (re-assert periodically for drift)
+        self._command_cache = CommandCache(
+            self._attr_name,
+            timedelta(minutes=command_reassert_interval),
+            self._confirmations,
+        )
+
+        # Single worker that coalesces control triggers (no overlapping cycles)
+        self._control_actor = ControlActor(
+            hass,
+            self._attr_name,
+            self._async_control_cycle,
+            timedelta(seconds=control_debounce),
+        )
+
         # Action history for logs (keep last 20 actions)
         self._action_history = []
         self._max_history = 20
 
+        # Persistent controller state (shared .storage file, set when added)
+        self._state_store = None
+        self._initialized_trvs = set()  # climate entities set to 30°C/manual
+
+        # Attribute snapshot cache (rebuilt only once an input marked it dirty)
+        # and no-op write suppression
+        self._attributes_cache = None
+        self._attributes_dirty = True
+        self._override_status = None
+        self._last_written_state = None
+        self._suppressed_writes = 0
+
+        # Diagnostic sensors notified after each state write
+        self._diagnostic_listeners = []
+
         # Track state change listeners
         self._remove_listeners = []
 
@@ -341,21 +564,42 @@ class SimpleThermostat(ClimateEntity, RestoreEntity):
         # Set up PresetManager
         await self._preset_manager.async_setup()
 
-        # Restore previous state
-        last_state = await self.async_get_last_state()
-        if last_state:
-            self._hvac_mode = last_state.state
-            if last_state.attributes.get("preset_mode"):
-                # Check if it was a manual preset change
-                self._preset_mode = last_state.attributes["preset_mode"]
-                self._preset_manager.set_manual_preset(self._preset_mode)
-            if last_state.attributes.get("temperature"):
-                self._target_temp = last_state.attributes["temperature"]
+        # Resume from the persisted controller state (falls back to the last HA state)
+        self._state_store = await async_get_state_store(self.hass)
+        stored = self._state_store.get(self._storage_key)
+        if stored:
+            self._restore_persisted_state(stored)
+        else:
+            last_state = await self.async_get_last_state()
+            if last_state:
+                self._hvac_mode = last_state.state
+                if last_state.attributes.get("preset_mode"):
+                    # Check if it was a manual preset change
+                    self._preset_mode = last_state.attributes["preset_mode"]
+                    self._preset_manager.set_manual_preset(self._preset_mode)
+                if last_state.attributes.get("temperature"):
+                    self._target_temp = last_state.attributes["temperature"]
+                # Resume a presence override timer that was running before restart
+                if last_state.attributes.get("presence_expires_at"):
+                    self._preset_manager.restore_presence_expiry(
+                        dt_util.parse_datetime(last_state.attributes["presence_expires_at"])
+                    )
 
         # Update preset from PresetManager
         self._preset_mode = self._preset_manager.get_active_preset()
         self._update_target_temp_from_preset()
 
+        # Keep a manually set target temperature (no preset) across restarts
+        if stored and stored.get("preset_mode") is None and stored.get("target_temp") is not None:
+            self._preset_mode = None
+            self._target_temp = stored["target_temp"]
+
+        self._enabled = self._hvac_mode == HVACMode.HEAT
+
+        self._remove_listeners.append(
+            self._state_store.async_register(self._storage_key, self._get_persisted_state)
+        )
+
         # Validate temperature sensor exists
         sensor_state = self.hass.states.get(self._temp_sensor)
         if sensor_state:
@@ -374,56 +618,80 @@ class SimpleThermostat(ClimateEntity, RestoreEntity):
                 self._temp_sensor
             )
 
+        # Timers and state subscriptions are shared house-wide via the coordinator
+        coordinator = async_get_coordinator(self.hass)
+
+        # Index for service and websocket lookups
+        self._remove_listeners.append(coordinator.async_register_thermostat(self))
+
         # Listen to temperature sensor changes
         self._remove_listeners.append(
-            async_track_state_change_event(
-                self.hass, [self._temp_sensor], self._async_temp_sensor_changed
+            coordinator.async_track_state_change(
+                [self._temp_sensor], self._async_temp_sensor_changed
             )
         )
 
-        # Listen to TRV state changes (for reading internal temps)
+        # Listen to TRV state changes (internal and target temps)
         self._remove_listeners.append(
-            async_track_state_change_event(
-                self.hass, self._climate_entities, self._async_trv_state_changed
+            coordinator.async_track_state_change(
+                self._climate_entities, self._async_trv_state_changed
             )
         )
 
-        # Update preset every minute (check for schedule changes)
+        # Listen to valve position changes
         self._remove_listeners.append(
-            async_track_time_interval(
-                self.hass, self._async_update_preset, timedelta(minutes=1)
+            coordinator.async_track_state_change(
+                self._valve_entities, self._async_valve_state_changed
             )
         )
 
-        # Refresh sensors every 15 seconds
+        # Apply schedule and override changes as soon as the PresetManager reports them
+        self._remove_listeners.append(
+            self._preset_manager.async_add_listener(self._async_active_preset_changed)
+        )
+
+        # Slow fallback sweep (valve/TRV values are otherwise pushed by events)
         self._remove_listeners.append(
-            async_track_time_interval(
-                self.hass, self._async_refresh_sensors, timedelta(seconds=15)
+            coordinator.async_track_time_interval(
+                self._async_safety_sweep, SAFETY_SWEEP_INTERVAL
             )
         )
 
-        # Initialize TRVs on startup
+        # Initialize TRVs on startup, staggered so rooms don't all send at once
         @callback
-        def _async_startup(_):
+        def _async_initialize(_):
             self.hass.async_create_task(self._async_initialize_trvs())
 
+        @callback
+        def _async_startup(_):
+            self._remove_listeners.append(
+                async_call_later(
+                    self.hass,
+                    self._scheduler.get_startup_delay(),
+                    HassJob(_async_initialize),
+                )
+            )
+
         self.hass.bus.async_listen_once(EVENT_HOMEASSISTANT_START, _async_startup)
 
-        # Schedule remote temperature sync if enabled
+        # Check the remote temperature keep-alive if sync is enabled
         if self._sync_remote_temp:
             self._remove_listeners.append(
-                async_track_time_interval(
-                    self.hass,
+                coordinator.async_track_time_interval(
                     self._async_sync_remote_temperature,
-                    REMOTE_TEMP_SYNC_INTERVAL,
+                    REMOTE_TEMP_CHECK_INTERVAL,
                 )
             )
 
         # Initial temperature read
         await self._async_update_temp()
 
+        self._control_actor.async_start()
+
     async def async_will_remove_from_hass(self):
         """Run when entity will be removed."""
+        await self._control_actor.async_stop()
+
         # Clean up PresetManager listeners
         await self._preset_manager.async_cleanup()
 
@@ -454,32 +722,207 @@ class SimpleThermostat(ClimateEntity, RestoreEntity):
 
     @property
     def extra_state_attributes(self):
-        """Return extra state attributes."""
+        """Return extra state attributes (rebuilt only after an input changed)."""
+        if self._attributes_cache is None or self._attributes_dirty:
+            self._attributes_cache = self._build_extra_state_attributes()
+        return {
+            **self._attributes_cache,
+            # Not part of the snapshot: house-wide values would make every room's
+            # snapshot differ on any rate-limited command, and every suppressed
+            # write would differ by its own counter
+            **self._scheduler.get_stats(),
+            "state_writes_suppressed": self._suppressed_writes,
+        }
+
+    @callback
+    def _invalidate_attributes(self):
+        """Mark the attribute snapshot dirty after one of its inputs changed."""
+        self._attributes_dirty = True
+
+    @callback
+    def _async_command_stats_changed(self):
+        """Publish confirmation/breaker stats that changed outside a command (timers)."""
+        self._invalidate_attributes()
+        self._async_write_state_if_changed()
+
+    def _build_extra_state_attributes(self):
+        """Build the attribute snapshot (copies, so later in-place changes are detected)."""
+        self._attributes_dirty = False
         override_status = self._preset_manager.get_override_status()
+        self._override_status = override_status
         return {
             "unique_id": self.unique_id,  # For card to find related sensors
             "control_mode": self.control_mode,
             "temperature_sensor": self._temp_sensor,  # For chart to find the room temp sensor
             "temperature_error": round(self._target_temp - self._cur_temp, 2) if self._cur_temp and self._target_temp else None,
-            "valve_positions": self._valve_positions,
-            "trv_internal_temps": self._trv_internal_temps,
-            "trv_target_temps": self._trv_target_temps,
+            "valve_positions": dict(self._valve_positions),
+            "trv_internal_temps": dict(self._trv_internal_temps),
+            "trv_target_temps": dict(self._trv_target_temps),
             "action_history": self._action_history[-10:],  # Last 10 actions for card
+            # Radio traffic saved by the command cache
+            **self._command_cache.get_stats(),
+            # Timeouts, retries and circuit breakers of unresponsive TRVs
+            **self._fanout.get_stats(),
+            **self._breakers.get_stats(),
+            # Command-to-report latency per TRV
+            **self._confirmations.get_stats(),
+            # Control mode flips (each one sends a full command set)
+            "mode_switches": self._mode_switches,
+            "mode_switches_held": self._mode_switches_held,
             # Preset temperatures for UI sliders
             "away_temp": self._away_temp,
             "present_temp": self._present_temp,
             "cosy_temp": self._cosy_temp,
-            # Override status for UI
-            "scheduled_preset": override_status["scheduled_preset"],
-            "manual_override": override_status["manual_override"],
-            "presence_override": override_status["presence_override"],
-            "window_open": override_status["window_open"],
-            "outdoor_temp_high": override_status["outdoor_temp_high"],
-            "global_away": override_status["global_away"],
+            # Override status (and next schedule transition) for UI
+            **override_status,
             # Schedule data for visualization
             "schedule": self._preset_manager._schedule_config if self._preset_manager._schedule_config else None,
         }
 
+    @callback
+    def _async_write_state_if_changed(self):
+        """Write state unless state and attributes match the last published write."""
+        # Overrides are not pushed for every change - compare the (small) status dict
+        if self._preset_manager.get_override_status() != self._override_status:
+            self._attributes_dirty = True
+        if self._attributes_cache is None or self._attributes_dirty:
+            self._attributes_cache = self._build_extra_state_attributes()
+        snapshot = (
+            self._hvac_mode,
+            self._preset_mode,
+            self._cur_temp,
+            self._target_temp,
+            self._attributes_cache,
+        )
+        if snapshot == self._last_written_state:
+            self._suppressed_writes += 1
+            return
+
+        self._last_written_state = snapshot
+        self.async_write_ha_state()
+
+        for listener in list(self._diagnostic_listeners):
+            listener()
+
+    @callback
+    def async_add_diagnostic_listener(self, update_callback):
+        """Register a diagnostic sensor callback for state writes; returns a remover."""
+        self._diagnostic_listeners.append(update_callback)
+
+        @callback
+        def _async_remove():
+            if update_callback in self._diagnostic_listeners:
+                self._diagnostic_listeners.remove(update_callback)
+
+        return _async_remove
+
+    def get_details(self):
+        """Return the bulky per-room data served to the card over the websocket API."""
+        return {
+            "action_history": self._action_history[-10:],
+            "schedule": self._preset_manager._schedule_config or None,
+            "valve_positions": self._valve_positions,
+            "trv_internal_temps": self._trv_internal_temps,
+            "trv_target_temps": self._trv_target_temps,
+            "trv_names": self._trv_names,
+        }
+
+    def get_metrics(self):
+        """Return control loop latencies and throughput for diagnostics."""
+        return {
+            **self._metrics.get_stats(),
+            # Sent/skipped are counted once, by the command cache
+            **self._command_cache.get_stats(),
+            "control_triggers": self._control_actor.trigger_count,
+            "control_cycles_overlapped": self._control_actor.overlap_count,
+            "mode_switches": self._mode_switches,
+            "mode_switches_held": self._mode_switches_held,
+        }
+
+    @property
+    def _storage_key(self):
+        """Return the key of this room in the state store."""
+        return self.unique_id or self.entity_id
+
+    def _get_persisted_state(self):
+        """Return a JSON-serializable snapshot of the controller state."""
+        return {
+            "hvac_mode": self._hvac_mode,
+            "preset_mode": self._preset_mode,
+            "target_temp": self._target_temp,
+            "configured_preset_temps": self._configured_preset_temps,
+            "preset_temps": [self._away_temp, self._present_temp, self._cosy_temp],
+            "preset_manager": self._preset_manager.get_persisted_state(),
+            # TRV values keyed by entity so a changed TRV list cannot misalign them
+            "valve_positions": dict(self._valve_positions),
+            "trv_internal_temps": {
+                self._climate_entities[idx]: temp
+                for idx, temp in self._trv_internal_temps.items()
+            },
+            "trv_target_temps": {
+                self._climate_entities[idx]: temp
+                for idx, temp in self._trv_target_temps.items()
+            },
+            "initialized_trvs": sorted(self._initialized_trvs),
+            # Last target sent to each TRV, to tell a TRV that was reset from one that wasn't
+            "trv_commanded_temps": {
+                climate_entity: commanded
+                for climate_entity in self._climate_entities
+                if (commanded := self._confirmations.get_commanded(climate_entity)) is not None
+            },
+            "action_history": list(self._action_history),
+        }
+
+    def _restore_persisted_state(self, data):
+        """Restore a snapshot from _get_persisted_state()."""
+        if data.get("hvac_mode") in (HVACMode.HEAT, HVACMode.OFF):
+            self._hvac_mode = data["hvac_mode"]
+
+        # Preset temperatures edited via set_preset_temperature; an edit is kept
+        # until the YAML value of that preset changes
+        configured = data.get("configured_preset_temps") or [None] * 3
+        preset_temps = [self._away_temp, self._present_temp, self._cosy_temp]
+        for idx, stored_temp in enumerate(data.get("preset_temps") or []):
+            if idx < 3 and configured[idx] == self._configured_preset_temps[idx]:
+                preset_temps[idx] = stored_temp
+        self._away_temp, self._present_temp, self._cosy_temp = preset_temps
+
+        self._preset_manager.restore_state(data.get("preset_manager", {}))
+
+        self._valve_positions.update(
+            {
+                valve_entity: position
+                for valve_entity, position in data.get("valve_positions", {}).items()
+                if valve_entity in self._valve_entities
+            }
+        )
+        for idx, climate_entity in enumerate(self._climate_entities):
+            if climate_entity in data.get("trv_internal_temps", {}):
+                self._trv_internal_temps[idx] = data["trv_internal_temps"][climate_entity]
+            if climate_entity in data.get("trv_target_temps", {}):
+                self._trv_target_temps[idx] = data["trv_target_temps"][climate_entity]
+
+        self._initialized_trvs = set(data.get("initialized_trvs", [])) & set(
+            self._climate_entities
+        )
+        self._confirmations.restore_commanded(
+            {
+                climate_entity: commanded
+                for climate_entity, commanded in data.get("trv_commanded_temps", {}).items()
+                if climate_entity in self._climate_entities
+            }
+        )
+        self._action_history = data.get("action_history", [])[-self._max_history:]
+        self._invalidate_attributes()
+
+        _LOGGER.info("%s: Restored controller state from storage", self.name)
+
+    @callback
+    def _async_schedule_save(self):
+        """Request a (batched) write of the persisted controller state."""
+        if self._state_store is not None:
+            self._state_store.async_schedule_save()
+
     def _log_action(self, message):
         """Log an action to history."""
         from datetime import datetime
@@ -495,6 +938,9 @@ class SimpleThermostat(ClimateEntity, RestoreEntity):
         # Keep only last N actions
         if len(self._action_history) > self._max_history:
             self._action_history = self._action_history[-self._max_history:]
+        self._invalidate_attributes()
+
+        self._async_schedule_save()
 
     async def async_set_hvac_mode(self, hvac_mode):
         """Set new HVAC mode."""
@@ -510,7 +956,7 @@ class SimpleThermostat(ClimateEntity, RestoreEntity):
                 self._preset_manager.set_manual_preset(PRESET_PRESENT)
 
             self._log_action(f"HVAC mode set to HEAT (target: {self._target_temp}°C)")
-            await self._async_control_heating()
+            await self._control_actor.async_refresh()
         elif hvac_mode == HVACMode.OFF:
             _LOGGER.info("%s: HVAC mode set to OFF - forcing valves to 0%% and setting preset to OFF", self.name)
             self._hvac_mode = HVACMode.OFF
@@ -523,10 +969,11 @@ class SimpleThermostat(ClimateEntity, RestoreEntity):
             self._preset_manager.set_manual_preset(PRESET_OFF)
 
             # Force all valves to 0%
-            await self._async_turn_off_all()
+            async with self._control_actor.lock:
+                await self._async_turn_off_all()
             self._log_action(f"HVAC mode set to OFF - heating disabled")
 
-        self.async_write_ha_state()
+        self._async_write_state_if_changed()
 
     async def async_set_temperature(self, **kwargs):
         """Set new target temperature."""
@@ -538,10 +985,7 @@ class SimpleThermostat(ClimateEntity, RestoreEntity):
         self._preset_mode = None  # Clear preset when manually setting temp
         self._log_action(f"Target temperature set to {temperature}°C (manual)")
 
-        if self._hvac_mode == HVACMode.HEAT:
-            await self._async_control_heating()
-
-        self.async_write_ha_state()
+        await self._control_actor.async_refresh()
 
     async def async_set_preset_mode(self, preset_mode):
         """Set new preset mode."""
@@ -563,7 +1007,8 @@ class SimpleThermostat(ClimateEntity, RestoreEntity):
             self._hvac_mode = HVACMode.OFF
             self._enabled = False
             self.control_mode = CONTROL_MODE_OFF
-            await self._async_turn_off_all()
+            async with self._control_actor.lock:
+                await self._async_turn_off_all()
             self._log_action(f"Preset OFF - heating disabled")
         else:
             # Preset AWAY/PRESENT/COSY → Ensure HVAC is HEAT
@@ -576,12 +1021,14 @@ class SimpleThermostat(ClimateEntity, RestoreEntity):
                 self._log_action(f"Preset changed to {preset_mode.upper()} ({self._target_temp}°C)")
 
             # Run control logic
-            await self._async_control_heating()
+            await self._control_actor.async_refresh()
 
-        self.async_write_ha_state()
+        self._async_write_state_if_changed()
 
     def _update_target_temp_from_preset(self):
         """Update target temperature based on current preset."""
+        # Preset temperatures may have changed too (set_preset_temperature)
+        self._invalidate_attributes()
         if self._preset_mode == PRESET_AWAY:
             self._target_temp = self._away_temp
         elif self._preset_mode == PRESET_PRESENT:
@@ -610,60 +1057,124 @@ class SimpleThermostat(ClimateEntity, RestoreEntity):
             (self._target_temp - self._cur_temp) if (self._target_temp and self._cur_temp) else 0
         )
 
+        self._async_write_state_if_changed()
+
+        # Send a significant change to the TRVs right away
+        if self._sync_remote_temp:
+            self.hass.async_create_task(self._async_sync_remote_temperature())
+
         if self._hvac_mode == HVACMode.HEAT:
-            await self._async_control_heating()
+            # Only events that queue a cycle are measured (event to command latency)
+            self._metrics.mark_event()
+            self._control_actor.request()
         else:
             _LOGGER.info("%s: Skipping control heating - HVAC mode is %s", self.name, self._hvac_mode)
 
-        self.async_write_ha_state()
-
     async def _async_trv_state_changed(self, event):
-        """Handle TRV state changes (to read internal temps)."""
+        """Handle TRV state changes (internal and target temps)."""
         new_state = event.data.get("new_state")
-        if new_state is None or new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        if new_state is None or new_state.entity_id not in self._climate_entities:
             return
 
-        entity_id = new_state.entity_id
-        if entity_id in self._climate_entities:
-            idx = self._climate_entities.index(entity_id)
-            internal_temp = new_state.attributes.get("current_temperature")
-            if internal_temp is not None:
-                self._trv_internal_temps[idx] = float(internal_temp)
+        idx = self._climate_entities.index(new_state.entity_id)
+        if self._update_trv_from_state(idx, new_state):
+            self._async_write_state_if_changed()
+            self._async_schedule_save()
 
-        self.async_write_ha_state()
+    async def _async_valve_state_changed(self, event):
+        """Handle valve position changes."""
+        new_state = event.data.get("new_state")
+        if new_state is None:
+            return
 
-    async def _async_refresh_sensors(self, _):
-        """Refresh all sensor readings every 15 seconds."""
-        await self._async_read_valve_positions()
-        await self._async_read_trv_temps()
+        if self._update_valve_from_state(event.data["entity_id"], new_state):
+            self._async_write_state_if_changed()
+            self._async_schedule_save()
+            await self._async_enforce_off_safety()
 
-        # Safety check: If HVAC is OFF but any valve is open, force them closed
-        if self._hvac_mode == HVACMode.OFF:
-            any_valve_open = any(pos > 0 for pos in self._valve_positions.values())
-            if any_valve_open:
-                _LOGGER.warning(
-                    "%s: SAFETY CHECK - HVAC is OFF but valves are open. Forcing to 0%%",
-                    self.name
-                )
-                await self._async_turn_off_all()
+    async def _async_safety_sweep(self, _):
+        """Re-read all valves and TRVs in case an event was missed."""
+        changed = await self._async_read_valve_positions()
+        changed |= await self._async_read_trv_temps()
 
-        self.async_write_ha_state()
+        if changed:
+            self._async_write_state_if_changed()
+            self._async_schedule_save()
+
+        await self._async_enforce_off_safety()
+
+    async def _async_enforce_off_safety(self):
+        """Safety check: If HVAC is OFF but any valve is open, force them closed."""
+        if self._hvac_mode != HVACMode.OFF:
+            return
+
+        if any(pos > 0 for pos in self._valve_positions.values()):
+            _LOGGER.warning(
+                "%s: SAFETY CHECK - HVAC is OFF but valves are open. Forcing to 0%%",
+                self.name
+            )
+            async with self._control_actor.lock:
+                await self._async_turn_off_all()
 
     async def _async_read_trv_temps(self):
-        """Read TRV internal and target temperatures."""
+        """Read TRV internal and target temperatures. Returns True if any changed."""
+        changed = False
         for idx, climate_entity in enumerate(self._climate_entities):
             climate_state = self.hass.states.get(climate_entity)
-            if climate_state and climate_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
-                internal_temp = climate_state.attributes.get("current_temperature")
-                target_temp = climate_state.attributes.get("temperature")
+            if climate_state is not None:
+                changed |= self._update_trv_from_state(idx, climate_state)
+        return changed
+
+    def _update_trv_from_state(self, idx, climate_state):
+        """Store TRV internal/target temps from a state. Returns True if changed."""
+        if climate_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            return False
+
+        changed = False
+        internal_temp = climate_state.attributes.get("current_temperature")
+        target_temp = climate_state.attributes.get("temperature")
+
+        if internal_temp is not None and self._trv_internal_temps.get(idx) != float(internal_temp):
+            self._trv_internal_temps[idx] = float(internal_temp)
+            changed = True
+        if target_temp is not None:
+            if self._confirmations.report(self._climate_entities[idx], float(target_temp)):
+                self._invalidate_attributes()
+            if self._trv_target_temps.get(idx) != float(target_temp):
+                self._trv_target_temps[idx] = float(target_temp)
+                changed = True
+        if changed:
+            self._invalidate_attributes()
+        return changed
+
+    def _update_valve_from_state(self, valve_entity, valve_state):
+        """Store a valve position from a state. Returns True if changed."""
+        if valve_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            return False
 
-                if internal_temp is not None:
-                    self._trv_internal_temps[idx] = float(internal_temp)
-                if target_temp is not None:
-                    self._trv_target_temps[idx] = float(target_temp)
+        try:
+            position = float(valve_state.state)
+        except ValueError:
+            return False
+
+        if self._confirmations.report(valve_entity, position):
+            self._invalidate_attributes()
+        if self._valve_positions.get(valve_entity) == position:
+            return False
+
+        self._valve_positions[valve_entity] = position
+        self._invalidate_attributes()
+        _LOGGER.debug(
+            "%s: Valve position of %s = %s%%",
+            self.name,
+            valve_entity,
+            valve_state.state
+        )
+        return True
 
-    async def _async_update_preset(self, _):
-        """Update preset from PresetManager."""
+    @callback
+    def _async_active_preset_changed(self):
+        """Apply a preset change from PresetManager (schedule or override sensor)."""
         new_preset = self._preset_manager.get_active_preset()
 
         if new_preset != self._preset_mode:
@@ -677,66 +1188,58 @@ class SimpleThermostat(ClimateEntity, RestoreEntity):
             self._update_target_temp_from_preset()
             self._log_action(f"Preset auto-changed to {new_preset.upper()} ({self._target_temp}°C)")
 
-            if self._hvac_mode == HVACMode.HEAT:
-                await self._async_control_heating()
-
-            self.async_write_ha_state()
+            # Skip the debounce window - e.g. an open window must close valves now
+            self._async_write_state_if_changed()
+            self._control_actor.request(immediate=True)
 
     async def _async_update_temp(self):
         """Update current temperature from sensor."""
         sensor_state = self.hass.states.get(self._temp_sensor)
         if sensor_state and sensor_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
             try:
-                self._cur_temp = float(sensor_state.state)
+                cur_temp = float(sensor_state.state)
             except ValueError:
                 _LOGGER.warning("Unable to parse temperature: %s", sensor_state.state)
+                return
+            if cur_temp != self._cur_temp:
+                self._cur_temp = cur_temp
+                # temperature_error
+                self._invalidate_attributes()
 
     async def _async_initialize_trvs(self):
         """Initialize TRVs: set to 30°C and manual mode."""
         _LOGGER.info("%s: Initializing TRVs", self.name)
 
-        for climate_entity in self._climate_entities:
-            # Set target temperature to 30°C (max)
-            try:
-                await self.hass.services.async_call(
-                    "climate",
-                    "set_temperature",
-                    {ATTR_ENTITY_ID: climate_entity, ATTR_TEMPERATURE: 30},
-                    blocking=True,
-                )
-                _LOGGER.info("%s: Set %s to 30°C", self.name, climate_entity)
-            except Exception as err:
-                _LOGGER.error(
-                    "%s: Failed to set temperature for %s: %s",
+        manual_mode_trvs = []
+        for idx, climate_entity in enumerate(self._climate_entities):
+            if self._is_trv_initialized(climate_entity):
+                _LOGGER.info(
+                    "%s: %s already initialized (restored state matches), skipping",
                     self.name,
                     climate_entity,
-                    err,
-                )
-
-            # Set operating mode to manual (Bosch-specific)
-            try:
-                # Extract friendly name from entity_id for MQTT topic
-                # This assumes Zigbee2MQTT naming convention
-                friendly_name = climate_entity.replace("climate.", "").replace("_", " ")
-                await self.hass.services.async_call(
-                    "mqtt",
-                    "publish",
-                    {
-                        "topic": f"zigbee2mqtt/{friendly_name}/set",
-                        "payload": '{"operating_mode": "manual"}',
-                    },
-                    blocking=False,
                 )
+                continue
+            manual_mode_trvs.append((climate_entity, self._get_trv_profile(idx)))
+
+        # Set target temperatures to the device maximum (30°C) in one fan-out
+        results = await self._fanout.async_send(
+            "climate",
+            "set_temperature",
+            ATTR_TEMPERATURE,
+            {climate_entity: profile.max_temp for climate_entity, profile in manual_mode_trvs},
+            PRIORITY_INIT,
+        )
+        for climate_entity, profile in manual_mode_trvs:
+            if results.get(climate_entity):
                 _LOGGER.info(
-                    "%s: Set %s to manual mode", self.name, climate_entity
-                )
-            except Exception as err:
-                _LOGGER.warning(
-                    "%s: Could not set manual mode for %s (may not be supported): %s",
-                    self.name,
-                    climate_entity,
-                    err,
+                    "%s: Set %s to %s°C", self.name, climate_entity, profile.max_temp
                 )
+                self._confirmations.expect(climate_entity, profile.max_temp)
+                # Retried on the next start if the TRV did not take the command
+                self._initialized_trvs.add(climate_entity)
+
+        # Set operating mode to manual (one group message where the transport supports it)
+        await self._transport.async_set_manual_mode(manual_mode_trvs)
 
         # Read initial TRV temperatures
         for idx, climate_entity in enumerate(self._climate_entities):
@@ -746,6 +1249,38 @@ class SimpleThermostat(ClimateEntity, RestoreEntity):
                 if internal_temp is not None:
                     self._trv_internal_temps[idx] = float(internal_temp)
 
+        self._async_schedule_save()
+
+    def _get_trv_profile(self, idx):
+        """Return the device profile of a TRV by index."""
+        if idx < len(self._trv_profiles):
+            return self._trv_profiles[idx]
+        return get_profile(DEFAULT_PROFILE)
+
+    def _is_trv_initialized(self, climate_entity):
+        """Return True if a TRV was initialized before and still has the last commanded target."""
+        if climate_entity not in self._initialized_trvs:
+            return False
+
+        # Not trv_target_temps: state events overwrite it with whatever the TRV reports
+        live_target = self._get_live_trv_target(climate_entity)
+        commanded_target = self._confirmations.get_commanded(climate_entity)
+        if live_target is None or commanded_target is None:
+            return False
+
+        # A TRV that rejoined or was reset reports a different target
+        return abs(live_target - commanded_target) < VALUE_TOLERANCE
+
+    async def _async_control_cycle(self):
+        """Run one control evaluation (via the control actor) and publish state."""
+        started_at = self._metrics.start_cycle()
+        if self._hvac_mode == HVACMode.HEAT:
+            await self._async_control_heating()
+        self._metrics.finish_cycle(started_at)
+
+        self._async_write_state_if_changed()
+        self._async_schedule_save()
+
     async def _async_control_heating(self):
         """Main control logic: hybrid binary + proportional control."""
         _LOGGER.info(
@@ -769,12 +1304,16 @@ class SimpleThermostat(ClimateEntity, RestoreEntity):
             self._binary_threshold
         )
 
-        # Determine control mode based on error
-        if error > self._binary_threshold:
+        # Determine control mode based on error (with hysteresis and dwell time)
+        previous_mode = self.control_mode
+        control_mode = self._select_control_mode(error)
+
+        mode_started_at = monotonic()
+        if control_mode == CONTROL_MODE_BINARY_HEAT:
             # Too cold - binary heating mode
             _LOGGER.info("%s: Error > threshold → binary heat mode", self.name)
             await self._async_set_binary_heat_mode()
-        elif error < -self._binary_threshold:
+        elif control_mode == CONTROL_MODE_BINARY_COOL:
             # Too hot - binary cooling mode (turn off)
             _LOGGER.info("%s: Error < -threshold → binary cool mode (turn off)", self.name)
             await self._async_set_binary_cool_mode()
@@ -782,6 +1321,14 @@ class SimpleThermostat(ClimateEntity, RestoreEntity):
             # Near target - proportional control mode
             _LOGGER.info("%s: Error within threshold → proportional mode", self.name)
             await self._async_set_proportional_mode()
+        self._metrics.observe_mode(control_mode, monotonic() - mode_started_at)
+        # Control mode and mode switch counters
+        self._invalidate_attributes()
+
+        if self.control_mode != previous_mode:
+            self._mode_entered_at = dt_util.utcnow()
+            if previous_mode in ACTIVE_CONTROL_MODES:
+                self._mode_switches += 1
 
         # Log mode changes
         if self.control_mode != self._last_control_mode:
@@ -797,41 +1344,91 @@ class SimpleThermostat(ClimateEntity, RestoreEntity):
             )
             self._last_control_mode = self.control_mode
 
+    def _select_control_mode(self, error):
+        """Return the control mode for a temperature error.
+
+        Binary modes are entered beyond ±binary_threshold but only left once the
+        error is back inside the threshold by ``hysteresis``. With a minimum
+        dwell time, a mode is also kept until it has been active that long.
+        """
+        current = self.control_mode
+
+        if error > self._binary_threshold:
+            wanted = CONTROL_MODE_BINARY_HEAT
+        elif error < -self._binary_threshold:
+            wanted = CONTROL_MODE_BINARY_COOL
+        else:
+            wanted = CONTROL_MODE_PROPORTIONAL
+
+        if current not in ACTIVE_CONTROL_MODES or wanted == current:
+            self._held_mode = None
+            return wanted
+
+        release = max(0.0, self._binary_threshold - self._hysteresis)
+        held = (
+            (current == CONTROL_MODE_BINARY_HEAT and error > release)
+            or (current == CONTROL_MODE_BINARY_COOL and error < -release)
+        )
+        if not held and self._min_mode_dwell and self._mode_entered_at is not None:
+            held = dt_util.utcnow() - self._mode_entered_at < self._min_mode_dwell
+
+        if held:
+            _LOGGER.debug(
+                "%s: Keeping %s (error: %.2f°C, wanted %s)", self.name, current, error, wanted
+            )
+            # One prevented switch, however many cycles it stays held
+            if wanted != self._held_mode:
+                self._mode_switches_held += 1
+                self._held_mode = wanted
+            return current
+
+        self._held_mode = None
+        return wanted
+
     async def _async_set_binary_heat_mode(self):
-        """Binary heating: valve 100%, temp 30°C."""
+        """Binary heating: valve 100%, temp at device maximum (30°C)."""
         self.control_mode = CONTROL_MODE_BINARY_HEAT
 
-        # Set all valves to 100%
-        for valve_entity in self._valve_entities:
-            await self._async_set_valve_position(valve_entity, 100)
-
-        # Set all TRVs to max temperature (30°C)
-        for idx, climate_entity in enumerate(self._climate_entities):
-            await self._async_set_trv_temperature(climate_entity, idx, 30)
+        # Set all valves to 100% and all TRVs to max temperature (30°C)
+        await asyncio.gather(
+            self._async_set_valve_positions(
+                {valve_entity: 100 for valve_entity in self._valve_entities}
+            ),
+            self._async_set_trv_temperatures(
+                {
+                    idx: self._get_trv_profile(idx).max_temp
+                    for idx in range(len(self._climate_entities))
+                }
+            ),
+        )
 
-        # Read back actual valve positions for monitoring
-        await self._async_read_valve_positions()
+        # Valve positions are updated when the devices report them
 
     async def _async_set_binary_cool_mode(self):
-        """Binary cooling: valve 0%, temp 5°C."""
+        """Binary cooling: valve 0%, temp at device minimum (5°C)."""
         self.control_mode = CONTROL_MODE_BINARY_COOL
 
-        # Set all valves to 0%
-        for valve_entity in self._valve_entities:
-            await self._async_set_valve_position(valve_entity, 0)
-
-        # Set all TRVs to min temperature (5°C)
-        for idx, climate_entity in enumerate(self._climate_entities):
-            await self._async_set_trv_temperature(climate_entity, idx, 5)
+        # Set all valves to 0% and all TRVs to min temperature (5°C)
+        await asyncio.gather(
+            self._async_set_valve_positions(
+                {valve_entity: 0 for valve_entity in self._valve_entities}
+            ),
+            self._async_set_trv_temperatures(
+                {
+                    idx: self._get_trv_profile(idx).min_temp
+                    for idx in range(len(self._climate_entities))
+                }
+            ),
+        )
 
-        # Read back actual valve positions for monitoring
-        await self._async_read_valve_positions()
+        # Valve positions are updated when the devices report them
 
     async def _async_set_proportional_mode(self):
         """Proportional control: calculate TRV target from external sensor."""
         self.control_mode = CONTROL_MODE_PROPORTIONAL
 
         # For each TRV, calculate target temperature
+        targets = {}
         for idx, climate_entity in enumerate(self._climate_entities):
             trv_internal_temp = self._trv_internal_temps.get(idx)
 
@@ -848,122 +1445,169 @@ class SimpleThermostat(ClimateEntity, RestoreEntity):
                 self._target_temp - self._cur_temp
             ) + trv_internal_temp
 
-            # Clamp to valid range (5-30°C)
-            calculated_target = max(5.0, min(30.0, calculated_target))
+            # Clamped and rounded to the device step when sent
+            targets[idx] = calculated_target
 
-            await self._async_set_trv_temperature(
-                climate_entity, idx, calculated_target
-            )
+        await self._async_set_trv_temperatures(targets)
 
         # In proportional mode, we don't directly control valve position
-        # The TRV controls it based on the target temperature we set
-        # But we should read back the valve positions for status
-        await self._async_read_valve_positions()
+        # The TRV controls it based on the target temperature we set;
+        # its reports arrive as state change events
 
     async def _async_read_valve_positions(self):
-        """Read current valve positions from all valve entities."""
+        """Read current valve positions from all valve entities. Returns True if any changed."""
+        changed = False
         for valve_entity in self._valve_entities:
             valve_state = self.hass.states.get(valve_entity)
-            if valve_state and valve_state.state not in (
-                STATE_UNAVAILABLE,
-                STATE_UNKNOWN,
-            ):
-                try:
-                    self._valve_positions[valve_entity] = float(valve_state.state)
-                    _LOGGER.info(
-                        "%s: Read valve position from %s = %s%%",
-                        self.name,
-                        valve_entity,
-                        valve_state.state
-                    )
-                except ValueError:
-                    pass
+            if valve_state is not None:
+                changed |= self._update_valve_from_state(valve_entity, valve_state)
+        return changed
 
     async def _async_turn_off_all(self):
         """Turn off all heating."""
-        # Set all valves to 0%
-        for valve_entity in self._valve_entities:
-            await self._async_set_valve_position(valve_entity, 0)
-
-        # Set all TRVs to min temperature
-        for idx, climate_entity in enumerate(self._climate_entities):
-            await self._async_set_trv_temperature(climate_entity, idx, 5)
+        # Set all valves to 0% and all TRVs to min temperature (ahead of queued traffic)
+        await asyncio.gather(
+            self._async_set_valve_positions(
+                {valve_entity: 0 for valve_entity in self._valve_entities},
+                PRIORITY_SAFETY,
+            ),
+            self._async_set_trv_temperatures(
+                {
+                    idx: self._get_trv_profile(idx).min_temp
+                    for idx in range(len(self._climate_entities))
+                },
+                PRIORITY_SAFETY,
+            ),
+        )
 
-    async def _async_set_valve_position(self, valve_entity, position):
-        """Set valve position (0-100)."""
-        try:
-            await self.hass.services.async_call(
-                "number",
-                "set_value",
-                {ATTR_ENTITY_ID: valve_entity, "value": position},
-                blocking=True,
-            )
-            self._valve_positions[valve_entity] = position
-            _LOGGER.debug(
-                "%s: Set valve %s to %d%%", self.name, valve_entity, position
-            )
-        except Exception as err:
-            _LOGGER.error(
-                "%s: Failed to set valve %s to %d%%: %s",
-                self.name,
-                valve_entity,
-                position,
-                err,
-            )
+    async def _async_set_valve_positions(self, positions, priority=PRIORITY_CONTROL):
+        """Set several valve positions (entity_id -> 0-100) in one fan-out."""
+        positions = self._command_cache.filter(
+            positions,
+            {entity: self._get_live_valve_position(entity) for entity in positions},
+        )
+        # Sent/skipped counters changed
+        self._invalidate_attributes()
+        if not positions:
+            return
 
-    async def _async_set_trv_temperature(self, climate_entity, trv_index, temperature):
-        """Set TRV target temperature."""
-        try:
-            await self.hass.services.async_call(
-                "climate",
-                "set_temperature",
-                {ATTR_ENTITY_ID: climate_entity, ATTR_TEMPERATURE: temperature},
-                blocking=True,
-            )
-            self._trv_target_temps[trv_index] = temperature
-            _LOGGER.debug(
-                "%s: Set TRV %s to %.1f°C",
-                self.name,
-                climate_entity,
-                temperature,
-            )
-        except Exception as err:
-            _LOGGER.error(
-                "%s: Failed to set TRV %s to %.1f°C: %s",
-                self.name,
-                climate_entity,
-                temperature,
-                err,
-            )
+        results = await self._fanout.async_send(
+            "number", "set_value", "value", positions, priority
+        )
+        self._record_command_results(results)
+        for valve_entity, success in results.items():
+            if success:
+                self._command_cache.record_sent(valve_entity, positions[valve_entity])
+                # valve_positions only changes once the device reports the value
+                self._confirmations.expect(valve_entity, positions[valve_entity])
+                _LOGGER.debug(
+                    "%s: Set valve %s to %d%%",
+                    self.name,
+                    valve_entity,
+                    positions[valve_entity],
+                )
 
-    async def _async_sync_remote_temperature(self, now=None):
-        """Send external temperature to TRVs via MQTT."""
-        if self._cur_temp is None:
+    async def _async_set_trv_temperatures(self, temperatures, priority=PRIORITY_CONTROL):
+        """Set several TRV target temperatures (trv_index -> °C) in one fan-out."""
+        # Send what the device can represent; a change it would round away is a no-op
+        temperatures = {
+            idx: self._get_trv_profile(idx).quantize(temperature)
+            for idx, temperature in temperatures.items()
+        }
+        targets = self._command_cache.filter(
+            {
+                self._climate_entities[idx]: temperature
+                for idx, temperature in temperatures.items()
+            },
+            {
+                self._climate_entities[idx]: self._get_live_trv_target(
+                    self._climate_entities[idx]
+                )
+                for idx in temperatures
+            },
+        )
+        # Sent/skipped counters changed
+        self._invalidate_attributes()
+        if not targets:
             return
 
-        for climate_entity in self._climate_entities:
-            try:
-                # Extract friendly name from entity_id
-                friendly_name = climate_entity.replace("climate.", "").replace("_", " ")
-                await self.hass.services.async_call(
-                    "mqtt",
-                    "publish",
-                    {
-                        "topic": f"zigbee2mqtt/{friendly_name}/set",
-                        "payload": f'{{"remote_temperature": {self._cur_temp}}}',
-                    },
-                    blocking=False,
-                )
+        results = await self._fanout.async_send(
+            "climate", "set_temperature", ATTR_TEMPERATURE, targets, priority
+        )
+        self._record_command_results(results)
+        for idx, temperature in temperatures.items():
+            climate_entity = self._climate_entities[idx]
+            if results.get(climate_entity):
+                self._command_cache.record_sent(climate_entity, temperature)
+                # trv_target_temps only changes once the device reports the value
+                self._confirmations.expect(climate_entity, temperature)
                 _LOGGER.debug(
-                    "%s: Synced remote temperature %.1f°C to %s",
+                    "%s: Set TRV %s to %.1f°C",
                     self.name,
-                    self._cur_temp,
                     climate_entity,
+                    temperature,
                 )
-            except Exception as err:
-                _LOGGER.warning(
-                    "%s: Failed to sync remote temperature to %s: %s",
-                    self.name,
-                    climate_entity,
-                    err,
-                )
\ No newline at end of file
+
+    def _record_command_results(self, results):
+        """Count sent and failed (incl. breaker-skipped) commands of a fan-out."""
+        # Retry, timeout and breaker stats changed while sending
+        self._invalidate_attributes()
+        sent = sum(1 for success in results.values() if success)
+        self._metrics.record_commands(sent=sent, failed=len(results) - sent)
+
+    def _get_live_valve_position(self, valve_entity):
+        """Return the valve position currently reported to HA, if known."""
+        valve_state = self.hass.states.get(valve_entity)
+        if valve_state is None or valve_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            return None
+        try:
+            return float(valve_state.state)
+        except ValueError:
+            return None
+
+    def _get_live_trv_target(self, climate_entity):
+        """Return the TRV target temperature currently reported to HA, if known."""
+        climate_state = self.hass.states.get(climate_entity)
+        if climate_state is None or climate_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            return None
+        target_temp = climate_state.attributes.get("temperature")
+        return float(target_temp) if target_temp is not None else None
+
+    def _get_remote_temp_trvs(self):
+        """Return (climate entity, profile) of the TRVs that accept a remote temperature."""
+        return [
+            (climate_entity, profile)
+            for idx, climate_entity in enumerate(self._climate_entities)
+            if (profile := self._get_trv_profile(idx)).supports_remote_temperature
+        ]
+
+    def _is_remote_temp_sync_due(self, trvs):
+        """Return True if the room temperature moved by the delta or the last value is getting old."""
+        if self._remote_temp_sent is None:
+            return True
+        if abs(self._cur_temp - self._remote_temp_sent) >= self._remote_temp_delta:
+            return True
+
+        # Keep-alive before the shortest device timeout expires
+        max_age = min(
+            [self._remote_temp_max_age]
+            + [
+                profile.remote_temperature_timeout - REMOTE_TEMP_TIMEOUT_MARGIN
+                for _, profile in trvs
+                if profile.remote_temperature_timeout
+            ]
+        )
+        return dt_util.utcnow() - self._remote_temp_sent_at >= max_age
+
+    async def _async_sync_remote_temperature(self, now=None):
+        """Send external temperature to the TRVs when it changed or must be refreshed."""
+        trvs = self._get_remote_temp_trvs()
+        if self._cur_temp is None or not trvs or not self._is_remote_temp_sync_due(trvs):
+            return
+
+        # Record before sending so overlapping triggers don't send twice
+        self._remote_temp_sent = self._cur_temp
+        self._remote_temp_sent_at = dt_util.utcnow()
+
+        await self._transport.async_send_remote_temperature(trvs, self._cur_temp)
+        _LOGGER.debug("%s: Synced remote temperature %.1f°C", self.name, self._cur_temp)
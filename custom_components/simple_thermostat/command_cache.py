@@ -0,0 +1,106 @@
+"""Command Cache - Skips TRV commands that would not change anything."""
+from datetime import timedelta
+import logging
+from time import monotonic
+from typing import Optional
+
+from .confirmation import ConfirmationTracker
+from .profiles import VALUE_TOLERANCE
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_REASSERT_INTERVAL = timedelta(minutes=30)
+
+
+def _values_match(first, second) -> bool:
+    """Return True if two commanded/reported values are effectively equal."""
+    if first is None or second is None:
+        return False
+    return abs(float(first) - float(second)) < VALUE_TOLERANCE
+
+
+class CommandCache:
+    """Per-device "last commanded / last confirmed" cache.
+
+    A command is skipped when the device was already sent the same value
+    within ``reassert_interval`` and its live Home Assistant state does not
+    contradict it. Drift (live state differs) and expired entries are always
+    re-sent. With ``confirmations``, a live state that still shows the old
+    value is not drift while the device has yet to report the command (sleepy
+    TRVs would otherwise get the same frame every cycle until they report).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        reassert_interval: timedelta = DEFAULT_REASSERT_INTERVAL,
+        confirmations: Optional[ConfirmationTracker] = None,
+    ):
+        """Initialize CommandCache."""
+        self.name = name
+        self._reassert_seconds = reassert_interval.total_seconds()
+        self._confirmations = confirmations
+
+        # entity_id -> {"commanded": value, "sent_at": monotonic, "confirmed": value}
+        self._entries: dict[str, dict] = {}
+
+        self.sent_count = 0
+        self.skipped_count = 0
+
+    def filter(self, targets: dict, live_values: dict) -> dict:
+        """Return the subset of ``targets`` (entity_id -> value) that must be sent."""
+        now = monotonic()
+        pending = {}
+
+        for entity_id, value in targets.items():
+            entry = self._entries.get(entity_id)
+            live_value = live_values.get(entity_id)
+
+            if entry is not None and _values_match(live_value, entry["commanded"]):
+                entry["confirmed"] = live_value
+
+            if self._is_redundant(entity_id, entry, value, live_value, now):
+                self.skipped_count += 1
+                continue
+
+            if live_value is not None and entry is not None and not _values_match(
+                live_value, value
+            ):
+                _LOGGER.debug(
+                    "%s: %s drifted to %s (wanted %s), re-sending",
+                    self.name,
+                    entity_id,
+                    live_value,
+                    value,
+                )
+            pending[entity_id] = value
+
+        return pending
+
+    def record_sent(self, entity_id: str, value):
+        """Record a successfully sent command."""
+        entry = self._entries.setdefault(entity_id, {"confirmed": None})
+        entry["commanded"] = value
+        entry["sent_at"] = monotonic()
+        self.sent_count += 1
+
+    def get_stats(self) -> dict:
+        """Get sent/skipped counters for UI display."""
+        return {
+            "commands_sent": self.sent_count,
+            "commands_skipped": self.skipped_count,
+        }
+
+    def _is_redundant(
+        self, entity_id: str, entry: Optional[dict], value, live_value, now: float
+    ) -> bool:
+        """Return True if sending ``value`` again would be pure waste."""
+        if entry is None or not _values_match(entry["commanded"], value):
+            return False
+        if now - entry["sent_at"] >= self._reassert_seconds:
+            return False
+        # Sent, but the device has not reported it yet → the old live value is no drift
+        if self._confirmations is not None and self._confirmations.is_pending(entity_id):
+            return True
+        # Live state unknown (e.g. device unavailable) → trust the cache
+        return live_value is None or _values_match(live_value, value)
@@ -0,0 +1,119 @@
+"""Confirmation Tracker - Matches sent TRV commands with the values the devices report."""
+import asyncio
+import logging
+from time import monotonic
+from typing import Callable, Optional
+
+from homeassistant.core import callback
+
+from .profiles import VALUE_TOLERANCE
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds a device gets to report a commanded value
+DEFAULT_CONFIRM_TIMEOUT = 30
+
+
+class ConfirmationTracker:
+    """Per-device "commanded" versus "reported" values.
+
+    expect() is called after a command was accepted by Home Assistant. The
+    command stays pending until a state change reports the commanded value,
+    ``timeout`` expires or a newer command replaces it. The command cache
+    does not re-send pending commands, and the time from command to
+    confirmation is kept per device as a latency metric. ``update_callback``
+    is called when a command expires unconfirmed.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        timeout: float = DEFAULT_CONFIRM_TIMEOUT,
+        update_callback: Optional[Callable[[], None]] = None,
+    ):
+        """Initialize ConfirmationTracker."""
+        self.name = name
+        self._timeout = timeout
+        self._update_callback = update_callback
+
+        # entity_id -> {"commanded", "sent_at", "deadline"}
+        self._pending: dict[str, dict] = {}
+        self._commanded: dict[str, float] = {}
+        self._latency_ms: dict[str, int] = {}
+
+        # Statistics
+        self.confirmed_count = 0
+        self.unconfirmed_count = 0
+
+    @callback
+    def expect(self, entity_id: str, value):
+        """Record a sent command that the device should report within the timeout."""
+        self._resolve(entity_id)
+
+        self._commanded[entity_id] = value
+        self._pending[entity_id] = {
+            "commanded": value,
+            "sent_at": monotonic(),
+            "deadline": asyncio.get_running_loop().call_later(
+                self._timeout, self._async_expire, entity_id
+            ),
+        }
+
+    @callback
+    def report(self, entity_id: str, value) -> bool:
+        """Record a value reported by the device; returns True if it confirmed a command."""
+        pending = self._pending.get(entity_id)
+        if pending is None or abs(float(value) - float(pending["commanded"])) >= VALUE_TOLERANCE:
+            return False
+
+        self._latency_ms[entity_id] = round((monotonic() - pending["sent_at"]) * 1000)
+        self.confirmed_count += 1
+        self._resolve(entity_id)
+        return True
+
+    def get_commanded(self, entity_id: str) -> Optional[float]:
+        """Return the last value sent to a device."""
+        return self._commanded.get(entity_id)
+
+    @callback
+    def restore_commanded(self, commanded: dict):
+        """Restore the last values sent to devices (entity_id -> value), e.g. after a restart."""
+        self._commanded.update(commanded)
+
+    def is_pending(self, entity_id: str) -> bool:
+        """Return True if a command to the device awaits confirmation."""
+        return entity_id in self._pending
+
+    def get_stats(self) -> dict:
+        """Return confirmation counters and the per-device latency."""
+        return {
+            "commands_confirmed": self.confirmed_count,
+            "commands_unconfirmed": self.unconfirmed_count,
+            "trv_confirm_latency_ms": dict(self._latency_ms),
+        }
+
+    @callback
+    def _async_expire(self, entity_id: str):
+        """Give up on a command the device did not confirm in time."""
+        pending = self._pending.get(entity_id)
+        if pending is None:
+            return
+
+        _LOGGER.debug(
+            "%s: %s did not report %s within %s s",
+            self.name,
+            entity_id,
+            pending["commanded"],
+            self._timeout,
+        )
+        self.unconfirmed_count += 1
+        self._resolve(entity_id)
+        if self._update_callback is not None:
+            self._update_callback()
+
+    @callback
+    def _resolve(self, entity_id: str):
+        """Finish the pending command of a device, if any."""
+        pending = self._pending.pop(entity_id, None)
+        if pending is not None:
+            pending["deadline"].cancel()
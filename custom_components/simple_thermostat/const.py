@@ -0,0 +1,3 @@
+"""Constants for Simple Thermostat."""
+
+DOMAIN = "simple_thermostat"
@@ -0,0 +1,139 @@
+"""Control Actor - Serializes and coalesces control evaluations for one thermostat."""
+import asyncio
+from datetime import timedelta
+import logging
+from typing import Awaitable, Callable, Optional
+
+from homeassistant.core import HomeAssistant, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_DEBOUNCE = timedelta(seconds=2)
+
+
+class ControlActor:
+    """Single worker that runs the control action for a thermostat.
+
+    Triggers only mark the actor as pending (latest wins - the action always
+    reads the current thermostat state), so a burst of triggers inside the
+    debounce window collapses into one evaluation. The action never runs
+    concurrently with itself or with other work holding ``lock``.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        action: Callable[[], Awaitable[None]],
+        debounce: timedelta = DEFAULT_DEBOUNCE,
+    ):
+        """Initialize ControlActor."""
+        self.hass = hass
+        self.name = name
+        self._action = action
+        self._debounce = debounce.total_seconds()
+
+        self.lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._pending = False
+        self._immediate = False
+        self._waiters: list[asyncio.Future] = []
+        self._task: Optional[asyncio.Task] = None
+
+        self._running = False
+
+        # Statistics
+        self.trigger_count = 0
+        self.run_count = 0
+        self.overlap_count = 0  # triggers that arrived while the action was running
+
+    @callback
+    def async_start(self):
+        """Start the worker task."""
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._async_worker(), f"{self.name} control actor"
+            )
+
+    async def async_stop(self):
+        """Stop the worker task and release anyone waiting on it."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.cancel()
+        self._waiters.clear()
+
+    @callback
+    def request(self, immediate: bool = False):
+        """Queue an evaluation; ``immediate`` skips the debounce window."""
+        self.trigger_count += 1
+        if self._running:
+            self.overlap_count += 1
+        self._pending = True
+        if immediate:
+            self._immediate = True
+        self._wakeup.set()
+
+    async def async_refresh(self):
+        """Queue an immediate evaluation and wait until it has run."""
+        if self._task is None:
+            # Worker not running (entity not added yet) - run inline, still serialized
+            self.trigger_count += 1
+            await self._async_run()
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.request(immediate=True)
+        await waiter
+
+    async def _async_worker(self):
+        """Wait for triggers, debounce them and run the action."""
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+            # Coalesce further triggers until the window closes
+            deadline = loop.time() + self._debounce
+            while not self._immediate:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                self._wakeup.clear()
+
+            if not self._pending:
+                continue
+
+            waiters, self._waiters = self._waiters, []
+            try:
+                await self._async_run()
+            finally:
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(None)
+
+    async def _async_run(self):
+        """Run the action once, holding the lock."""
+        async with self.lock:
+            self._pending = False
+            self._immediate = False
+            self.run_count += 1
+            self._running = True
+            try:
+                await self._action()
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("%s: Control evaluation failed", self.name)
+            finally:
+                self._running = False
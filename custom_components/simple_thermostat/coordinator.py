@@ -0,0 +1,185 @@
+"""Coordinator - House-wide shared timers, sensor subscriptions and thermostat index."""
+from datetime import timedelta
+import logging
+from typing import Any, Callable, Optional
+
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_time_interval,
+)
+
+from .const import DOMAIN
+from .metrics import merge_stats
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_COORDINATOR = "coordinator"
+
+
+@callback
+def async_get_coordinator(hass: HomeAssistant) -> "SimpleThermostatCoordinator":
+    """Return the domain-wide coordinator, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    coordinator = domain_data.get(DATA_COORDINATOR)
+    if coordinator is None:
+        coordinator = SimpleThermostatCoordinator(hass)
+        domain_data[DATA_COORDINATOR] = coordinator
+    return coordinator
+
+
+class SimpleThermostatCoordinator:
+    """Owns one timer per interval and one state subscription per entity.
+
+    Rooms register callbacks here instead of creating their own timers and
+    listeners, so the number of HA timers/listeners stays constant when rooms
+    share an interval or a sensor (e.g. global_away_sensor). Events are fanned
+    out to every registered callback.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize the coordinator."""
+        self.hass = hass
+
+        # interval -> registered jobs / HA unsubscribe callback
+        self._interval_jobs: dict[timedelta, list[HassJob]] = {}
+        self._interval_unsubs: dict[timedelta, CALLBACK_TYPE] = {}
+
+        # entity_id -> registered jobs / HA unsubscribe callback
+        self._state_jobs: dict[str, list[HassJob]] = {}
+        self._state_unsubs: dict[str, CALLBACK_TYPE] = {}
+
+        # event_type -> registered jobs / HA unsubscribe callback
+        self._event_jobs: dict[str, list[HassJob]] = {}
+        self._event_unsubs: dict[str, CALLBACK_TYPE] = {}
+
+        # entity_id -> SimpleThermostat (for O(1) service and websocket lookups)
+        self._thermostats: dict[str, Any] = {}
+
+    @callback
+    def async_register_thermostat(self, thermostat) -> CALLBACK_TYPE:
+        """Index a thermostat by its entity_id; returns a remover."""
+        entity_id = thermostat.entity_id
+        self._thermostats[entity_id] = thermostat
+
+        @callback
+        def _async_remove():
+            if self._thermostats.get(entity_id) is thermostat:
+                del self._thermostats[entity_id]
+
+        return _async_remove
+
+    def get_thermostat(self, entity_id: str) -> Optional[Any]:
+        """Return the thermostat with ``entity_id``, if any."""
+        return self._thermostats.get(entity_id)
+
+    def get_thermostats(self) -> list:
+        """Return all indexed thermostats."""
+        return list(self._thermostats.values())
+
+    @callback
+    def async_track_time_interval(
+        self, action: Callable, interval: timedelta
+    ) -> CALLBACK_TYPE:
+        """Call ``action(now)`` every ``interval`` on the shared timer."""
+        job = HassJob(action)
+        jobs = self._interval_jobs.setdefault(interval, [])
+        jobs.append(job)
+
+        if interval not in self._interval_unsubs:
+            @callback
+            def _async_tick(now):
+                for tick_job in list(self._interval_jobs.get(interval, [])):
+                    self.hass.async_run_hass_job(tick_job, now)
+
+            self._interval_unsubs[interval] = async_track_time_interval(
+                self.hass, _async_tick, interval
+            )
+
+        @callback
+        def _async_remove():
+            self._remove_job(self._interval_jobs, self._interval_unsubs, interval, job)
+
+        return _async_remove
+
+    @callback
+    def async_track_state_change(
+        self, entity_ids: list, action: Callable
+    ) -> CALLBACK_TYPE:
+        """Call ``action(event)`` on state changes of any of ``entity_ids``."""
+        job = HassJob(action)
+        entity_ids = list(dict.fromkeys(entity_ids))
+
+        for entity_id in entity_ids:
+            self._state_jobs.setdefault(entity_id, []).append(job)
+
+            if entity_id not in self._state_unsubs:
+                self._state_unsubs[entity_id] = async_track_state_change_event(
+                    self.hass, [entity_id], self._async_dispatch_state_change
+                )
+
+        @callback
+        def _async_remove():
+            for entity_id in entity_ids:
+                self._remove_job(self._state_jobs, self._state_unsubs, entity_id, job)
+
+        return _async_remove
+
+    @callback
+    def async_track_event(self, event_type: str, action: Callable) -> CALLBACK_TYPE:
+        """Call ``action(event)`` whenever ``event_type`` fires on the bus."""
+        job = HassJob(action)
+        self._event_jobs.setdefault(event_type, []).append(job)
+
+        if event_type not in self._event_unsubs:
+            @callback
+            def _async_dispatch_event(event):
+                for event_job in list(self._event_jobs.get(event_type, [])):
+                    self.hass.async_run_hass_job(event_job, event)
+
+            self._event_unsubs[event_type] = self.hass.bus.async_listen(
+                event_type, _async_dispatch_event
+            )
+
+        @callback
+        def _async_remove():
+            self._remove_job(self._event_jobs, self._event_unsubs, event_type, job)
+
+        return _async_remove
+
+    def get_metrics(self) -> dict:
+        """Return control loop metrics per room and summed over all rooms."""
+        rooms = {
+            entity_id: thermostat.get_metrics()
+            for entity_id, thermostat in self._thermostats.items()
+        }
+        return {"rooms": rooms, "total": merge_stats(list(rooms.values()))}
+
+    def get_stats(self) -> dict:
+        """Get listener counts for diagnostics."""
+        return {
+            "timers": len(self._interval_unsubs),
+            "timer_subscribers": sum(len(jobs) for jobs in self._interval_jobs.values()),
+            "state_subscriptions": len(self._state_unsubs),
+            "state_subscribers": sum(len(jobs) for jobs in self._state_jobs.values()),
+            "event_listeners": len(self._event_unsubs),
+            "thermostats": len(self._thermostats),
+        }
+
+    @callback
+    def _async_dispatch_state_change(self, event):
+        """Fan a state change event out to all registered jobs."""
+        for job in list(self._state_jobs.get(event.data["entity_id"], [])):
+            self.hass.async_run_hass_job(job, event)
+
+    @callback
+    def _remove_job(self, jobs_by_key: dict, unsubs: dict, key, job: HassJob):
+        """Remove a job and drop the HA listener once nobody needs it."""
+        jobs = jobs_by_key.get(key)
+        if not jobs or job not in jobs:
+            return
+
+        jobs.remove(job)
+        if not jobs:
+            del jobs_by_key[key]
+            unsubs.pop(key)()
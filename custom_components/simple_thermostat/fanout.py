@@ -0,0 +1,232 @@
+"""Command fan-out - Sends one value per entity to many TRVs at once."""
+import asyncio
+import logging
+from time import monotonic
+from typing import Any, Optional
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant
+
+from .circuit_breaker import CircuitBreakers
+from .metrics import ControlMetrics
+from .scheduler import PRIORITY_CONTROL, CommandScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_CALL_TIMEOUT = 10  # seconds per blocking service call
+DEFAULT_RETRIES = 0
+
+# Exponential backoff between retries of a single-entity call (seconds)
+RETRY_BACKOFF = 1.0
+MAX_RETRY_BACKOFF = 8.0
+
+
+class CommandFanout:
+    """Fans out per-entity service calls for a single thermostat.
+
+    Entities that should receive the same value are grouped into one
+    multi-entity service call. The remaining calls run concurrently, limited
+    by ``max_concurrency``. If a grouped call fails, each entity of the group
+    is retried on its own so success can be reported per entity. With a
+    ``scheduler``, every call first waits for its share of the house-wide
+    command budget.
+
+    Every call is bounded by ``timeout``. Single-entity calls are retried up
+    to ``retries`` times with exponential backoff. With ``breakers``, devices
+    whose breaker is open are skipped (reported as failed) and every
+    single-entity outcome is recorded. With ``metrics``, the duration and
+    outcome of every service call is recorded.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        scheduler: Optional[CommandScheduler] = None,
+        timeout: float = DEFAULT_CALL_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        breakers: Optional[CircuitBreakers] = None,
+        metrics: Optional[ControlMetrics] = None,
+    ):
+        """Initialize CommandFanout."""
+        self.hass = hass
+        self.name = name
+        self._scheduler = scheduler
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._timeout = timeout
+        self._retries = retries
+        self._breakers = breakers
+        self._metrics = metrics
+
+        # Statistics
+        self.retry_count = 0
+        self.timeout_count = 0
+
+    async def async_send(
+        self,
+        domain: str,
+        service: str,
+        value_key: str,
+        targets: dict,
+        priority: int = PRIORITY_CONTROL,
+    ) -> dict:
+        """Send ``targets`` (entity_id -> value) and return entity_id -> success."""
+        skipped = {}
+        groups: dict[Any, list] = {}
+        for entity_id, value in targets.items():
+            if self._breakers is not None and not self._breakers.allow(entity_id):
+                skipped[entity_id] = False
+                continue
+            groups.setdefault(value, []).append(entity_id)
+
+        results = await asyncio.gather(
+            *(
+                self._async_send_group(
+                    domain, service, value_key, value, entity_ids, priority
+                )
+                for value, entity_ids in groups.items()
+            )
+        )
+
+        outcome = dict(skipped)
+        for result in results:
+            outcome.update(result)
+        return outcome
+
+    async def _async_send_group(
+        self,
+        domain: str,
+        service: str,
+        value_key: str,
+        value,
+        entity_ids: list,
+        priority: int,
+    ) -> dict:
+        """Send one value to a group of entities, falling back to single calls."""
+        if len(entity_ids) == 1:
+            return {
+                entity_ids[0]: await self._async_call_entity(
+                    domain, service, value_key, value, entity_ids[0], priority
+                )
+            }
+
+        if await self._async_call(
+            domain, service, value_key, value, entity_ids, priority
+        ):
+            if self._breakers is not None:
+                for entity_id in entity_ids:
+                    self._breakers.record_success(entity_id)
+            return {entity_id: True for entity_id in entity_ids}
+
+        _LOGGER.debug(
+            "%s: Grouped %s.%s failed for %s, retrying per entity",
+            self.name,
+            domain,
+            service,
+            entity_ids,
+        )
+        results = await asyncio.gather(
+            *(
+                self._async_call_entity(
+                    domain, service, value_key, value, entity_id, priority
+                )
+                for entity_id in entity_ids
+            )
+        )
+        return dict(zip(entity_ids, results))
+
+    async def _async_call_entity(
+        self,
+        domain: str,
+        service: str,
+        value_key: str,
+        value,
+        entity_id: str,
+        priority: int,
+    ) -> bool:
+        """Call one entity with retries, feeding the outcome to its circuit breaker."""
+        for attempt in range(self._retries + 1):
+            if attempt:
+                # Back off outside the semaphore so other TRVs are not held up
+                self.retry_count += 1
+                await asyncio.sleep(min(RETRY_BACKOFF * 2 ** (attempt - 1), MAX_RETRY_BACKOFF))
+                if self._breakers is not None and not self._breakers.allow(entity_id):
+                    return False
+
+            success = await self._async_call(
+                domain, service, value_key, value, [entity_id], priority
+            )
+            if self._breakers is not None:
+                if success:
+                    self._breakers.record_success(entity_id)
+                else:
+                    self._breakers.record_failure(entity_id)
+            if success:
+                return True
+
+        return False
+
+    async def _async_call(
+        self,
+        domain: str,
+        service: str,
+        value_key: str,
+        value,
+        entity_ids: list,
+        priority: int = PRIORITY_CONTROL,
+    ) -> bool:
+        """Perform a single (possibly multi-entity) blocking service call."""
+        target = entity_ids[0] if len(entity_ids) == 1 else list(entity_ids)
+        async with self._semaphore:
+            if self._scheduler is not None:
+                # One radio frame per addressed device
+                await self._scheduler.async_acquire(priority, len(entity_ids))
+            started_at = monotonic()
+            success = False
+            try:
+                await asyncio.wait_for(
+                    self.hass.services.async_call(
+                        domain,
+                        service,
+                        {ATTR_ENTITY_ID: target, value_key: value},
+                        blocking=True,
+                    ),
+                    self._timeout,
+                )
+                success = True
+                return True
+            except asyncio.TimeoutError:
+                self.timeout_count += 1
+                _LOGGER.error(
+                    "%s: %s.%s for %s timed out after %s s",
+                    self.name,
+                    domain,
+                    service,
+                    target,
+                    self._timeout,
+                )
+                return False
+            except Exception as err:
+                _LOGGER.error(
+                    "%s: Failed to call %s.%s for %s with %s=%s: %s",
+                    self.name,
+                    domain,
+                    service,
+                    target,
+                    value_key,
+                    value,
+                    err,
+                )
+                return False
+            finally:
+                if self._metrics is not None:
+                    self._metrics.record_service_call(monotonic() - started_at, success)
+
+    def get_stats(self) -> dict:
+        """Return retry and timeout counters for UI display."""
+        return {
+            "command_retries": self.retry_count,
+            "command_timeouts": self.timeout_count,
+        }
@@ -0,0 +1,183 @@
+"""Control Metrics - Latency histograms and throughput counters of the control loop."""
+from collections import deque
+import logging
+from time import monotonic
+from typing import Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+# Upper bucket bounds in milliseconds; slower samples land in the overflow bucket
+BUCKETS_MS = (10, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Window for the service call rate
+RATE_WINDOW = 3600  # seconds
+
+# Histograms kept per thermostat
+HISTOGRAM_CONTROL_CYCLE = "control_cycle_ms"
+HISTOGRAM_SERVICE_CALL = "service_call_ms"
+HISTOGRAM_EVENT_TO_COMMAND = "event_to_command_ms"
+
+
+def _mode_histogram(control_mode: str) -> str:
+    """Return the histogram name of a control mode method."""
+    return f"{control_mode}_ms"
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (count, average, maximum and bucket counts)."""
+
+    def __init__(self):
+        """Initialize LatencyHistogram."""
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+
+    def observe(self, seconds: float):
+        """Add one sample."""
+        value_ms = seconds * 1000
+        self.count += 1
+        self.total_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+        for idx, bound in enumerate(BUCKETS_MS):
+            if value_ms <= bound:
+                self.buckets[idx] += 1
+                return
+        self.buckets[-1] += 1
+
+    def get_stats(self) -> dict:
+        """Return the histogram as a JSON-friendly dict."""
+        labels = [f"le_{bound}" for bound in BUCKETS_MS] + [f"gt_{BUCKETS_MS[-1]}"]
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count) if self.count else 0,
+            "max_ms": round(self.max_ms),
+            "buckets": dict(zip(labels, self.buckets)),
+        }
+
+
+def merge_stats(stats_list: list) -> dict:
+    """Aggregate get_stats() dicts of several thermostats into one.
+
+    Counters are summed; histograms are combined bucket by bucket, with the
+    average weighted by sample count.
+    """
+    merged = {}
+    for stats in stats_list:
+        for key, value in stats.items():
+            if isinstance(value, dict) and "buckets" in value:
+                merged[key] = _merge_histograms(merged.get(key), value)
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                merged[key] = merged.get(key, 0) + value
+    return merged
+
+
+def _merge_histograms(first: Optional[dict], second: dict) -> dict:
+    """Combine two histogram dicts."""
+    if first is None:
+        return {**second, "buckets": dict(second["buckets"])}
+    count = first["count"] + second["count"]
+    total = first["avg_ms"] * first["count"] + second["avg_ms"] * second["count"]
+    return {
+        "count": count,
+        "avg_ms": round(total / count) if count else 0,
+        "max_ms": max(first["max_ms"], second["max_ms"]),
+        "buckets": {
+            label: first["buckets"].get(label, 0) + hits
+            for label, hits in second["buckets"].items()
+        },
+    }
+
+
+class ControlMetrics:
+    """Latency and throughput instrumentation of one thermostat's control loop.
+
+    Times control cycles, control mode methods and single service calls on
+    the monotonic clock. A temperature event is stamped with mark_event(); the
+    cycle that serves it records the time from that event to its last
+    successful TRV command. Service calls are kept for a sliding hour to
+    report the call rate.
+    """
+
+    def __init__(self, name: str):
+        """Initialize ControlMetrics."""
+        self.name = name
+        self._histograms: dict[str, LatencyHistogram] = {}
+        self._service_calls: deque = deque()
+
+        # Earliest temperature event not yet served by a control cycle
+        self._event_at: Optional[float] = None
+        self._last_command_at: Optional[float] = None
+
+        # Statistics
+        self.cycle_count = 0
+        self.commands_failed = 0
+        self.service_calls_failed = 0
+
+    def observe(self, histogram: str, seconds: float):
+        """Add a duration sample to a named histogram."""
+        self._histograms.setdefault(histogram, LatencyHistogram()).observe(seconds)
+
+    def observe_mode(self, control_mode: str, seconds: float):
+        """Add the duration of one control mode method."""
+        self.observe(_mode_histogram(control_mode), seconds)
+
+    def mark_event(self):
+        """Stamp a temperature event (the first one counts until a cycle serves it)."""
+        if self._event_at is None:
+            self._event_at = monotonic()
+
+    def start_cycle(self) -> float:
+        """Return the start time of a control cycle."""
+        self._last_command_at = None
+        return monotonic()
+
+    def finish_cycle(self, started_at: float):
+        """Record a finished control cycle and the event-to-command latency it served."""
+        now = monotonic()
+        self.cycle_count += 1
+        self.observe(HISTOGRAM_CONTROL_CYCLE, now - started_at)
+
+        if self._event_at is not None and self._event_at <= started_at:
+            if self._last_command_at is not None:
+                self.observe(HISTOGRAM_EVENT_TO_COMMAND, self._last_command_at - self._event_at)
+            # Served, even if nothing had to be sent
+            self._event_at = None
+
+    def record_commands(self, sent: int = 0, failed: int = 0):
+        """Record the per-TRV outcome of one fan-out (sent/skipped are counted by CommandCache)."""
+        self.commands_failed += failed
+        if sent:
+            self._last_command_at = monotonic()
+
+    def record_service_call(self, seconds: float, success: bool):
+        """Record one (possibly multi-entity) service call."""
+        now = monotonic()
+        self.observe(HISTOGRAM_SERVICE_CALL, seconds)
+        self._service_calls.append(now)
+        if not success:
+            self.service_calls_failed += 1
+        self._prune(now)
+
+    def get_service_calls_per_hour(self) -> int:
+        """Return the number of service calls in the last hour."""
+        self._prune(monotonic())
+        return len(self._service_calls)
+
+    def get_stats(self) -> dict:
+        """Return counters and histograms for diagnostics."""
+        return {
+            "control_cycles": self.cycle_count,
+            "commands_failed": self.commands_failed,
+            "service_calls_per_hour": self.get_service_calls_per_hour(),
+            "service_calls_failed": self.service_calls_failed,
+            **{
+                name: histogram.get_stats()
+                for name, histogram in sorted(self._histograms.items())
+            },
+        }
+
+    def _prune(self, now: float):
+        """Drop service calls older than the rate window."""
+        while self._service_calls and now - self._service_calls[0] > RATE_WINDOW:
+            self._service_calls.popleft()
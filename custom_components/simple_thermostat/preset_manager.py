@@ -1,11 +1,20 @@
 """Preset Manager - Handles scheduling and override logic for Simple Thermostat."""
+from bisect import bisect_right
 from datetime import datetime, timedelta
 import logging
-from typing import Optional
+from typing import Callable, Optional
 
-from homeassistant.core import HomeAssistant, State, callback
-from homeassistant.const import STATE_ON, STATE_UNAVAILABLE, STATE_UNKNOWN
-from homeassistant.helpers.event import async_track_state_change_event, async_track_time_interval
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, State, callback
+from homeassistant.const import (
+    EVENT_CORE_CONFIG_UPDATE,
+    STATE_ON,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
+from homeassistant.helpers.event import async_call_later, async_track_point_in_time
+import homeassistant.util.dt as dt_util
+
+from .coordinator import async_get_coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,6 +26,14 @@ PRIORITY_PRESENCE = 4
 PRIORITY_GLOBAL_AWAY = 5
 PRIORITY_SCHEDULE = 6
 
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+
+def _minute_of_week(now: datetime) -> int:
+    """Return minutes since Monday 00:00 for a (local) datetime."""
+    return now.weekday() * MINUTES_PER_DAY + now.hour * 60 + now.minute
+
 
 class PresetManager:
     """Manages preset scheduling and overrides with priority logic.
@@ -59,7 +76,8 @@ class PresetManager:
         self._scheduled_preset: Optional[str] = None
         self._manual_override_preset: Optional[str] = None
         self._presence_override_active: bool = False
-        self._last_presence_clear_time: Optional[datetime] = None
+        self._presence_expires_at: Optional[datetime] = None
+        self._unsub_presence_expiry: Optional[CALLBACK_TYPE] = None
         self._window_open: bool = False
         self._outdoor_temp_high: bool = False
         self._global_away_active: bool = False
@@ -72,32 +90,47 @@ class PresetManager:
             schedule_config.get("weekend", []) if schedule_config else []
         )
 
+        # Weekly timeline: sorted (minute_of_week, preset) for bisect lookup
+        self._timeline = self._compile_timeline()
+        self._timeline_minutes = [minutes for minutes, _ in self._timeline]
+
+        # Next schedule transition (armed as a single point-in-time callback)
+        self._next_transition: Optional[tuple[datetime, str]] = None
+        self._unsub_transition: Optional[CALLBACK_TYPE] = None
+        self._track_transitions = False
+
+        # Callbacks notified when the active preset (after overrides) changes
+        self._update_listeners: list[HassJob] = []
+        self._last_active_preset: Optional[str] = None
+
         # Track state change listeners (for cleanup)
         self._listeners = []
 
     async def async_setup(self):
         """Set up listeners and initial state."""
+        # Shared sensors (e.g. global away) get one subscription house-wide
+        coordinator = async_get_coordinator(self.hass)
+
         # Listen to sensor state changes
         if self._presence_sensor:
             self._listeners.append(
-                async_track_state_change_event(
-                    self.hass, [self._presence_sensor], self._async_presence_changed
+                coordinator.async_track_state_change(
+                    [self._presence_sensor], self._async_presence_changed
                 )
             )
             await self._update_presence_state()
 
         if self._window_sensor:
             self._listeners.append(
-                async_track_state_change_event(
-                    self.hass, [self._window_sensor], self._async_window_changed
+                coordinator.async_track_state_change(
+                    [self._window_sensor], self._async_window_changed
                 )
             )
             await self._update_window_state()
 
         if self._outdoor_temp_sensor:
             self._listeners.append(
-                async_track_state_change_event(
-                    self.hass,
+                coordinator.async_track_state_change(
                     [self._outdoor_temp_sensor],
                     self._async_outdoor_temp_changed,
                 )
@@ -106,26 +139,72 @@ class PresetManager:
 
         if self._global_away_sensor:
             self._listeners.append(
-                async_track_state_change_event(
-                    self.hass, [self._global_away_sensor], self._async_global_away_changed
+                coordinator.async_track_state_change(
+                    [self._global_away_sensor], self._async_global_away_changed
                 )
             )
             await self._update_global_away_state()
 
-        # Update scheduled preset every minute
+        # Re-arm the next transition when the time zone changes
         self._listeners.append(
-            async_track_time_interval(
-                self.hass, self._async_update_schedule, timedelta(minutes=1)
+            coordinator.async_track_event(
+                EVENT_CORE_CONFIG_UPDATE, self._async_core_config_updated
             )
         )
+
+        # Scheduled preset is updated exactly at each transition
+        self._track_transitions = True
         await self._async_update_schedule(None)
 
+        self._last_active_preset = self.get_active_preset()
+
     async def async_cleanup(self):
         """Clean up listeners."""
         for listener in self._listeners:
             listener()
         self._listeners.clear()
 
+        self._track_transitions = False
+        if self._unsub_transition is not None:
+            self._unsub_transition()
+            self._unsub_transition = None
+
+        self._cancel_presence_expiry()
+
+    @callback
+    def async_add_listener(self, update_callback: Callable) -> CALLBACK_TYPE:
+        """Register a callback for active preset changes; returns a remover.
+
+        Callbacks are invoked as soon as a schedule transition or an override
+        sensor change alters the result of get_active_preset().
+        """
+        job = HassJob(update_callback)
+        self._update_listeners.append(job)
+
+        @callback
+        def _async_remove():
+            if job in self._update_listeners:
+                self._update_listeners.remove(job)
+
+        return _async_remove
+
+    @callback
+    def _async_check_active_preset(self):
+        """Notify registered callbacks if the active preset changed."""
+        active_preset = self.get_active_preset()
+        if active_preset == self._last_active_preset:
+            return
+
+        _LOGGER.debug(
+            "%s: Active preset changed: %s → %s",
+            self.name,
+            self._last_active_preset,
+            active_preset,
+        )
+        self._last_active_preset = active_preset
+        for job in list(self._update_listeners):
+            self.hass.async_run_hass_job(job)
+
     def _parse_schedule(self, schedule_list: list) -> list:
         """Parse schedule config into sorted list of (time, preset) tuples."""
         parsed = []
@@ -142,6 +221,46 @@ class PresetManager:
                     )
         return sorted(parsed)  # Sort by time
 
+    def _compile_timeline(self) -> list:
+        """Compile weekday/weekend schedules into one sorted weekly timeline."""
+        timeline = []
+        for day in range(7):
+            schedule = self._weekend_schedule if day >= 5 else self._weekday_schedule
+            timeline.extend(
+                (day * MINUTES_PER_DAY + minutes, preset) for minutes, preset in schedule
+            )
+        return timeline
+
+    def _get_scheduled_preset_at(self, now: datetime) -> Optional[str]:
+        """Look up the scheduled preset at ``now`` (None without a schedule)."""
+        if not self._timeline:
+            return None
+
+        # Index -1 wraps to the last entry of the previous week
+        idx = bisect_right(self._timeline_minutes, _minute_of_week(now)) - 1
+        return self._timeline[idx][1]
+
+    def _get_next_transition(self, now: datetime) -> Optional[tuple[datetime, str]]:
+        """Return (local time, preset) of the next schedule entry after ``now``."""
+        if not self._timeline:
+            return None
+
+        idx = bisect_right(self._timeline_minutes, _minute_of_week(now))
+        if idx < len(self._timeline):
+            next_minutes, preset = self._timeline[idx]
+        else:
+            next_minutes = self._timeline[0][0] + MINUTES_PER_WEEK
+            preset = self._timeline[0][1]
+
+        days_ahead = next_minutes // MINUTES_PER_DAY - now.weekday()
+        minute_of_day = next_minutes % MINUTES_PER_DAY
+
+        # Wall-clock arithmetic keeps the local time correct across DST changes
+        when = (now + timedelta(days=days_ahead)).replace(
+            hour=minute_of_day // 60, minute=minute_of_day % 60, second=0, microsecond=0
+        )
+        return when, preset
+
     def get_active_preset(self) -> str:
         """Get the current active preset after applying all overrides."""
         # Start with scheduled preset or initial preset
@@ -178,6 +297,8 @@ class PresetManager:
         """User manually changed preset."""
         _LOGGER.info("%s: Manual preset change: %s", self.name, preset)
         self._manual_override_preset = preset
+        # The caller applies the preset itself; clearing the override later must notify
+        self._last_active_preset = self.get_active_preset()
 
     def clear_manual_override(self):
         """Clear manual override (called when schedule changes)."""
@@ -187,44 +308,32 @@ class PresetManager:
 
     def get_override_status(self) -> dict:
         """Get current override status for UI display."""
+        next_transition = self._next_transition
         return {
+            "next_transition": next_transition[0].isoformat() if next_transition else None,
+            "next_transition_preset": next_transition[1] if next_transition else None,
             "scheduled_preset": self._scheduled_preset,
             "manual_override": self._manual_override_preset,
             "presence_override": self._presence_override_active,
+            "presence_expires_at": (
+                self._presence_expires_at.isoformat() if self._presence_expires_at else None
+            ),
             "window_open": self._window_open,
             "outdoor_temp_high": self._outdoor_temp_high,
             "global_away": self._global_away_active,
         }
 
     async def _async_update_schedule(self, _):
-        """Update scheduled preset based on current time."""
-        now = datetime.now()
-        is_weekend = now.weekday() >= 5  # Saturday=5, Sunday=6
-
-        schedule = self._weekend_schedule if is_weekend else self._weekday_schedule
+        """Update scheduled preset based on current time and arm the next transition."""
+        now = dt_util.now()
+        scheduled_preset = self._get_scheduled_preset_at(now)
 
-        if not schedule:
+        if scheduled_preset is None:
             # No schedule configured, keep initial preset
             if self._scheduled_preset is None:
                 self._scheduled_preset = self._initial_preset
-            return
-
-        # Find current scheduled preset
-        current_minutes = now.hour * 60 + now.minute
-        scheduled_preset = None
-
-        for time_minutes, preset in schedule:
-            if current_minutes >= time_minutes:
-                scheduled_preset = preset
-            else:
-                break
-
-        if scheduled_preset is None:
-            # Before first scheduled time, use last preset from previous day
-            scheduled_preset = schedule[-1][1]
-
-        # Check if schedule changed
-        if self._scheduled_preset != scheduled_preset:
+        elif self._scheduled_preset != scheduled_preset:
+            # Schedule changed
             old_preset = self._scheduled_preset
             self._scheduled_preset = scheduled_preset
             _LOGGER.info(
@@ -232,11 +341,42 @@ class PresetManager:
             )
             # Clear manual override when schedule changes
             self.clear_manual_override()
+            self._async_check_active_preset()
+
+        self._next_transition = self._get_next_transition(now)
+        if self._track_transitions:
+            self._async_arm_next_transition()
+
+    @callback
+    def _async_arm_next_transition(self):
+        """Arm a single callback at the next schedule transition."""
+        if self._unsub_transition is not None:
+            self._unsub_transition()
+            self._unsub_transition = None
+
+        if self._next_transition is None:
+            return
+
+        when, preset = self._next_transition
+        _LOGGER.debug("%s: Next schedule transition at %s → %s", self.name, when, preset)
+        self._unsub_transition = async_track_point_in_time(
+            self.hass, self._async_handle_transition, when
+        )
+
+    async def _async_handle_transition(self, now):
+        """Handle a schedule transition (re-arms the next one)."""
+        self._unsub_transition = None
+        await self._async_update_schedule(now)
+
+    async def _async_core_config_updated(self, event):
+        """Re-evaluate the schedule after a time zone change."""
+        await self._async_update_schedule(None)
 
     @callback
     async def _async_presence_changed(self, event):
         """Handle presence sensor state change."""
         await self._update_presence_state()
+        self._async_check_active_preset()
 
     async def _update_presence_state(self):
         """Update presence override state."""
@@ -254,31 +394,99 @@ class PresetManager:
             if not self._presence_override_active:
                 _LOGGER.info("%s: Presence detected → override to PRESENT", self.name)
                 self._presence_override_active = True
-            self._last_presence_clear_time = None
-        else:
-            # Presence cleared → start 15-minute timer
-            if self._presence_override_active:
-                if self._last_presence_clear_time is None:
-                    self._last_presence_clear_time = datetime.now()
-                    _LOGGER.info(
-                        "%s: Presence cleared → waiting %d minutes",
-                        self.name,
-                        self._presence_away_delay,
-                    )
-                else:
-                    # Check if delay has passed
-                    elapsed = datetime.now() - self._last_presence_clear_time
-                    if elapsed >= timedelta(minutes=self._presence_away_delay):
-                        _LOGGER.info(
-                            "%s: Presence delay expired → clearing override", self.name
-                        )
-                        self._presence_override_active = False
-                        self._last_presence_clear_time = None
+            self._cancel_presence_expiry()
+        elif self._presence_override_active and self._unsub_presence_expiry is None:
+            # Presence cleared → clear override once the delay expires
+            _LOGGER.info(
+                "%s: Presence cleared → waiting %d minutes",
+                self.name,
+                self._presence_away_delay,
+            )
+            self._arm_presence_expiry(
+                dt_util.utcnow() + timedelta(minutes=self._presence_away_delay)
+            )
+
+    @callback
+    def restore_presence_expiry(self, expires_at: Optional[datetime]):
+        """Resume a presence expiry timer that was in flight before a restart."""
+        if expires_at is None or self._unsub_presence_expiry is not None:
+            return
+
+        if self._presence_override_active:
+            # Presence sensor is on again - override stays without a timer
+            return
+
+        if expires_at <= dt_util.utcnow():
+            _LOGGER.debug("%s: Restored presence timer already expired", self.name)
+            return
+
+        _LOGGER.info(
+            "%s: Restoring presence override until %s", self.name, expires_at
+        )
+        self._presence_override_active = True
+        self._arm_presence_expiry(expires_at)
+        self._async_check_active_preset()
+
+    def get_persisted_state(self) -> dict:
+        """Return the override state worth keeping across restarts."""
+        return {
+            "scheduled_preset": self._scheduled_preset,
+            "manual_override": self._manual_override_preset,
+            "presence_expires_at": (
+                self._presence_expires_at.isoformat() if self._presence_expires_at else None
+            ),
+        }
+
+    @callback
+    def restore_state(self, data: dict):
+        """Restore override state saved by get_persisted_state() (after async_setup)."""
+        # A schedule transition missed while stopped clears the manual override,
+        # exactly as it would have done at runtime
+        if data.get("scheduled_preset") == self._scheduled_preset:
+            self._manual_override_preset = data.get("manual_override")
+
+        if data.get("presence_expires_at"):
+            self.restore_presence_expiry(
+                dt_util.parse_datetime(data["presence_expires_at"])
+            )
+
+        self._async_check_active_preset()
+
+    @callback
+    def _arm_presence_expiry(self, expires_at: datetime):
+        """Arm the presence expiry timer."""
+        self._cancel_presence_expiry()
+        self._presence_expires_at = expires_at
+        delay = max(0.0, (expires_at - dt_util.utcnow()).total_seconds())
+        self._unsub_presence_expiry = async_call_later(
+            self.hass, delay, self._async_presence_expired
+        )
+
+    @callback
+    def _cancel_presence_expiry(self):
+        """Cancel a pending presence expiry timer."""
+        if self._unsub_presence_expiry is not None:
+            self._unsub_presence_expiry()
+            self._unsub_presence_expiry = None
+        self._presence_expires_at = None
+
+    @callback
+    def _async_presence_expired(self, _now):
+        """Clear the presence override once the away delay has passed."""
+        self._unsub_presence_expiry = None
+        self._presence_expires_at = None
+        if not self._presence_override_active:
+            return
+
+        _LOGGER.info("%s: Presence delay expired → clearing override", self.name)
+        self._presence_override_active = False
+        self._async_check_active_preset()
 
     @callback
     async def _async_window_changed(self, event):
         """Handle window sensor state change."""
         await self._update_window_state()
+        self._async_check_active_preset()
 
     async def _update_window_state(self):
         """Update window open state."""
@@ -303,6 +511,7 @@ class PresetManager:
     async def _async_outdoor_temp_changed(self, event):
         """Handle outdoor temperature sensor state change."""
         await self._update_outdoor_temp_state()
+        self._async_check_active_preset()
 
     async def _update_outdoor_temp_state(self):
         """Update outdoor temperature state."""
@@ -334,6 +543,7 @@ class PresetManager:
     async def _async_global_away_changed(self, event):
         """Handle global away sensor state change."""
         await self._update_global_away_state()
+        self._async_check_active_preset()
 
     async def _update_global_away_state(self):
         """Update global away state."""
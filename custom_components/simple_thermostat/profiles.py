@@ -0,0 +1,109 @@
+"""Device Profiles - Capabilities and naming of the supported TRV models."""
+from datetime import timedelta
+import logging
+from typing import Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+PROFILE_BOSCH_BTH_RA = "bosch_bth_ra"
+PROFILE_GENERIC = "generic"
+
+DEFAULT_PROFILE = PROFILE_BOSCH_BTH_RA
+
+# Commanded and reported values closer than this are equal (device rounding, float noise)
+VALUE_TOLERANCE = 0.05
+
+
+class DeviceProfile:
+    """What a TRV model accepts and how its entities and topics are named.
+
+    ``valve_entity_pattern`` and ``topic_pattern`` are format strings; the
+    valve pattern gets the configured TRV ``id``, the topic pattern the
+    device's (or group's) ``friendly_name``. A pattern of None means the model
+    has no such entity / is not reachable over MQTT. ``zha_attributes`` holds
+    the manufacturer cluster attributes used by the ZHA transport, and
+    ``remote_temperature_timeout`` how long the device trusts a remote
+    temperature.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        setpoint_step: float = 0.5,
+        min_temp: float = 5.0,
+        max_temp: float = 30.0,
+        valve_entity_pattern: Optional[str] = None,
+        topic_pattern: Optional[str] = None,
+        supports_remote_temperature: bool = False,
+        manual_mode_payload: Optional[str] = None,
+        zha_attributes: Optional[dict] = None,
+        remote_temperature_timeout: Optional[timedelta] = None,
+    ):
+        """Initialize the profile."""
+        self.name = name
+        self.setpoint_step = setpoint_step
+        self.min_temp = min_temp
+        self.max_temp = max_temp
+        self.valve_entity_pattern = valve_entity_pattern
+        self.topic_pattern = topic_pattern
+        self.supports_remote_temperature = supports_remote_temperature
+        self.manual_mode_payload = manual_mode_payload
+        self.zha_attributes = zha_attributes
+        self.remote_temperature_timeout = remote_temperature_timeout
+
+    def quantize(self, temperature: float) -> float:
+        """Clamp a setpoint to the device range and round it to the device step."""
+        temperature = max(self.min_temp, min(self.max_temp, temperature))
+        if self.setpoint_step:
+            temperature = round(temperature / self.setpoint_step) * self.setpoint_step
+        # Strip float noise (e.g. 21.500000000000004)
+        return round(temperature, 2)
+
+    def get_valve_entity(self, trv_id: str) -> Optional[str]:
+        """Return the valve position entity of a TRV, if the model has one."""
+        if self.valve_entity_pattern is None:
+            return None
+        return self.valve_entity_pattern.format(id=trv_id)
+
+    def get_command_topic(self, friendly_name: str) -> Optional[str]:
+        """Return the MQTT command topic of a device or group, if the model uses MQTT."""
+        if self.topic_pattern is None:
+            return None
+        return self.topic_pattern.format(friendly_name=friendly_name)
+
+
+PROFILES = {
+    profile.name: profile
+    for profile in (
+        DeviceProfile(
+            PROFILE_BOSCH_BTH_RA,
+            setpoint_step=0.5,
+            min_temp=5.0,
+            max_temp=30.0,
+            valve_entity_pattern="number.{id}_pi_heating_demand",
+            topic_pattern="zigbee2mqtt/{friendly_name}/set",
+            supports_remote_temperature=True,
+            # The TRV falls back to its internal sensor after 30 minutes without an update
+            remote_temperature_timeout=timedelta(minutes=30),
+            manual_mode_payload='{"operating_mode": "manual"}',
+            # Bosch manufacturer attributes of the thermostat cluster (0x0201)
+            zha_attributes={
+                "manufacturer": 0x1209,
+                "operating_mode": 0x4007,
+                "operating_mode_manual": 1,
+                "remote_temperature": 0x4040,
+            },
+        ),
+        # Any climate entity: setpoints only, no valve or MQTT access
+        DeviceProfile(PROFILE_GENERIC, setpoint_step=0.5, min_temp=5.0, max_temp=30.0),
+    )
+}
+
+
+def get_profile(name: Optional[str]) -> DeviceProfile:
+    """Return a profile by name (the default profile for None or unknown names)."""
+    profile = PROFILES.get(name or DEFAULT_PROFILE)
+    if profile is None:
+        _LOGGER.warning("Unknown device profile '%s', using %s", name, DEFAULT_PROFILE)
+        profile = PROFILES[DEFAULT_PROFILE]
+    return profile
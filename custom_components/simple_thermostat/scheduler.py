@@ -0,0 +1,185 @@
+"""Command Scheduler - House-wide rate limit and priorities for outbound TRV commands."""
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+from time import monotonic
+from typing import Optional
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_SCHEDULER = "scheduler"
+
+# Priority classes (lower runs first)
+PRIORITY_SAFETY = 0
+PRIORITY_CONTROL = 1
+PRIORITY_SYNC = 2
+PRIORITY_INIT = 3
+
+PRIORITY_NAMES = {
+    PRIORITY_SAFETY: "safety",
+    PRIORITY_CONTROL: "control",
+    PRIORITY_SYNC: "sync",
+    PRIORITY_INIT: "init",
+}
+
+DEFAULT_RATE = 5.0  # commands per second
+DEFAULT_BURST = 10
+DEFAULT_STARTUP_JITTER = 30  # seconds
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> "CommandScheduler":
+    """Return the domain-wide command scheduler, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    scheduler = domain_data.get(DATA_SCHEDULER)
+    if scheduler is None:
+        scheduler = CommandScheduler(hass)
+        domain_data[DATA_SCHEDULER] = scheduler
+    return scheduler
+
+
+class CommandScheduler:
+    """Token bucket shared by all rooms for commands sent to the Zigbee network.
+
+    Each command takes one token per addressed device. Tokens refill at
+    ``rate`` per second up to ``burst``. When no token is available, callers
+    wait in a priority queue, so a safety shut-off overtakes queued remote
+    temperature syncs or TRV initialization.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        rate: float = DEFAULT_RATE,
+        burst: int = DEFAULT_BURST,
+        startup_jitter: float = DEFAULT_STARTUP_JITTER,
+    ):
+        """Initialize the scheduler."""
+        self.hass = hass
+        self._rate = rate
+        self._burst = burst
+        self._startup_jitter = startup_jitter
+        self._tokens = float(burst)
+        self._last_refill = monotonic()
+
+        # Heap of (priority, sequence, cost, enqueued_at, future)
+        self._queue: list = []
+        self._sequence = itertools.count()
+        self._drain_handle: Optional[asyncio.TimerHandle] = None
+
+        # Statistics
+        self._granted = 0
+        self._queued = 0
+        self._waited = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._peak_queue_depth = 0
+
+    @callback
+    def async_configure(self, rate: float, burst: int, startup_jitter: float):
+        """Apply the options from the ``simple_thermostat:`` YAML section."""
+        self._rate = rate
+        self._burst = burst
+        self._startup_jitter = startup_jitter
+        self._tokens = min(self._tokens, float(burst))
+
+    def get_startup_delay(self) -> float:
+        """Return a random delay that staggers per-room startup traffic."""
+        return random.uniform(0, self._startup_jitter)
+
+    async def async_acquire(self, priority: int = PRIORITY_CONTROL, cost: int = 1):
+        """Wait until ``cost`` tokens are available for a command of ``priority``."""
+        cost = min(max(1, cost), self._burst)
+        self._refill()
+
+        # Only go straight through if nobody is waiting ahead of us
+        if not self._queue and self._tokens >= cost:
+            self._tokens -= cost
+            self._granted += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            self._queue, (priority, next(self._sequence), cost, monotonic(), future)
+        )
+        self._queued += 1
+        self._peak_queue_depth = max(self._peak_queue_depth, len(self._queue))
+        self._schedule_drain()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            # Drop the abandoned entry; a granted token is simply lost
+            self._queue = [entry for entry in self._queue if entry[4] is not future]
+            heapq.heapify(self._queue)
+            raise
+
+    def _refill(self):
+        """Add the tokens earned since the last refill."""
+        now = monotonic()
+        self._tokens = min(
+            float(self._burst), self._tokens + (now - self._last_refill) * self._rate
+        )
+        self._last_refill = now
+
+    @callback
+    def _schedule_drain(self):
+        """Wake up when the command at the head of the queue can be sent."""
+        if self._drain_handle is not None or not self._queue:
+            return
+
+        cost = self._queue[0][2]
+        delay = max(0.0, (cost - self._tokens) / self._rate)
+        self._drain_handle = asyncio.get_running_loop().call_later(delay, self._drain)
+
+    @callback
+    def _drain(self):
+        """Grant tokens to queued commands in priority order."""
+        self._drain_handle = None
+        self._refill()
+
+        while self._queue:
+            _, _, cost, enqueued_at, future = self._queue[0]
+            if future.done():
+                heapq.heappop(self._queue)
+                continue
+            if self._tokens < cost:
+                break
+
+            heapq.heappop(self._queue)
+            self._tokens -= cost
+            self._granted += 1
+            self._waited += 1
+            wait = monotonic() - enqueued_at
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+            future.set_result(None)
+
+        self._schedule_drain()
+
+    def get_queue_depth(self) -> dict:
+        """Return the number of waiting commands per priority class."""
+        depth = {name: 0 for name in PRIORITY_NAMES.values()}
+        for priority, _, _, _, future in self._queue:
+            if not future.done():
+                name = PRIORITY_NAMES.get(priority, str(priority))
+                depth[name] = depth.get(name, 0) + 1
+        return depth
+
+    def get_stats(self) -> dict:
+        """Return scheduler diagnostics."""
+        return {
+            "command_queue_depth": sum(self.get_queue_depth().values()),
+            "command_queue_peak": self._peak_queue_depth,
+            "commands_rate_limited": self._queued,
+            "command_wait_avg_ms": (
+                round(self._total_wait / self._waited * 1000) if self._waited else 0
+            ),
+            "command_wait_max_ms": round(self._max_wait * 1000),
+        }
@@ -1,23 +1,32 @@
 """Sensor platform for Simple Thermostat."""
 import logging
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
 from homeassistant.components.binary_sensor import BinarySensorEntity
 from homeassistant.const import UnitOfTemperature
+from homeassistant.core import callback
+
+from .sensor_registry import PLATFORM_SENSOR, async_get_sensor_registry
 
 _LOGGER = logging.getLogger(__name__)
 
+# Diagnostic entity tiers (entities per room with N TRVs)
+DIAGNOSTICS_NONE = "none"  # 0
+DIAGNOSTICS_ROOM = "room"  # 3
+DIAGNOSTICS_COMPACT = "compact"  # 4 - per-TRV values as attributes of one sensor
+DIAGNOSTICS_FULL = "full"  # 3 + 4 x N
+DIAGNOSTICS_LEVELS = [DIAGNOSTICS_NONE, DIAGNOSTICS_ROOM, DIAGNOSTICS_COMPACT, DIAGNOSTICS_FULL]
+
 
 async def async_setup_platform(hass, config, async_add_entities, discovery_info=None):
     """Set up Simple Thermostat sensor platform."""
     if discovery_info is None:
         return
 
-    sensors = discovery_info.get("sensors", [])
-    sensor_entities = [s for s in sensors if isinstance(s, SensorEntity)]
-
-    if sensor_entities:
-        async_add_entities(sensor_entities, update_before_add=True)
+    # Entities of all rooms are handed over by the domain-wide registry
+    async_get_sensor_registry(hass).async_register_platform(
+        PLATFORM_SENSOR, async_add_entities
+    )
 
 
 def _get_trv_suffix(climate_entity, trv_index):
@@ -36,9 +45,52 @@ def _get_trv_suffix(climate_entity, trv_index):
         return f"trv_{trv_index + 1}"
 
 
-async def async_create_sensors(hass, climate_entity):
-    """Create diagnostic sensors for a climate entity."""
-    sensors = []
+def _get_trv_valve_entity(climate_entity, trv_index):
+    """Return the valve entity of a TRV, or None if its device profile has none."""
+    valve_entities = climate_entity._trv_valve_entities
+    return valve_entities[trv_index] if trv_index < len(valve_entities) else None
+
+
+class SimpleThermostatDiagnosticEntity:
+    """Push-driven diagnostic entity that mirrors one value of its climate entity.
+
+    Not polled: the climate entity notifies its diagnostic listeners after each
+    state write, and the entity only writes its own state if its value changed.
+    """
+
+    _attr_should_poll = False
+
+    async def async_added_to_hass(self):
+        """Subscribe to updates of the parent climate entity."""
+        await super().async_added_to_hass()
+        self._last_value = self._get_value()
+        self.async_on_remove(
+            self._climate_entity.async_add_diagnostic_listener(self._async_parent_updated)
+        )
+
+    @callback
+    def _async_parent_updated(self):
+        """Write state if the mirrored value changed."""
+        value = self._get_value()
+        if value == self._last_value:
+            return
+        self._last_value = value
+        self.async_write_ha_state()
+
+    def _get_value(self):
+        """Return the mirrored value."""
+        raise NotImplementedError
+
+
+async def async_create_sensors(hass, climate_entity, level=DIAGNOSTICS_FULL, metrics=False):
+    """Create diagnostic sensors for a climate entity at the given diagnostics level.
+
+    With ``metrics``, the control loop metrics sensor is added regardless of level.
+    """
+    sensors = [SimpleThermostatMetricsSensor(climate_entity)] if metrics else []
+
+    if level == DIAGNOSTICS_NONE:
+        return sensors
 
     # Main control mode sensor
     sensors.append(SimpleThermostatControlModeSensor(climate_entity))
@@ -49,17 +101,26 @@ async def async_create_sensors(hass, climate_entity):
     # Overall heating binary sensor
     sensors.append(SimpleThermostatHeatingBinarySensor(climate_entity))
 
+    if level == DIAGNOSTICS_COMPACT:
+        # All per-TRV values on one sensor
+        sensors.append(SimpleThermostatTRVSummarySensor(climate_entity))
+
+    if level != DIAGNOSTICS_FULL:
+        return sensors
+
     # Per-TRV sensors
     for idx, climate_id in enumerate(climate_entity._climate_entities):
         sensors.append(SimpleThermostatTRVInternalTempSensor(climate_entity, idx))
         sensors.append(SimpleThermostatTRVTargetTempSensor(climate_entity, idx))
+        if _get_trv_valve_entity(climate_entity, idx) is None:
+            continue
         sensors.append(SimpleThermostatTRVValvePositionSensor(climate_entity, idx))
         sensors.append(SimpleThermostatTRVHeatingBinarySensor(climate_entity, idx))
 
     return sensors
 
 
-class SimpleThermostatControlModeSensor(SensorEntity):
+class SimpleThermostatControlModeSensor(SimpleThermostatDiagnosticEntity, SensorEntity):
     """Sensor showing the current control mode."""
 
     def __init__(self, climate_entity):
@@ -72,14 +133,14 @@ class SimpleThermostatControlModeSensor(SensorEntity):
     @property
     def state(self):
         """Return the current control mode."""
-        return self._climate_entity.control_mode
+        return self._get_value()
 
-    async def async_update(self):
-        """Update the sensor."""
-        pass
+    def _get_value(self):
+        """Compute the value from the climate entity."""
+        return self._climate_entity.control_mode
 
 
-class SimpleThermostatErrorSensor(SensorEntity):
+class SimpleThermostatErrorSensor(SimpleThermostatDiagnosticEntity, SensorEntity):
     """Sensor showing temperature error (target - current)."""
 
     def __init__(self, climate_entity):
@@ -90,20 +151,21 @@ class SimpleThermostatErrorSensor(SensorEntity):
         self._attr_icon = "mdi:delta"
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
         self._attr_device_class = "temperature"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
 
     @property
     def state(self):
         """Return the temperature error."""
+        return self._get_value()
+
+    def _get_value(self):
+        """Compute the value from the climate entity."""
         if self._climate_entity._cur_temp is None or self._climate_entity._target_temp is None:
             return None
         return round(self._climate_entity._target_temp - self._climate_entity._cur_temp, 2)
 
-    async def async_update(self):
-        """Update the sensor."""
-        pass
-
 
-class SimpleThermostatHeatingBinarySensor(BinarySensorEntity):
+class SimpleThermostatHeatingBinarySensor(SimpleThermostatDiagnosticEntity, BinarySensorEntity):
     """Binary sensor showing if overall heating is active."""
 
     def __init__(self, climate_entity):
@@ -117,14 +179,14 @@ class SimpleThermostatHeatingBinarySensor(BinarySensorEntity):
     @property
     def is_on(self):
         """Return true if heating."""
-        return any(v > 0 for v in self._climate_entity._valve_positions.values())
+        return self._get_value()
 
-    async def async_update(self):
-        """Update the sensor."""
-        pass
+    def _get_value(self):
+        """Compute the value from the climate entity."""
+        return any(v > 0 for v in self._climate_entity._valve_positions.values())
 
 
-class SimpleThermostatTRVInternalTempSensor(SensorEntity):
+class SimpleThermostatTRVInternalTempSensor(SimpleThermostatDiagnosticEntity, SensorEntity):
     """Sensor showing TRV internal temperature."""
 
     def __init__(self, climate_entity, trv_index):
@@ -137,18 +199,19 @@ class SimpleThermostatTRVInternalTempSensor(SensorEntity):
         self._attr_icon = "mdi:thermometer"
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
         self._attr_device_class = "temperature"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
 
     @property
     def state(self):
         """Return the TRV internal temperature."""
-        return self._climate_entity._trv_internal_temps.get(self._trv_index)
+        return self._get_value()
 
-    async def async_update(self):
-        """Update the sensor."""
-        pass
+    def _get_value(self):
+        """Compute the value from the climate entity."""
+        return self._climate_entity._trv_internal_temps.get(self._trv_index)
 
 
-class SimpleThermostatTRVTargetTempSensor(SensorEntity):
+class SimpleThermostatTRVTargetTempSensor(SimpleThermostatDiagnosticEntity, SensorEntity):
     """Sensor showing what target temperature was sent to TRV."""
 
     def __init__(self, climate_entity, trv_index):
@@ -161,18 +224,19 @@ class SimpleThermostatTRVTargetTempSensor(SensorEntity):
         self._attr_icon = "mdi:target"
         self._attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
         self._attr_device_class = "temperature"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
 
     @property
     def state(self):
         """Return the TRV target temperature."""
-        return self._climate_entity._trv_target_temps.get(self._trv_index)
+        return self._get_value()
 
-    async def async_update(self):
-        """Update the sensor."""
-        pass
+    def _get_value(self):
+        """Compute the value from the climate entity."""
+        return self._climate_entity._trv_target_temps.get(self._trv_index)
 
 
-class SimpleThermostatTRVValvePositionSensor(SensorEntity):
+class SimpleThermostatTRVValvePositionSensor(SimpleThermostatDiagnosticEntity, SensorEntity):
     """Sensor showing TRV valve position."""
 
     def __init__(self, climate_entity, trv_index):
@@ -185,19 +249,20 @@ class SimpleThermostatTRVValvePositionSensor(SensorEntity):
         self._attr_icon = "mdi:valve"
         self._attr_native_unit_of_measurement = "%"
         self._attr_device_class = None
+        self._attr_state_class = SensorStateClass.MEASUREMENT
 
     @property
     def state(self):
         """Return the valve position."""
-        valve_entity = self._climate_entity._valve_entities[self._trv_index]
-        return self._climate_entity._valve_positions.get(valve_entity, 0)
+        return self._get_value()
 
-    async def async_update(self):
-        """Update the sensor."""
-        pass
+    def _get_value(self):
+        """Compute the value from the climate entity."""
+        valve_entity = _get_trv_valve_entity(self._climate_entity, self._trv_index)
+        return self._climate_entity._valve_positions.get(valve_entity, 0)
 
 
-class SimpleThermostatTRVHeatingBinarySensor(BinarySensorEntity):
+class SimpleThermostatTRVHeatingBinarySensor(SimpleThermostatDiagnosticEntity, BinarySensorEntity):
     """Binary sensor showing if this TRV is heating."""
 
     def __init__(self, climate_entity, trv_index):
@@ -213,9 +278,97 @@ class SimpleThermostatTRVHeatingBinarySensor(BinarySensorEntity):
     @property
     def is_on(self):
         """Return true if this TRV is heating."""
-        valve_entity = self._climate_entity._valve_entities[self._trv_index]
+        return self._get_value()
+
+    def _get_value(self):
+        """Compute the value from the climate entity."""
+        valve_entity = _get_trv_valve_entity(self._climate_entity, self._trv_index)
         return self._climate_entity._valve_positions.get(valve_entity, 0) > 0
 
-    async def async_update(self):
-        """Update the sensor."""
-        pass
\ No newline at end of file
+
+class SimpleThermostatTRVSummarySensor(SimpleThermostatDiagnosticEntity, SensorEntity):
+    """Sensor carrying the values of all TRVs of a room (compact diagnostics).
+
+    State is the highest valve position; per-TRV values are attributes.
+    """
+
+    def __init__(self, climate_entity):
+        """Initialize the sensor."""
+        self._climate_entity = climate_entity
+        self._attr_name = f"{climate_entity.name} TRVs"
+        self._attr_unique_id = f"{climate_entity.unique_id}_trvs"
+        self._attr_icon = "mdi:radiator"
+        self._attr_native_unit_of_measurement = "%"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def state(self):
+        """Return the highest valve position of the room."""
+        positions = [
+            value for key, value in self._get_value().items() if key.endswith("_valve_position")
+        ]
+        return max(positions, default=0)
+
+    @property
+    def extra_state_attributes(self):
+        """Return internal temp, target temp, valve position and heating per TRV."""
+        return self._get_value()
+
+    def _get_value(self):
+        """Compute the value from the climate entity."""
+        values = {}
+        for idx in range(len(self._climate_entity._climate_entities)):
+            trv_suffix = _get_trv_suffix(self._climate_entity, idx)
+            values[f"{trv_suffix}_internal_temp"] = self._climate_entity._trv_internal_temps.get(idx)
+            values[f"{trv_suffix}_target_temp"] = self._climate_entity._trv_target_temps.get(idx)
+            valve_entity = _get_trv_valve_entity(self._climate_entity, idx)
+            if valve_entity is None:
+                # Profile without a valve entity - position and heating unknown
+                continue
+            position = self._climate_entity._valve_positions.get(valve_entity, 0)
+            values[f"{trv_suffix}_valve_position"] = position
+            values[f"{trv_suffix}_heating"] = position > 0
+        return values
+
+
+class SimpleThermostatMetricsSensor(SimpleThermostatDiagnosticEntity, SensorEntity):
+    """Sensor carrying the control loop metrics of a room.
+
+    State is the number of TRV service calls in the last hour; latency
+    histograms and command counters are attributes.
+    """
+
+    # Histograms change with every cycle; keep them out of the recorder
+    _unrecorded_attributes = frozenset(
+        {
+            "control_cycle_ms",
+            "event_to_command_ms",
+            "service_call_ms",
+            "binary_heat_ms",
+            "binary_cool_ms",
+            "proportional_ms",
+        }
+    )
+
+    def __init__(self, climate_entity):
+        """Initialize the sensor."""
+        self._climate_entity = climate_entity
+        self._attr_name = f"{climate_entity.name} Control Metrics"
+        self._attr_unique_id = f"{climate_entity.unique_id}_control_metrics"
+        self._attr_icon = "mdi:speedometer"
+        self._attr_native_unit_of_measurement = "calls/h"
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+
+    @property
+    def state(self):
+        """Return the service calls of the last hour."""
+        return self._get_value()["service_calls_per_hour"]
+
+    @property
+    def extra_state_attributes(self):
+        """Return latency histograms and command counters."""
+        return self._get_value()
+
+    def _get_value(self):
+        """Compute the value from the climate entity."""
+        return self._climate_entity.get_metrics()
@@ -0,0 +1,82 @@
+"""Sensor Registry - Loads the diagnostic entity platforms once for all rooms."""
+import logging
+from typing import Callable
+
+from homeassistant.components.binary_sensor import BinarySensorEntity
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.discovery import async_load_platform
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_SENSOR_REGISTRY = "sensor_registry"
+
+PLATFORM_SENSOR = "sensor"
+PLATFORM_BINARY_SENSOR = "binary_sensor"
+
+
+@callback
+def async_get_sensor_registry(hass: HomeAssistant) -> "SensorRegistry":
+    """Return the domain-wide sensor registry, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    registry = domain_data.get(DATA_SENSOR_REGISTRY)
+    if registry is None:
+        registry = SensorRegistry(hass)
+        domain_data[DATA_SENSOR_REGISTRY] = registry
+    return registry
+
+
+class SensorRegistry:
+    """Collects the diagnostic entities of all rooms.
+
+    The first room triggers one platform load per platform. Entities of rooms
+    set up while the platform is loading are queued and added in one batch;
+    rooms set up afterwards are added directly to the loaded platform.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize the registry."""
+        self.hass = hass
+        self._pending: dict[str, list] = {PLATFORM_SENSOR: [], PLATFORM_BINARY_SENSOR: []}
+        self._add_entities: dict[str, Callable] = {}
+        self._loading: set[str] = set()
+
+        # Statistics
+        self.platform_loads = 0
+
+    @callback
+    def async_add_sensors(self, sensors: list, hass_config: dict):
+        """Add diagnostic entities of a room, loading the platforms if needed."""
+        by_platform = {
+            PLATFORM_SENSOR: [s for s in sensors if isinstance(s, SensorEntity)],
+            PLATFORM_BINARY_SENSOR: [s for s in sensors if isinstance(s, BinarySensorEntity)],
+        }
+
+        for platform, entities in by_platform.items():
+            if not entities:
+                continue
+
+            if platform in self._add_entities:
+                self._add_entities[platform](entities)
+                continue
+
+            self._pending[platform].extend(entities)
+            if platform not in self._loading:
+                self._loading.add(platform)
+                self.platform_loads += 1
+                self.hass.async_create_task(
+                    async_load_platform(self.hass, platform, DOMAIN, {}, hass_config)
+                )
+
+    @callback
+    def async_register_platform(self, platform: str, async_add_entities: Callable):
+        """Called by a loaded platform; adds everything queued so far in one batch."""
+        self._add_entities[platform] = async_add_entities
+        self._loading.discard(platform)
+
+        pending, self._pending[platform] = self._pending[platform], []
+        if pending:
+            _LOGGER.debug("Adding %d %s entities in one batch", len(pending), platform)
+            async_add_entities(pending)
@@ -0,0 +1,102 @@
+"""State Store - Persists controller state for fast warm restarts."""
+import asyncio
+import logging
+from typing import Callable, Optional
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.state"
+
+# Seconds to collect changes from all rooms before writing the file
+SAVE_DELAY = 10
+
+DATA_STATE_STORE = "state_store"
+
+
+async def async_get_state_store(hass: HomeAssistant) -> "ThermostatStateStore":
+    """Return the loaded domain-wide state store, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    state_store = domain_data.get(DATA_STATE_STORE)
+    if state_store is None:
+        state_store = ThermostatStateStore(hass)
+        domain_data[DATA_STATE_STORE] = state_store
+
+    await state_store.async_load()
+    return state_store
+
+
+class ThermostatStateStore:
+    """One ``.storage`` file holding the controller state of every room.
+
+    Rooms register a provider that returns a JSON-serializable snapshot and
+    call async_schedule_save() whenever something worth persisting changed.
+    All requests inside SAVE_DELAY collapse into one write, and snapshots are
+    only taken when the file is actually written.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        """Initialize the state store."""
+        self.hass = hass
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._data: dict[str, dict] = {}
+        self._providers: dict[str, Callable[[], dict]] = {}
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+        self._save_pending = False
+
+    async def async_load(self):
+        """Load the file once (safe to call from many rooms concurrently)."""
+        async with self._load_lock:
+            if self._loaded:
+                return
+
+            data = await self._store.async_load()
+            if isinstance(data, dict):
+                self._data = data.get("rooms", {})
+            self._loaded = True
+            _LOGGER.debug("Loaded stored state for %d rooms", len(self._data))
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the stored snapshot for a room, if any."""
+        return self._data.get(key)
+
+    @callback
+    def async_register(self, key: str, provider: Callable[[], dict]) -> CALLBACK_TYPE:
+        """Register a snapshot provider for a room; returns an unregister callback."""
+        self._providers[key] = provider
+
+        @callback
+        def _async_unregister():
+            if self._providers.get(key) is provider:
+                # Keep the final snapshot of the room in the file
+                self._data[key] = provider()
+                del self._providers[key]
+                self.async_schedule_save()
+
+        return _async_unregister
+
+    @callback
+    def async_schedule_save(self):
+        """Request a (batched, delayed) write of all rooms."""
+        if self._save_pending:
+            return
+
+        self._save_pending = True
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict:
+        """Collect fresh snapshots from all registered rooms."""
+        self._save_pending = False
+        for key, provider in self._providers.items():
+            try:
+                self._data[key] = provider()
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Failed to snapshot state of %s", key)
+        return {"rooms": self._data}
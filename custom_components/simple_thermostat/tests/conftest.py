@@ -46,7 +46,7 @@ def basic_schedule_config():
 
 @pytest.fixture
 def mock_datetime(monkeypatch):
-    """Mock datetime.now() for testing."""
+    """Mock dt_util.now() for testing."""
     class MockDatetime:
         _now = datetime(2024, 1, 15, 12, 0)  # Monday, Jan 15, 2024, 12:00 PM
 
@@ -58,5 +58,5 @@ def mock_datetime(monkeypatch):
         def set_time(cls, dt: datetime):
             cls._now = dt
 
-    monkeypatch.setattr("custom_components.simple_thermostat.preset_manager.datetime", MockDatetime)
+    monkeypatch.setattr("homeassistant.util.dt.now", MockDatetime.now)
     return MockDatetime
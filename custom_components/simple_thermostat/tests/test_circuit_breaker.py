@@ -0,0 +1,126 @@
+"""Tests for the per-TRV circuit breakers."""
+import asyncio
+from datetime import timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from .. import circuit_breaker
+from ..circuit_breaker import (
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreakers,
+)
+
+
+@pytest.fixture
+def mock_clock(monkeypatch):
+    """Control the monotonic clock used by the breakers."""
+    class MockClock:
+        now = 1000.0
+
+        @classmethod
+        def monotonic(cls):
+            return cls.now
+
+    monkeypatch.setattr(circuit_breaker, "monotonic", MockClock.monotonic)
+    return MockClock
+
+
+class TestBreakerStates:
+    """Test opening, probing and closing."""
+
+    def test_opens_after_threshold(self, mock_clock):
+        """Test the breaker opens after consecutive failures."""
+        breakers = CircuitBreakers("Test", failure_threshold=3)
+
+        breakers.record_failure("climate.trv")
+        breakers.record_failure("climate.trv")
+        assert breakers.allow("climate.trv")
+
+        breakers.record_failure("climate.trv")
+        assert breakers.get_state("climate.trv") == STATE_OPEN
+        assert not breakers.allow("climate.trv")
+
+    def test_success_resets_count(self, mock_clock):
+        """Test a success in between keeps the breaker closed."""
+        breakers = CircuitBreakers("Test", failure_threshold=2)
+
+        breakers.record_failure("climate.trv")
+        breakers.record_success("climate.trv")
+        breakers.record_failure("climate.trv")
+
+        assert breakers.get_state("climate.trv") == STATE_CLOSED
+
+    def test_half_open_after_reset_timeout(self, mock_clock):
+        """Test a probe is let through after the reset timeout."""
+        breakers = CircuitBreakers(
+            "Test", failure_threshold=1, reset_timeout=timedelta(minutes=5)
+        )
+        breakers.record_failure("climate.trv")
+
+        mock_clock.now += 300
+        assert breakers.get_state("climate.trv") == STATE_HALF_OPEN
+        assert breakers.allow("climate.trv")
+
+    def test_failed_probe_reopens(self, mock_clock):
+        """Test a failed probe opens the breaker for another period."""
+        breakers = CircuitBreakers(
+            "Test", failure_threshold=3, reset_timeout=timedelta(minutes=5)
+        )
+        for _ in range(3):
+            breakers.record_failure("climate.trv")
+        mock_clock.now += 300
+
+        breakers.record_failure("climate.trv")
+
+        assert breakers.get_state("climate.trv") == STATE_OPEN
+
+    def test_successful_probe_closes(self, mock_clock):
+        """Test a successful probe closes the breaker."""
+        breakers = CircuitBreakers("Test", failure_threshold=1)
+        breakers.record_failure("climate.trv")
+        mock_clock.now += 300
+
+        breakers.record_success("climate.trv")
+
+        assert breakers.get_state("climate.trv") == STATE_CLOSED
+
+
+    @pytest.mark.asyncio
+    async def test_half_open_is_reported(self):
+        """Test the update callback runs when an open breaker turns half-open."""
+        update_callback = Mock()
+        breakers = CircuitBreakers(
+            "Test",
+            failure_threshold=1,
+            reset_timeout=timedelta(seconds=0.01),
+            update_callback=update_callback,
+        )
+        breakers.record_failure("climate.dead")
+        breakers.record_failure("climate.flaky")
+        breakers.record_success("climate.flaky")
+
+        await asyncio.sleep(0.05)
+
+        update_callback.assert_called_once()
+        assert breakers.get_state("climate.dead") == STATE_HALF_OPEN
+
+
+class TestStats:
+    """Test diagnostics."""
+
+    def test_stats(self, mock_clock):
+        """Test states, failure counts and skipped calls are reported."""
+        breakers = CircuitBreakers("Test", failure_threshold=1)
+        breakers.record_failure("climate.dead")
+        breakers.record_failure("climate.flaky")
+        breakers.record_success("climate.flaky")
+        breakers.allow("climate.dead")
+
+        assert breakers.get_stats() == {
+            "trv_breakers": {"climate.dead": STATE_OPEN, "climate.flaky": STATE_CLOSED},
+            "trv_failures": {"climate.dead": 1, "climate.flaky": 1},
+            "commands_breaker_skipped": 1,
+        }
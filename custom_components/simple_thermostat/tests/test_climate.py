@@ -1,8 +1,11 @@
 """Tests for Simple Thermostat climate entity."""
+import asyncio
 import pytest
+from datetime import timedelta
 from unittest.mock import Mock, AsyncMock, patch, call
 from homeassistant.components.climate import HVACMode
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.helpers import entity_registry as er
 
 from ..climate import (
     SimpleThermostat,
@@ -15,6 +18,12 @@ from ..climate import (
     CONTROL_MODE_PROPORTIONAL,
     CONTROL_MODE_OFF,
 )
+from .. import circuit_breaker as circuit_breaker_module
+from .. import climate as climate_module
+from .. import metrics as metrics_module
+from ..confirmation import ConfirmationTracker
+from ..profiles import PROFILE_GENERIC, get_profile
+from ..scheduler import PRIORITY_CONTROL, PRIORITY_SAFETY
 
 
 @pytest.fixture
@@ -27,6 +36,8 @@ def mock_hass():
     hass.services.async_call = AsyncMock()
     hass.bus = Mock()
     hass.bus.async_listen = Mock()
+    # Empty entity registry: TRV friendly names fall back to the entity object id
+    hass.data = {er.DATA_REGISTRY: Mock(async_get=Mock(return_value=None))}
     return hass
 
 
@@ -174,6 +185,45 @@ class TestControlLogic:
         )
 
 
+    @pytest.mark.asyncio
+    async def test_binary_heat_batches_multiple_trvs(self, thermostat, mock_hass):
+        """Test TRVs receiving the same value share one service call."""
+        thermostat._valve_entities = ["number.valve_1", "number.valve_2"]
+        thermostat._climate_entities = ["climate.trv_1", "climate.trv_2"]
+        thermostat._enabled = True
+        thermostat._hvac_mode = HVACMode.HEAT
+        thermostat._cur_temp = 18.0
+        thermostat._target_temp = 21.0
+
+        await thermostat._async_control_heating()
+
+        assert mock_hass.services.async_call.call_count == 2
+        mock_hass.services.async_call.assert_any_call(
+            "number",
+            "set_value",
+            {"entity_id": ["number.valve_1", "number.valve_2"], "value": 100},
+            blocking=True
+        )
+        assert thermostat._confirmations.get_commanded("climate.trv_1") == 30
+        assert thermostat._confirmations.get_commanded("climate.trv_2") == 30
+
+    @pytest.mark.asyncio
+    async def test_repeated_cycle_skips_redundant_commands(self, thermostat, mock_hass):
+        """Test a second identical control cycle sends nothing."""
+        thermostat._enabled = True
+        thermostat._hvac_mode = HVACMode.HEAT
+        thermostat._cur_temp = 18.0
+        thermostat._target_temp = 21.0
+
+        await thermostat._async_control_heating()
+        sent = mock_hass.services.async_call.call_count
+        await thermostat._async_control_heating()
+
+        assert mock_hass.services.async_call.call_count == sent
+        attrs = thermostat.extra_state_attributes
+        assert attrs["commands_sent"] == 2
+        assert attrs["commands_skipped"] == 2
+
     @pytest.mark.asyncio
     async def test_no_heating_when_disabled(self, thermostat, mock_hass):
         """Test that no heating occurs when thermostat is disabled."""
@@ -198,6 +248,321 @@ class TestControlLogic:
         assert not mock_hass.services.async_call.called
 
 
+class TestDeviceProfiles:
+    """Test commands follow the TRV device profile."""
+
+    @pytest.mark.asyncio
+    async def test_proportional_target_quantized(self, thermostat, mock_hass):
+        """Test proportional targets are rounded to the device step."""
+        thermostat._enabled = True
+        thermostat._hvac_mode = HVACMode.HEAT
+        thermostat._cur_temp = 20.7
+        thermostat._target_temp = 21.0
+        thermostat._trv_internal_temps = {0: 22.0}
+        # (21 - 20.7) + 22 = 22.3 → 22.5
+
+        await thermostat._async_control_heating()
+
+        mock_hass.services.async_call.assert_any_call(
+            "climate",
+            "set_temperature",
+            {"entity_id": "climate.test_trv", "temperature": 22.5},
+            blocking=True
+        )
+        assert thermostat._confirmations.get_commanded("climate.test_trv") == 22.5
+
+    @pytest.mark.asyncio
+    async def test_change_rounded_away_is_not_sent(self, thermostat, mock_hass):
+        """Test a target change the device would round away sends nothing."""
+        thermostat._enabled = True
+        thermostat._hvac_mode = HVACMode.HEAT
+        thermostat._cur_temp = 20.7
+        thermostat._target_temp = 21.0
+        thermostat._trv_internal_temps = {0: 22.0}
+        await thermostat._async_control_heating()
+        sent = mock_hass.services.async_call.call_count
+
+        thermostat._cur_temp = 20.6  # 22.4 → still 22.5
+        await thermostat._async_control_heating()
+
+        assert mock_hass.services.async_call.call_count == sent
+
+    def test_valves_aligned_per_trv(self, mock_hass, mock_preset_manager):
+        """Test a TRV without a valve entity keeps the valve list aligned."""
+        with patch.object(climate_module, "PresetManager", return_value=mock_preset_manager):
+            thermo = SimpleThermostat(
+                hass=mock_hass,
+                name="Mixed",
+                temp_sensor="sensor.test_temp",
+                valve_entities=[None, "number.b_pi_heating_demand"],
+                climate_entities=["climate.a", "climate.b"],
+                away_temp=16.0,
+                present_temp=21.0,
+                cosy_temp=23.0,
+                binary_threshold=0.5,
+                hysteresis=0.3,
+                sync_remote_temp=False,
+                initial_preset=PRESET_PRESENT,
+                unique_id="mixed",
+                trv_profiles=[PROFILE_GENERIC, "bosch_bth_ra"],
+            )
+
+        assert thermo._trv_valve_entities == [None, "number.b_pi_heating_demand"]
+        assert thermo._valve_entities == ["number.b_pi_heating_demand"]
+
+    @pytest.mark.asyncio
+    async def test_generic_profile_skips_mqtt(self, thermostat, mock_hass):
+        """Test TRVs without MQTT access get no manual mode or remote temperature."""
+        thermostat._trv_profiles = [get_profile(PROFILE_GENERIC)]
+        thermostat._cur_temp = 20.0
+
+        await thermostat._async_initialize_trvs()
+        await thermostat._async_sync_remote_temperature()
+
+        domains = [c.args[0] for c in mock_hass.services.async_call.call_args_list]
+        assert "mqtt" not in domains
+        assert "climate" in domains
+
+
+class TestRemoteTemperatureSync:
+    """Test the delta and keep-alive policy for the remote temperature."""
+
+    @pytest.fixture
+    def syncing(self, thermostat):
+        """Return a thermostat with a mocked transport and a room temperature."""
+        thermostat._transport = Mock(async_send_remote_temperature=AsyncMock())
+        thermostat._cur_temp = 20.0
+        return thermostat
+
+    @pytest.mark.asyncio
+    async def test_first_value_is_sent(self, syncing):
+        """Test the first known temperature is sent."""
+        await syncing._async_sync_remote_temperature()
+
+        syncing._transport.async_send_remote_temperature.assert_awaited_once()
+        assert syncing._transport.async_send_remote_temperature.call_args.args[1] == 20.0
+
+    @pytest.mark.asyncio
+    async def test_small_change_is_not_sent(self, syncing):
+        """Test changes below the delta wait for the keep-alive."""
+        await syncing._async_sync_remote_temperature()
+        syncing._cur_temp = 20.1
+
+        await syncing._async_sync_remote_temperature()
+
+        assert syncing._transport.async_send_remote_temperature.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_large_change_is_sent_immediately(self, syncing):
+        """Test a jump of at least the delta is sent right away."""
+        await syncing._async_sync_remote_temperature()
+        syncing._cur_temp = 21.0
+
+        await syncing._async_sync_remote_temperature()
+
+        assert syncing._transport.async_send_remote_temperature.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_keep_alive_before_device_timeout(self, syncing):
+        """Test an unchanged value is re-sent before the device falls back."""
+        await syncing._async_sync_remote_temperature()
+
+        syncing._remote_temp_sent_at -= timedelta(minutes=24)
+        await syncing._async_sync_remote_temperature()
+        assert syncing._transport.async_send_remote_temperature.await_count == 1
+
+        syncing._remote_temp_sent_at -= timedelta(minutes=1)
+        await syncing._async_sync_remote_temperature()
+        assert syncing._transport.async_send_remote_temperature.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unsupported_profile_skipped(self, syncing):
+        """Test rooms without remote temperature support send nothing."""
+        syncing._trv_profiles = [get_profile(PROFILE_GENERIC)]
+
+        await syncing._async_sync_remote_temperature()
+
+        syncing._transport.async_send_remote_temperature.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_sensor_change_triggers_sync(self, syncing, mock_hass, mock_state):
+        """Test a room sensor update checks the delta without waiting for the timer."""
+        syncing._sync_remote_temp = True
+        syncing._async_sync_remote_temperature = Mock()
+        syncing._control_actor.request = Mock()
+        syncing.async_write_ha_state = Mock()
+        mock_hass.states.get.return_value = mock_state("sensor.test_temp", "21.0")
+
+        await syncing._async_temp_sensor_changed(
+            Mock(data={"new_state": mock_state("sensor.test_temp", "21.0")})
+        )
+
+        syncing._async_sync_remote_temperature.assert_called_once()
+        mock_hass.async_create_task.assert_called_once()
+
+
+class TestModeHysteresis:
+    """Test hysteresis and minimum dwell time of control mode switches."""
+
+    @pytest.fixture
+    def heating(self, thermostat):
+        """Return a thermostat that is in binary heat mode."""
+        thermostat._enabled = True
+        thermostat._hvac_mode = HVACMode.HEAT
+        thermostat._target_temp = 21.0
+        thermostat._trv_internal_temps = {0: 21.0}
+        thermostat._cur_temp = 20.0
+        return thermostat
+
+    @pytest.mark.asyncio
+    async def test_binary_heat_held_inside_band(self, heating):
+        """Test binary heat is kept until the error drops below threshold - hysteresis."""
+        await heating._async_control_heating()
+        assert heating.control_mode == CONTROL_MODE_BINARY_HEAT
+
+        # Error 0.4 is inside the threshold but not by the 0.3 hysteresis
+        heating._cur_temp = 20.6
+        await heating._async_control_heating()
+        assert heating.control_mode == CONTROL_MODE_BINARY_HEAT
+
+        # Error 0.1 < 0.5 - 0.3 → proportional
+        heating._cur_temp = 20.9
+        await heating._async_control_heating()
+        assert heating.control_mode == CONTROL_MODE_PROPORTIONAL
+
+        attrs = heating.extra_state_attributes
+        assert attrs["mode_switches"] == 1
+        assert attrs["mode_switches_held"] == 1
+
+    @pytest.mark.asyncio
+    async def test_binary_cool_held_inside_band(self, heating):
+        """Test binary cool is kept until the error rises above -(threshold - hysteresis)."""
+        heating._cur_temp = 22.0
+        await heating._async_control_heating()
+        assert heating.control_mode == CONTROL_MODE_BINARY_COOL
+
+        heating._cur_temp = 21.3
+        await heating._async_control_heating()
+        assert heating.control_mode == CONTROL_MODE_BINARY_COOL
+
+        heating._cur_temp = 21.1
+        await heating._async_control_heating()
+        assert heating.control_mode == CONTROL_MODE_PROPORTIONAL
+
+    @pytest.mark.asyncio
+    async def test_oscillation_around_threshold_does_not_flip(self, heating, mock_hass):
+        """Test readings hovering around the threshold keep one mode and send nothing new."""
+        await heating._async_control_heating()
+        sent = mock_hass.services.async_call.call_count
+
+        for cur_temp in (20.55, 20.45, 20.55, 20.45):
+            heating._cur_temp = cur_temp
+            await heating._async_control_heating()
+
+        assert heating.control_mode == CONTROL_MODE_BINARY_HEAT
+        assert mock_hass.services.async_call.call_count == sent
+        assert heating.extra_state_attributes["mode_switches"] == 0
+        assert heating.extra_state_attributes["mode_switches_held"] == 2
+
+    @pytest.mark.asyncio
+    async def test_held_switch_counted_once(self, heating):
+        """Test cycles that keep holding back the same switch count as one prevented switch."""
+        await heating._async_control_heating()
+
+        for cur_temp in (20.6, 20.65, 20.6):
+            heating._cur_temp = cur_temp
+            await heating._async_control_heating()
+
+        assert heating.control_mode == CONTROL_MODE_BINARY_HEAT
+        assert heating.extra_state_attributes["mode_switches_held"] == 1
+
+    @pytest.mark.asyncio
+    async def test_min_dwell_keeps_mode(self, heating):
+        """Test a mode is kept for the minimum dwell time."""
+        heating._min_mode_dwell = timedelta(minutes=5)
+        await heating._async_control_heating()
+
+        heating._cur_temp = 20.9
+        await heating._async_control_heating()
+        assert heating.control_mode == CONTROL_MODE_BINARY_HEAT
+
+        heating._mode_entered_at -= timedelta(minutes=6)
+        await heating._async_control_heating()
+        assert heating.control_mode == CONTROL_MODE_PROPORTIONAL
+
+    @pytest.mark.asyncio
+    async def test_no_dwell_after_turn_off(self, heating):
+        """Test the first cycle after OFF picks the mode for the error directly."""
+        heating._min_mode_dwell = timedelta(minutes=5)
+        await heating._async_control_heating()
+        heating.control_mode = CONTROL_MODE_OFF
+
+        heating._cur_temp = 20.9
+        await heating._async_control_heating()
+
+        assert heating.control_mode == CONTROL_MODE_PROPORTIONAL
+        assert heating.extra_state_attributes["mode_switches"] == 0
+
+
+class TestControlTriggers:
+    """Test that control triggers go through the control actor."""
+
+    @pytest.mark.asyncio
+    async def test_temp_change_queues_control(self, thermostat, mock_hass, mock_state):
+        """Test sensor updates queue a debounced evaluation instead of running it."""
+        thermostat._hvac_mode = HVACMode.HEAT
+        thermostat._control_actor.request = Mock()
+        thermostat.async_write_ha_state = Mock()
+        event = Mock()
+        event.data = {"new_state": mock_state("sensor.test_temp", "20.5")}
+
+        await thermostat._async_temp_sensor_changed(event)
+
+        thermostat._control_actor.request.assert_called_once_with()
+        assert not mock_hass.services.async_call.called
+
+    @pytest.mark.asyncio
+    async def test_set_temperature_runs_control(self, thermostat, mock_hass):
+        """Test async_set_temperature evaluates control before returning."""
+        thermostat._enabled = True
+        thermostat._hvac_mode = HVACMode.HEAT
+        thermostat._cur_temp = 18.0
+        thermostat.async_write_ha_state = Mock()
+
+        await thermostat.async_set_temperature(temperature=21.0)
+
+        assert thermostat.control_mode == CONTROL_MODE_BINARY_HEAT
+        thermostat.async_write_ha_state.assert_called()
+
+
+class TestPresetChangeNotification:
+    """Test reaction to PresetManager change notifications."""
+
+    def test_override_change_requests_immediate_control(self, thermostat):
+        """Test an override change updates the preset and skips the debounce."""
+        thermostat._preset_manager = Mock()
+        thermostat._preset_manager.get_active_preset = Mock(return_value=PRESET_OFF)
+        thermostat._preset_manager.get_override_status = Mock(return_value={})
+        thermostat._control_actor.request = Mock()
+        thermostat.async_write_ha_state = Mock()
+
+        thermostat._async_active_preset_changed()
+
+        assert thermostat.preset_mode == PRESET_OFF
+        assert thermostat.target_temperature == 5.0
+        thermostat._control_actor.request.assert_called_once_with(immediate=True)
+
+    def test_unchanged_preset_does_nothing(self, thermostat):
+        """Test a notification for the current preset is ignored."""
+        thermostat._preset_manager = Mock()
+        thermostat._preset_manager.get_active_preset = Mock(return_value=PRESET_PRESENT)
+        thermostat._control_actor.request = Mock()
+
+        thermostat._async_active_preset_changed()
+
+        thermostat._control_actor.request.assert_not_called()
+
+
 class TestValvePositionReading:
     """Test reading valve positions from number entities."""
 
@@ -264,3 +629,575 @@ class TestExtraStateAttributes:
 
         assert "valve_positions" in attrs
         assert attrs["valve_positions"]["number.test_valve"] == 75.0
+
+
+class TestPushStateTracking:
+    """Test event-driven valve and TRV tracking."""
+
+    @pytest.mark.asyncio
+    async def test_valve_event_updates_position(self, thermostat, mock_state):
+        """Test a valve state change updates the position and writes state."""
+        thermostat._hvac_mode = HVACMode.HEAT
+        thermostat.async_write_ha_state = Mock()
+        event = Mock()
+        event.data = {
+            "entity_id": "number.test_valve",
+            "new_state": mock_state("number.test_valve", "40"),
+        }
+
+        await thermostat._async_valve_state_changed(event)
+
+        assert thermostat._valve_positions["number.test_valve"] == 40.0
+        thermostat.async_write_ha_state.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_unchanged_valve_event_skips_write(self, thermostat, mock_state):
+        """Test an unchanged valve value does not write state."""
+        thermostat._valve_positions = {"number.test_valve": 40.0}
+        thermostat.async_write_ha_state = Mock()
+        event = Mock()
+        event.data = {
+            "entity_id": "number.test_valve",
+            "new_state": mock_state("number.test_valve", "40"),
+        }
+
+        await thermostat._async_valve_state_changed(event)
+
+        thermostat.async_write_ha_state.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_open_valve_while_off_forces_closed(
+        self, thermostat, mock_hass, mock_state
+    ):
+        """Test the OFF safety check runs on the valve event itself."""
+        thermostat._hvac_mode = HVACMode.OFF
+        thermostat.async_write_ha_state = Mock()
+        event = Mock()
+        event.data = {
+            "entity_id": "number.test_valve",
+            "new_state": mock_state("number.test_valve", "60"),
+        }
+
+        await thermostat._async_valve_state_changed(event)
+
+        mock_hass.services.async_call.assert_any_call(
+            "number",
+            "set_value",
+            {"entity_id": "number.test_valve", "value": 0},
+            blocking=True
+        )
+
+    @pytest.mark.asyncio
+    async def test_trv_event_updates_temps(self, thermostat, mock_state):
+        """Test a TRV state change updates internal and target temps."""
+        thermostat.async_write_ha_state = Mock()
+        state = mock_state(
+            "climate.test_trv", "heat", {"current_temperature": 19.5, "temperature": 22.0}
+        )
+        event = Mock()
+        event.data = {"entity_id": "climate.test_trv", "new_state": state}
+
+        await thermostat._async_trv_state_changed(event)
+        await thermostat._async_trv_state_changed(event)
+
+        assert thermostat._trv_internal_temps[0] == 19.5
+        assert thermostat._trv_target_temps[0] == 22.0
+        thermostat.async_write_ha_state.assert_called_once()
+
+
+class TestPersistedState:
+    """Test the snapshot used for fast warm restarts."""
+
+    def test_snapshot_round_trip(self, thermostat, mock_preset_manager):
+        """Test a snapshot restores preset temps, TRV values and history."""
+        thermostat._preset_manager = mock_preset_manager
+        thermostat._hvac_mode = HVACMode.HEAT
+        thermostat._cosy_temp = 24.0
+        thermostat._valve_positions = {"number.test_valve": 40.0}
+        thermostat._trv_internal_temps = {0: 19.5}
+        thermostat._trv_target_temps = {0: 22.0}
+        thermostat._initialized_trvs = {"climate.test_trv"}
+        thermostat._confirmations.restore_commanded({"climate.test_trv": 22.0})
+        thermostat._action_history = [{"time": "12:00:00", "message": "Test"}]
+        mock_preset_manager.get_persisted_state = Mock(return_value={"manual_override": "cosy"})
+        snapshot = thermostat._get_persisted_state()
+
+        thermostat._hvac_mode = HVACMode.OFF
+        thermostat._cosy_temp = 23.0
+        thermostat._valve_positions = {}
+        thermostat._trv_internal_temps = {}
+        thermostat._trv_target_temps = {}
+        thermostat._initialized_trvs = set()
+        thermostat._action_history = []
+        thermostat._confirmations = ConfirmationTracker("Test")
+        thermostat._restore_persisted_state(snapshot)
+
+        assert thermostat._hvac_mode == HVACMode.HEAT
+        assert thermostat._cosy_temp == 24.0
+        assert thermostat._valve_positions == {"number.test_valve": 40.0}
+        assert thermostat._trv_internal_temps == {0: 19.5}
+        assert thermostat._trv_target_temps == {0: 22.0}
+        assert thermostat._initialized_trvs == {"climate.test_trv"}
+        assert thermostat._confirmations.get_commanded("climate.test_trv") == 22.0
+        assert thermostat._action_history == [{"time": "12:00:00", "message": "Test"}]
+        mock_preset_manager.restore_state.assert_called_once_with({"manual_override": "cosy"})
+
+    def test_changed_yaml_preset_temps_win(self, thermostat):
+        """Test a stored preset temp is ignored once its YAML value changes."""
+        snapshot = thermostat._get_persisted_state()
+        snapshot["configured_preset_temps"] = [16.0, 21.0, 22.0]
+        snapshot["preset_temps"] = [15.0, 21.0, 25.0]
+
+        thermostat._restore_persisted_state(snapshot)
+
+        # Away edit survives, cosy was changed in YAML since the edit
+        assert thermostat._away_temp == 15.0
+        assert thermostat._cosy_temp == 23.0
+
+    @pytest.mark.asyncio
+    async def test_preset_temps_loaded_before_first_cycle(self, thermostat, mock_hass):
+        """Test stored preset temps are applied before the first control cycle."""
+        snapshot = thermostat._get_persisted_state()
+        snapshot["preset_temps"] = [15.0, 20.0, 23.0]
+        state_store = Mock()
+        state_store.get = Mock(return_value=snapshot)
+        thermostat._preset_manager.get_active_preset = Mock(return_value=PRESET_PRESENT)
+        targets = []
+
+        async def _async_update_temp():
+            targets.append(thermostat._target_temp)
+
+        thermostat._async_update_temp = _async_update_temp
+        # No worker task on the mocked hass (its coroutine would never be awaited)
+        thermostat._control_actor.async_start = Mock()
+        with patch.object(
+            climate_module, "async_get_state_store", AsyncMock(return_value=state_store)
+        ), patch.object(climate_module, "async_get_coordinator", Mock()):
+            await thermostat.async_added_to_hass()
+
+        assert targets == [20.0]
+
+    def test_removed_trv_values_are_dropped(self, thermostat):
+        """Test values of TRVs no longer configured are not restored."""
+        snapshot = thermostat._get_persisted_state()
+        snapshot["valve_positions"] = {"number.old_valve": 100}
+        snapshot["trv_target_temps"] = {"climate.old_trv": 30}
+
+        thermostat._restore_persisted_state(snapshot)
+
+        assert thermostat._valve_positions == {}
+        assert thermostat._trv_target_temps == {}
+
+    @pytest.mark.asyncio
+    async def test_initialized_trv_in_expected_state_is_skipped(
+        self, thermostat, mock_hass, mock_state
+    ):
+        """Test TRVs still reporting the last commanded target are not re-initialized."""
+        thermostat._initialized_trvs = {"climate.test_trv"}
+        thermostat._confirmations.restore_commanded({"climate.test_trv": 22.0})
+        mock_hass.states.get.return_value = mock_state(
+            "climate.test_trv", "heat", {"current_temperature": 19.5, "temperature": 22.0}
+        )
+
+        await thermostat._async_initialize_trvs()
+
+        mock_hass.services.async_call.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reset_trv_is_reinitialized(self, thermostat, mock_hass, mock_state):
+        """Test a TRV reporting a different target than last commanded is re-initialized."""
+        thermostat._initialized_trvs = {"climate.test_trv"}
+        thermostat._confirmations.restore_commanded({"climate.test_trv": 22.0})
+        mock_hass.states.get.return_value = mock_state(
+            "climate.test_trv", "heat", {"current_temperature": 19.5, "temperature": 21.0}
+        )
+
+        await thermostat._async_initialize_trvs()
+
+        mock_hass.services.async_call.assert_any_call(
+            "climate",
+            "set_temperature",
+            {"entity_id": "climate.test_trv", "temperature": 30},
+            blocking=True,
+        )
+        assert thermostat._initialized_trvs == {"climate.test_trv"}
+        assert thermostat._confirmations.get_commanded("climate.test_trv") == 30
+
+    @pytest.mark.asyncio
+    async def test_reset_trv_reported_before_init_is_reinitialized(
+        self, thermostat, mock_hass, mock_state
+    ):
+        """Test a reset TRV's startup state event does not make it look initialized."""
+        thermostat._initialized_trvs = {"climate.test_trv"}
+        thermostat._confirmations.restore_commanded({"climate.test_trv": 30.0})
+        state = mock_state(
+            "climate.test_trv", "heat", {"current_temperature": 19.5, "temperature": 21.0}
+        )
+        mock_hass.states.get.return_value = state
+        thermostat._update_trv_from_state(0, state)
+
+        await thermostat._async_initialize_trvs()
+
+        mock_hass.services.async_call.assert_any_call(
+            "climate",
+            "set_temperature",
+            {"entity_id": "climate.test_trv", "temperature": 30},
+            blocking=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_init_is_not_marked_initialized(self, thermostat):
+        """Test a TRV that did not take the init command is initialized again next start."""
+        thermostat._fanout.async_send = AsyncMock(return_value={"climate.test_trv": False})
+
+        await thermostat._async_initialize_trvs()
+
+        assert thermostat._initialized_trvs == set()
+        assert thermostat._confirmations.get_commanded("climate.test_trv") is None
+
+    @pytest.mark.asyncio
+    async def test_init_commands_sent_in_one_fanout(self, thermostat):
+        """Test all TRVs to initialize are sent in a single fan-out."""
+        thermostat._climate_entities = ["climate.trv_1", "climate.trv_2"]
+        thermostat._fanout.async_send = AsyncMock(
+            return_value={"climate.trv_1": True, "climate.trv_2": True}
+        )
+
+        await thermostat._async_initialize_trvs()
+
+        thermostat._fanout.async_send.assert_awaited_once()
+        assert thermostat._fanout.async_send.call_args.args[3] == {
+            "climate.trv_1": 30,
+            "climate.trv_2": 30,
+        }
+        assert thermostat._initialized_trvs == {"climate.trv_1", "climate.trv_2"}
+
+
+class TestCommandPriorities:
+    """Test priority classes used for outbound commands."""
+
+    @pytest.mark.asyncio
+    async def test_turn_off_uses_safety_priority(self, thermostat):
+        """Test shutting everything off goes ahead of queued traffic."""
+        thermostat._fanout.async_send = AsyncMock(return_value={})
+
+        await thermostat._async_turn_off_all()
+
+        priorities = {c.args[4] for c in thermostat._fanout.async_send.call_args_list}
+        assert priorities == {PRIORITY_SAFETY}
+
+    @pytest.mark.asyncio
+    async def test_control_uses_control_priority(self, thermostat):
+        """Test regular control commands use the control priority."""
+        thermostat._fanout.async_send = AsyncMock(return_value={})
+        thermostat._enabled = True
+        thermostat._cur_temp = 18.0
+        thermostat._target_temp = 21.0
+
+        await thermostat._async_control_heating()
+
+        priorities = {c.args[4] for c in thermostat._fanout.async_send.call_args_list}
+        assert priorities == {PRIORITY_CONTROL}
+
+
+class TestUnresponsiveTrvs:
+    """Test dead TRVs are surfaced and skipped."""
+
+    @pytest.mark.asyncio
+    async def test_breaker_state_in_attributes(self, thermostat, mock_hass, monkeypatch):
+        """Test a TRV that keeps failing shows up as an open breaker."""
+        async def _sleep(delay):
+            pass
+
+        monkeypatch.setattr(asyncio, "sleep", _sleep)
+        mock_hass.services.async_call = AsyncMock(side_effect=RuntimeError("offline"))
+        thermostat._enabled = True
+        thermostat._hvac_mode = HVACMode.HEAT
+        thermostat._cur_temp = 18.0
+        thermostat._target_temp = 21.0
+
+        await thermostat._async_control_heating()
+
+        attrs = thermostat.extra_state_attributes
+        assert attrs["trv_breakers"] == {"number.test_valve": "open", "climate.test_trv": "open"}
+        assert attrs["trv_failures"] == {"number.test_valve": 3, "climate.test_trv": 3}
+        assert attrs["command_retries"] == 4
+
+
+class TestConfirmations:
+    """Test commanded values are only trusted once the device reports them."""
+
+    @pytest.fixture
+    def heating(self, thermostat):
+        """Return a thermostat far below its target."""
+        thermostat._enabled = True
+        thermostat._hvac_mode = HVACMode.HEAT
+        thermostat._cur_temp = 18.0
+        thermostat._target_temp = 21.0
+        return thermostat
+
+    @pytest.mark.asyncio
+    async def test_commanded_value_is_not_reported_value(self, heating):
+        """Test sending a command does not change the reported valve position."""
+        heating._valve_positions = {"number.test_valve": 0.0}
+
+        await heating._async_control_heating()
+
+        assert heating._valve_positions == {"number.test_valve": 0.0}
+        assert heating._confirmations.get_commanded("number.test_valve") == 100
+        assert heating._confirmations.is_pending("number.test_valve")
+
+    @pytest.mark.asyncio
+    async def test_state_event_confirms_command(self, heating, mock_state):
+        """Test the matching state change confirms the command and records latency."""
+        await heating._async_control_heating()
+        heating.async_write_ha_state = Mock()
+        state = mock_state("number.test_valve", "100")
+
+        await heating._async_valve_state_changed(
+            Mock(data={"entity_id": "number.test_valve", "new_state": state})
+        )
+
+        assert heating._valve_positions == {"number.test_valve": 100.0}
+        assert not heating._confirmations.is_pending("number.test_valve")
+        attrs = heating.extra_state_attributes
+        assert attrs["commands_confirmed"] == 1
+        assert "number.test_valve" in attrs["trv_confirm_latency_ms"]
+
+
+class TestControlMetrics:
+    """Test control loop instrumentation."""
+
+    @pytest.fixture
+    def heating(self, thermostat, mock_hass, mock_state):
+        """Return a heating thermostat whose sensor reports 18°C."""
+        thermostat._enabled = True
+        thermostat._hvac_mode = HVACMode.HEAT
+        thermostat._target_temp = 21.0
+        thermostat.async_write_ha_state = Mock()
+        thermostat._control_actor.request = Mock()
+        mock_hass.states.get.return_value = mock_state("sensor.test_temp", "18.0")
+        return thermostat
+
+    @pytest.mark.asyncio
+    async def test_temperature_event_to_command(self, heating, mock_state):
+        """Test a cycle after a temperature event records latency, mode time and calls."""
+        await heating._async_temp_sensor_changed(
+            Mock(data={"new_state": mock_state("sensor.test_temp", "18.0")})
+        )
+
+        await heating._async_control_cycle()
+
+        metrics = heating.get_metrics()
+        assert metrics["control_cycles"] == 1
+        assert metrics["control_cycle_ms"]["count"] == 1
+        assert metrics["binary_heat_ms"]["count"] == 1
+        assert metrics["event_to_command_ms"]["count"] == 1
+        assert metrics["commands_sent"] == 2
+        assert metrics["service_calls_per_hour"] == 2
+        assert metrics["control_cycles_overlapped"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cached_and_failed_commands(self, heating, mock_hass, monkeypatch):
+        """Test commands the cache drops count as skipped, rejected ones as failed."""
+        async def _sleep(delay):
+            pass
+
+        monkeypatch.setattr(asyncio, "sleep", _sleep)
+        mock_hass.states.get.return_value = None  # no live state contradicts the cache
+        heating._cur_temp = 18.0
+        await heating._async_control_cycle()
+        await heating._async_control_cycle()
+
+        heating._command_cache._reassert_seconds = 0
+        mock_hass.services.async_call = AsyncMock(side_effect=RuntimeError("offline"))
+        await heating._async_control_cycle()
+
+        metrics = heating.get_metrics()
+        assert metrics["commands_sent"] == 2
+        assert metrics["commands_skipped"] == 2
+        assert metrics["commands_failed"] == 2
+        assert "event_to_command_ms" not in metrics
+
+    @pytest.mark.asyncio
+    async def test_event_while_off_is_not_measured(
+        self, heating, mock_state, monkeypatch
+    ):
+        """Test an event that queued no cycle does not count toward a much later one."""
+        clock = Mock(return_value=1000.0)
+        monkeypatch.setattr(metrics_module, "monotonic", clock)
+        heating._hvac_mode = HVACMode.OFF
+        await heating._async_temp_sensor_changed(
+            Mock(data={"new_state": mock_state("sensor.test_temp", "18.0")})
+        )
+
+        clock.return_value += 7200
+        heating._hvac_mode = HVACMode.HEAT
+        await heating._async_control_cycle()
+
+        metrics = heating.get_metrics()
+        assert metrics["commands_sent"] == 2
+        assert "event_to_command_ms" not in metrics
+
+
+class TestRecorderAttributes:
+    """Test bulky attributes are kept out of the recorder."""
+
+    def test_bulky_attributes_unrecorded(self, thermostat):
+        """Test history, schedule and per-TRV maps are not recorded."""
+        assert {
+            "action_history",
+            "schedule",
+            "valve_positions",
+            "trv_internal_temps",
+            "trv_target_temps",
+        } <= thermostat._unrecorded_attributes
+
+    def test_get_details(self, thermostat):
+        """Test the websocket details contain the unrecorded data."""
+        thermostat._valve_positions = {"number.test_valve": 40.0}
+        thermostat._action_history = [{"time": "12:00:00", "message": f"{i}"} for i in range(15)]
+
+        details = thermostat.get_details()
+
+        assert details["valve_positions"] == {"number.test_valve": 40.0}
+        assert len(details["action_history"]) == 10
+        assert details["trv_names"] == ["Test Valve"]
+
+
+class TestStateWriteSuppression:
+    """Test attribute caching and no-op write suppression."""
+
+    def test_unchanged_state_is_not_written(self, thermostat):
+        """Test a second write with identical state and attributes is skipped."""
+        thermostat.async_write_ha_state = Mock()
+
+        thermostat._async_write_state_if_changed()
+        thermostat._async_write_state_if_changed()
+
+        thermostat.async_write_ha_state.assert_called_once()
+        assert thermostat.extra_state_attributes["state_writes_suppressed"] == 1
+
+    def test_in_place_change_is_written(self, thermostat, mock_state):
+        """Test in-place changes to per-TRV maps are detected."""
+        thermostat.async_write_ha_state = Mock()
+        thermostat._async_write_state_if_changed()
+
+        thermostat._update_valve_from_state(
+            "number.test_valve", mock_state("number.test_valve", "40")
+        )
+        thermostat._async_write_state_if_changed()
+
+        assert thermostat.async_write_ha_state.call_count == 2
+
+    def test_temperature_change_is_written(self, thermostat):
+        """Test a changed room temperature is written."""
+        thermostat.async_write_ha_state = Mock()
+        thermostat._async_write_state_if_changed()
+
+        thermostat._cur_temp = 20.5
+        thermostat._async_write_state_if_changed()
+
+        assert thermostat.async_write_ha_state.call_count == 2
+
+    def test_attributes_are_cached_between_writes(self, thermostat, mock_preset_manager):
+        """Test reading the attributes does not rebuild them until the next write."""
+        thermostat._preset_manager = mock_preset_manager
+        thermostat.async_write_ha_state = Mock()
+        thermostat._async_write_state_if_changed()
+        calls = mock_preset_manager.get_override_status.call_count
+
+        thermostat.extra_state_attributes
+        thermostat.extra_state_attributes
+
+        assert mock_preset_manager.get_override_status.call_count == calls
+
+    @pytest.mark.asyncio
+    async def test_expired_confirmation_is_written(self, thermostat):
+        """Test a command expiring unconfirmed refreshes the attributes without other input."""
+        thermostat.async_write_ha_state = Mock()
+        thermostat._confirmations.expect("climate.test_trv", 22.0)
+        thermostat._async_write_state_if_changed()
+
+        thermostat._confirmations._async_expire("climate.test_trv")
+
+        assert thermostat.async_write_ha_state.call_count == 2
+        assert thermostat.extra_state_attributes["commands_unconfirmed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_half_open_breaker_is_written(self, thermostat):
+        """Test a breaker turning half-open refreshes the attributes without other input."""
+        thermostat.async_write_ha_state = Mock()
+        for _ in range(3):
+            thermostat._breakers.record_failure("climate.test_trv")
+        thermostat._async_write_state_if_changed()
+
+        with patch.object(circuit_breaker_module, "monotonic", Mock(return_value=1e12)):
+            thermostat._breakers._async_half_open("climate.test_trv")
+
+        assert thermostat.async_write_ha_state.call_count == 2
+        assert thermostat.extra_state_attributes["trv_breakers"] == {
+            "climate.test_trv": "half_open"
+        }
+
+    def test_snapshot_rebuilt_only_when_dirty(self, thermostat, mock_state):
+        """Test write attempts without changed inputs reuse the snapshot."""
+        thermostat.async_write_ha_state = Mock()
+        thermostat._async_write_state_if_changed()
+
+        with patch.object(
+            thermostat, "_build_extra_state_attributes", wraps=thermostat._build_extra_state_attributes
+        ) as build:
+            thermostat._async_write_state_if_changed()
+            assert build.call_count == 0
+
+            thermostat._update_valve_from_state(
+            "number.test_valve", mock_state("number.test_valve", "40")
+        )
+            thermostat._async_write_state_if_changed()
+            assert build.call_count == 1
+
+    def test_house_wide_queue_stats_do_not_force_writes(self, thermostat):
+        """Test rate limiting in other rooms does not make this room's state differ."""
+        thermostat.async_write_ha_state = Mock()
+        thermostat._async_write_state_if_changed()
+
+        thermostat._scheduler._queued = 7
+        thermostat._async_write_state_if_changed()
+
+        thermostat.async_write_ha_state.assert_called_once()
+        assert thermostat.extra_state_attributes["commands_rate_limited"] == 7
+
+    def test_override_change_is_written(self, thermostat, mock_preset_manager):
+        """Test a changed override status is picked up without other inputs changing."""
+        thermostat._preset_manager = mock_preset_manager
+        thermostat.async_write_ha_state = Mock()
+        thermostat._async_write_state_if_changed()
+
+        mock_preset_manager.get_override_status.return_value = {
+            **mock_preset_manager.get_override_status.return_value,
+            "window_open": True,
+        }
+        thermostat._async_write_state_if_changed()
+
+        assert thermostat.async_write_ha_state.call_count == 2
+        assert thermostat.extra_state_attributes["window_open"] is True
+
+
+class TestDiagnosticListeners:
+    """Test diagnostic sensors are notified on state writes."""
+
+    def test_listener_called_on_write_only(self, thermostat):
+        """Test listeners run after a real write, not after a suppressed one."""
+        thermostat.async_write_ha_state = Mock()
+        listener = Mock()
+        remove = thermostat.async_add_diagnostic_listener(listener)
+
+        thermostat._async_write_state_if_changed()
+        thermostat._async_write_state_if_changed()
+        assert listener.call_count == 1
+
+        remove()
+        thermostat._cur_temp = 19.0
+        thermostat._async_write_state_if_changed()
+        assert listener.call_count == 1
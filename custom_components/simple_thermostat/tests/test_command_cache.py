@@ -0,0 +1,110 @@
+"""Tests for the command deduplication cache."""
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from .. import command_cache
+from ..command_cache import CommandCache
+from ..confirmation import ConfirmationTracker
+
+
+@pytest.fixture
+def mock_clock(monkeypatch):
+    """Control the monotonic clock used by the cache."""
+    class MockClock:
+        now = 1000.0
+
+        @classmethod
+        def monotonic(cls):
+            return cls.now
+
+    monkeypatch.setattr(command_cache, "monotonic", MockClock.monotonic)
+    return MockClock
+
+
+class TestFiltering:
+    """Test which commands are skipped."""
+
+    def test_first_command_is_sent(self, mock_clock):
+        """Test an unknown device always gets the command."""
+        cache = CommandCache("Test")
+
+        assert cache.filter({"number.a": 100}, {"number.a": None}) == {"number.a": 100}
+        assert cache.skipped_count == 0
+
+    def test_repeated_command_is_skipped(self, mock_clock):
+        """Test the same value is not re-sent while the device reports it."""
+        cache = CommandCache("Test")
+        cache.record_sent("number.a", 100)
+
+        assert cache.filter({"number.a": 100}, {"number.a": 100.0}) == {}
+        assert cache.skipped_count == 1
+        assert cache.sent_count == 1
+
+    def test_repeated_command_skipped_when_state_unknown(self, mock_clock):
+        """Test the cache is trusted when the live state is unavailable."""
+        cache = CommandCache("Test")
+        cache.record_sent("climate.a", 30)
+
+        assert cache.filter({"climate.a": 30}, {"climate.a": None}) == {}
+
+    def test_changed_value_is_sent(self, mock_clock):
+        """Test a new value is always sent."""
+        cache = CommandCache("Test")
+        cache.record_sent("number.a", 100)
+
+        assert cache.filter({"number.a": 0}, {"number.a": 100.0}) == {"number.a": 0}
+
+    def test_drift_is_resent(self, mock_clock):
+        """Test a device reporting a different value gets the command again."""
+        cache = CommandCache("Test")
+        cache.record_sent("number.a", 0)
+
+        assert cache.filter({"number.a": 0}, {"number.a": 40.0}) == {"number.a": 0}
+
+    @pytest.mark.asyncio
+    async def test_unconfirmed_command_is_not_resent(self, mock_clock):
+        """Test a sent value is not repeated while the device has yet to report it."""
+        confirmations = ConfirmationTracker("Test", timeout=0.01)
+        cache = CommandCache("Test", confirmations=confirmations)
+        cache.record_sent("climate.a", 21.5)
+        confirmations.expect("climate.a", 21.5)
+
+        for _ in range(3):
+            assert cache.filter({"climate.a": 21.5}, {"climate.a": 30.0}) == {}
+        assert cache.skipped_count == 3
+
+        # Confirmation window over without a report → the old value is drift again
+        await asyncio.sleep(0.05)
+        assert cache.filter({"climate.a": 21.5}, {"climate.a": 30.0}) == {"climate.a": 21.5}
+
+    def test_reassert_after_interval(self, mock_clock):
+        """Test commands are re-sent once the re-assert interval expires."""
+        cache = CommandCache("Test", timedelta(minutes=30))
+        cache.record_sent("number.a", 100)
+
+        mock_clock.now += 29 * 60
+        assert cache.filter({"number.a": 100}, {"number.a": 100.0}) == {}
+
+        mock_clock.now += 2 * 60
+        assert cache.filter({"number.a": 100}, {"number.a": 100.0}) == {"number.a": 100}
+
+    def test_zero_interval_disables_skipping(self, mock_clock):
+        """Test a zero re-assert interval always sends."""
+        cache = CommandCache("Test", timedelta(0))
+        cache.record_sent("number.a", 100)
+
+        assert cache.filter({"number.a": 100}, {"number.a": 100.0}) == {"number.a": 100}
+
+
+class TestStats:
+    """Test traffic counters."""
+
+    def test_get_stats(self, mock_clock):
+        """Test sent and skipped counts are reported."""
+        cache = CommandCache("Test")
+        cache.record_sent("number.a", 100)
+        cache.filter({"number.a": 100}, {})
+
+        assert cache.get_stats() == {"commands_sent": 1, "commands_skipped": 1}
@@ -0,0 +1,108 @@
+"""Tests for the command confirmation tracker."""
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from .. import confirmation
+from ..confirmation import ConfirmationTracker
+
+
+@pytest.fixture
+def mock_clock(monkeypatch):
+    """Control the monotonic clock used for latencies."""
+    class MockClock:
+        now = 1000.0
+
+        @classmethod
+        def monotonic(cls):
+            return cls.now
+
+    monkeypatch.setattr(confirmation, "monotonic", MockClock.monotonic)
+    return MockClock
+
+
+class TestConfirmation:
+    """Test pending commands are finished by reports and deadlines."""
+
+    @pytest.mark.asyncio
+    async def test_matching_report_confirms(self, mock_clock):
+        """Test a report of the commanded value confirms it with its latency."""
+        tracker = ConfirmationTracker("Test")
+        tracker.expect("climate.trv", 21.5)
+
+        mock_clock.now += 1.25
+        assert tracker.report("climate.trv", 21.5)
+
+        assert not tracker.is_pending("climate.trv")
+        assert tracker.get_stats() == {
+            "commands_confirmed": 1,
+            "commands_unconfirmed": 0,
+            "trv_confirm_latency_ms": {"climate.trv": 1250},
+        }
+
+    @pytest.mark.asyncio
+    async def test_stale_report_does_not_confirm(self, mock_clock):
+        """Test the pre-command value reported afterwards keeps the command pending."""
+        tracker = ConfirmationTracker("Test")
+        tracker.expect("number.valve", 100)
+
+        assert not tracker.report("number.valve", 0)
+
+        assert tracker.is_pending("number.valve")
+        assert tracker.get_commanded("number.valve") == 100
+
+    @pytest.mark.asyncio
+    async def test_deadline_resolves_unconfirmed(self):
+        """Test a device that never reports counts as unconfirmed after the timeout."""
+        tracker = ConfirmationTracker("Test", timeout=0.01)
+
+        tracker.expect("number.valve", 100)
+        await asyncio.sleep(0.05)
+
+        assert tracker.get_stats()["commands_unconfirmed"] == 1
+        assert not tracker.is_pending("number.valve")
+
+    @pytest.mark.asyncio
+    async def test_expiry_is_reported(self):
+        """Test the update callback runs when a command expires unconfirmed."""
+        update_callback = Mock()
+        tracker = ConfirmationTracker("Test", timeout=0.01, update_callback=update_callback)
+
+        tracker.expect("number.valve", 100)
+        tracker.expect("climate.trv", 21.0)
+        tracker.report("climate.trv", 21.0)
+        await asyncio.sleep(0.05)
+
+        update_callback.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_new_command_replaces_pending(self):
+        """Test a newer command supersedes the previous one."""
+        tracker = ConfirmationTracker("Test", timeout=0.01)
+        tracker.expect("climate.trv", 21.0)
+
+        tracker.expect("climate.trv", 22.0)
+        assert not tracker.report("climate.trv", 21.0)
+        assert tracker.report("climate.trv", 22.0)
+
+        # The replaced command's deadline no longer fires
+        await asyncio.sleep(0.05)
+        assert tracker.get_stats()["commands_confirmed"] == 1
+        assert tracker.get_stats()["commands_unconfirmed"] == 0
+
+    def test_report_without_command(self):
+        """Test a report without a sent command confirms nothing."""
+        tracker = ConfirmationTracker("Test")
+
+        assert not tracker.report("climate.trv", 20.0)
+        assert tracker.get_stats()["commands_confirmed"] == 0
+
+    def test_restored_commanded_value(self):
+        """Test a restored commanded value is known without a pending command."""
+        tracker = ConfirmationTracker("Test")
+
+        tracker.restore_commanded({"climate.trv": 30.0})
+
+        assert tracker.get_commanded("climate.trv") == 30.0
+        assert not tracker.is_pending("climate.trv")
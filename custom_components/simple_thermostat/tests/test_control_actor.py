@@ -0,0 +1,135 @@
+"""Tests for the control actor (trigger coalescing and serialization)."""
+import asyncio
+from datetime import timedelta
+
+import pytest
+from unittest.mock import Mock
+
+from ..control_actor import ControlActor
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance that runs real background tasks."""
+    hass = Mock()
+    hass.async_create_background_task = Mock(
+        side_effect=lambda coro, name: asyncio.get_running_loop().create_task(coro)
+    )
+    return hass
+
+
+class RecordingAction:
+    """Control action that records how often and how concurrently it runs."""
+
+    def __init__(self, duration=0):
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+        self.duration = duration
+
+    async def __call__(self):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.duration)
+        self.in_flight -= 1
+
+
+class TestCoalescing:
+    """Test that bursts of triggers collapse into one evaluation."""
+
+    @pytest.mark.asyncio
+    async def test_burst_runs_once(self, mock_hass):
+        """Test triggers inside the debounce window run the action once."""
+        action = RecordingAction()
+        actor = ControlActor(mock_hass, "Test", action, timedelta(seconds=0.05))
+        actor.async_start()
+
+        for _ in range(5):
+            actor.request()
+            await asyncio.sleep(0.005)
+        await asyncio.sleep(0.1)
+
+        assert action.calls == 1
+        assert actor.trigger_count == 5
+        assert actor.run_count == 1
+        await actor.async_stop()
+
+    @pytest.mark.asyncio
+    async def test_refresh_skips_debounce(self, mock_hass):
+        """Test async_refresh runs immediately and waits for completion."""
+        action = RecordingAction()
+        actor = ControlActor(mock_hass, "Test", action, timedelta(seconds=10))
+        actor.async_start()
+
+        await asyncio.wait_for(actor.async_refresh(), 1)
+
+        assert action.calls == 1
+        await actor.async_stop()
+
+    @pytest.mark.asyncio
+    async def test_refresh_runs_inline_when_not_started(self, mock_hass):
+        """Test async_refresh still works before the worker is started."""
+        action = RecordingAction()
+        actor = ControlActor(mock_hass, "Test", action)
+
+        await actor.async_refresh()
+
+        assert action.calls == 1
+
+
+class TestSerialization:
+    """Test that evaluations never overlap."""
+
+    @pytest.mark.asyncio
+    async def test_trigger_during_run_is_queued(self, mock_hass):
+        """Test a trigger arriving mid-run causes exactly one follow-up run."""
+        action = RecordingAction(duration=0.05)
+        actor = ControlActor(mock_hass, "Test", action, timedelta(0))
+        actor.async_start()
+
+        actor.request()
+        await asyncio.sleep(0.01)
+        actor.request()
+        actor.request()
+        await asyncio.sleep(0.2)
+
+        assert action.calls == 2
+        assert action.peak == 1
+        await actor.async_stop()
+
+    @pytest.mark.asyncio
+    async def test_action_errors_do_not_kill_worker(self, mock_hass):
+        """Test the worker survives a failing action."""
+        calls = []
+
+        async def _action():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+
+        actor = ControlActor(mock_hass, "Test", _action, timedelta(0))
+        actor.async_start()
+
+        await asyncio.wait_for(actor.async_refresh(), 1)
+        await asyncio.wait_for(actor.async_refresh(), 1)
+
+        assert len(calls) == 2
+        await actor.async_stop()
+
+    @pytest.mark.asyncio
+    async def test_triggers_during_run_are_counted_as_overlaps(self, mock_hass):
+        """Test triggers that arrive while a cycle runs are counted."""
+        action = RecordingAction(duration=0.05)
+        actor = ControlActor(mock_hass, "Test", action, timedelta(0))
+        actor.async_start()
+
+        actor.request()
+        await asyncio.sleep(0.01)
+        actor.request()
+        await asyncio.sleep(0.2)
+        actor.request()
+        await asyncio.sleep(0.1)
+
+        assert actor.overlap_count == 1
+        await actor.async_stop()
@@ -0,0 +1,183 @@
+"""Tests for the house-wide coordinator."""
+from datetime import timedelta
+
+import pytest
+from unittest.mock import Mock, patch
+
+from homeassistant.core import HomeAssistant
+
+from .. import DOMAIN
+from .. import coordinator as coordinator_module
+from ..coordinator import async_get_coordinator
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance that runs jobs synchronously."""
+    hass = Mock(spec=HomeAssistant)
+    hass.data = {}
+    hass.async_run_hass_job = Mock(side_effect=lambda job, *args: job.target(*args))
+    return hass
+
+
+@pytest.fixture
+def mock_trackers():
+    """Patch the HA event helpers used by the coordinator."""
+    with patch.object(
+        coordinator_module, "async_track_time_interval", return_value=Mock()
+    ) as track_interval, patch.object(
+        coordinator_module, "async_track_state_change_event", return_value=Mock()
+    ) as track_state:
+        yield track_interval, track_state
+
+
+class TestCoordinatorLookup:
+    """Test the domain-level coordinator instance."""
+
+    def test_coordinator_is_shared(self, mock_hass):
+        """Test the same coordinator is returned for every room."""
+        first = async_get_coordinator(mock_hass)
+        second = async_get_coordinator(mock_hass)
+
+        assert first is second
+        assert mock_hass.data[DOMAIN]["coordinator"] is first
+
+
+class TestSharedTimers:
+    """Test that rooms share one timer per interval."""
+
+    def test_one_timer_per_interval(self, mock_hass, mock_trackers):
+        """Test many rooms on the same interval create one HA timer."""
+        track_interval, _ = mock_trackers
+        coordinator = async_get_coordinator(mock_hass)
+
+        for _ in range(10):
+            coordinator.async_track_time_interval(Mock(), timedelta(minutes=1))
+        coordinator.async_track_time_interval(Mock(), timedelta(minutes=5))
+
+        assert track_interval.call_count == 2
+        assert coordinator.get_stats()["timers"] == 2
+        assert coordinator.get_stats()["timer_subscribers"] == 11
+
+    def test_tick_fans_out(self, mock_hass, mock_trackers):
+        """Test one tick calls every registered room."""
+        track_interval, _ = mock_trackers
+        coordinator = async_get_coordinator(mock_hass)
+        first, second = Mock(), Mock()
+
+        coordinator.async_track_time_interval(first, timedelta(minutes=1))
+        coordinator.async_track_time_interval(second, timedelta(minutes=1))
+        tick = track_interval.call_args[0][1]
+        tick("now")
+
+        first.assert_called_once_with("now")
+        second.assert_called_once_with("now")
+
+    def test_timer_removed_with_last_subscriber(self, mock_hass, mock_trackers):
+        """Test the HA timer is cancelled when the last room leaves."""
+        track_interval, _ = mock_trackers
+        coordinator = async_get_coordinator(mock_hass)
+
+        remove_first = coordinator.async_track_time_interval(Mock(), timedelta(minutes=1))
+        remove_second = coordinator.async_track_time_interval(Mock(), timedelta(minutes=1))
+
+        remove_first()
+        assert not track_interval.return_value.called
+
+        remove_second()
+        track_interval.return_value.assert_called_once()
+        assert coordinator.get_stats()["timers"] == 0
+
+
+class TestSharedStateSubscriptions:
+    """Test that rooms share one subscription per sensor."""
+
+    def test_one_subscription_per_entity(self, mock_hass, mock_trackers):
+        """Test a sensor shared by many rooms is subscribed once."""
+        _, track_state = mock_trackers
+        coordinator = async_get_coordinator(mock_hass)
+
+        for _ in range(10):
+            coordinator.async_track_state_change(["binary_sensor.house_empty"], Mock())
+
+        assert track_state.call_count == 1
+        assert coordinator.get_stats()["state_subscribers"] == 10
+
+    def test_event_fans_out(self, mock_hass, mock_trackers):
+        """Test a state change reaches every room listening to the entity."""
+        coordinator = async_get_coordinator(mock_hass)
+        first, second, other = Mock(), Mock(), Mock()
+
+        coordinator.async_track_state_change(["binary_sensor.house_empty"], first)
+        coordinator.async_track_state_change(["binary_sensor.house_empty"], second)
+        coordinator.async_track_state_change(["sensor.outdoor"], other)
+
+        event = Mock()
+        event.data = {"entity_id": "binary_sensor.house_empty"}
+        coordinator._async_dispatch_state_change(event)
+
+        first.assert_called_once_with(event)
+        second.assert_called_once_with(event)
+        other.assert_not_called()
+
+    def test_subscription_removed_with_last_listener(self, mock_hass, mock_trackers):
+        """Test the HA subscription is dropped when nobody listens."""
+        _, track_state = mock_trackers
+        coordinator = async_get_coordinator(mock_hass)
+
+        remove = coordinator.async_track_state_change(
+            ["climate.trv_1", "climate.trv_2"], Mock()
+        )
+        remove()
+
+        assert track_state.return_value.call_count == 2
+        assert coordinator.get_stats()["state_subscriptions"] == 0
+
+
+class TestThermostatIndex:
+    """Test the entity_id -> thermostat index."""
+
+    def test_register_and_lookup(self, mock_hass):
+        """Test a registered thermostat is found by entity_id."""
+        coordinator = async_get_coordinator(mock_hass)
+        thermostat = Mock()
+        thermostat.entity_id = "climate.st_living"
+
+        remove = coordinator.async_register_thermostat(thermostat)
+
+        assert coordinator.get_thermostat("climate.st_living") is thermostat
+        assert coordinator.get_thermostat("climate.other") is None
+        assert coordinator.get_stats()["thermostats"] == 1
+
+        remove()
+        assert coordinator.get_thermostat("climate.st_living") is None
+
+    def test_stale_remover_keeps_new_entry(self, mock_hass):
+        """Test removing an old entity does not drop a re-added one."""
+        coordinator = async_get_coordinator(mock_hass)
+        old, new = Mock(), Mock()
+        old.entity_id = new.entity_id = "climate.st_living"
+
+        remove_old = coordinator.async_register_thermostat(old)
+        coordinator.async_register_thermostat(new)
+        remove_old()
+
+        assert coordinator.get_thermostat("climate.st_living") is new
+
+
+class TestMetrics:
+    """Test the house-wide metrics view."""
+
+    def test_rooms_and_total(self, mock_hass):
+        """Test metrics are reported per room and summed over rooms."""
+        coordinator = async_get_coordinator(mock_hass)
+        for entity_id, sent in (("climate.st_living", 3), ("climate.st_kitchen", 5)):
+            thermostat = Mock()
+            thermostat.entity_id = entity_id
+            thermostat.get_metrics = Mock(return_value={"commands_sent": sent})
+            coordinator.async_register_thermostat(thermostat)
+
+        metrics = coordinator.get_metrics()
+
+        assert metrics["rooms"]["climate.st_kitchen"] == {"commands_sent": 5}
+        assert metrics["total"] == {"commands_sent": 8}
@@ -0,0 +1,250 @@
+"""Tests for the TRV command fan-out."""
+import asyncio
+
+import pytest
+from unittest.mock import Mock, AsyncMock
+
+from .. import fanout as fanout_module
+from ..circuit_breaker import STATE_OPEN, CircuitBreakers
+from ..fanout import CommandFanout
+from ..metrics import ControlMetrics
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance."""
+    hass = Mock()
+    hass.services = Mock()
+    hass.services.async_call = AsyncMock()
+    return hass
+
+
+class TestGrouping:
+    """Test grouping of entities that share a value."""
+
+    @pytest.mark.asyncio
+    async def test_same_value_uses_one_call(self, mock_hass):
+        """Test entities with the same value are sent in one service call."""
+        fanout = CommandFanout(mock_hass, "Test")
+
+        results = await fanout.async_send(
+            "number", "set_value", "value", {"number.a": 100, "number.b": 100}
+        )
+
+        assert results == {"number.a": True, "number.b": True}
+        mock_hass.services.async_call.assert_called_once_with(
+            "number",
+            "set_value",
+            {"entity_id": ["number.a", "number.b"], "value": 100},
+            blocking=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_different_values_use_separate_calls(self, mock_hass):
+        """Test entities with different values get their own call."""
+        fanout = CommandFanout(mock_hass, "Test")
+
+        await fanout.async_send(
+            "climate",
+            "set_temperature",
+            "temperature",
+            {"climate.a": 21.5, "climate.b": 22.0},
+        )
+
+        assert mock_hass.services.async_call.call_count == 2
+        mock_hass.services.async_call.assert_any_call(
+            "climate",
+            "set_temperature",
+            {"entity_id": "climate.a", "temperature": 21.5},
+            blocking=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_empty_targets(self, mock_hass):
+        """Test nothing is sent for an empty target map."""
+        fanout = CommandFanout(mock_hass, "Test")
+
+        assert await fanout.async_send("number", "set_value", "value", {}) == {}
+        assert not mock_hass.services.async_call.called
+
+
+class TestFailureReporting:
+    """Test per-entity success reporting."""
+
+    @pytest.mark.asyncio
+    async def test_group_failure_falls_back_per_entity(self, mock_hass):
+        """Test a failed grouped call is retried entity by entity."""
+
+        async def _call(domain, service, data, blocking):
+            if data["entity_id"] != "number.a":
+                raise RuntimeError("device offline")
+
+        mock_hass.services.async_call = AsyncMock(side_effect=_call)
+        fanout = CommandFanout(mock_hass, "Test")
+
+        results = await fanout.async_send(
+            "number", "set_value", "value", {"number.a": 0, "number.b": 0}
+        )
+
+        assert results == {"number.a": True, "number.b": False}
+        assert mock_hass.services.async_call.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_single_entity_failure(self, mock_hass):
+        """Test a failed single-entity call is reported without retry."""
+        mock_hass.services.async_call = AsyncMock(side_effect=RuntimeError("boom"))
+        fanout = CommandFanout(mock_hass, "Test")
+
+        results = await fanout.async_send(
+            "number", "set_value", "value", {"number.a": 0}
+        )
+
+        assert results == {"number.a": False}
+        assert mock_hass.services.async_call.call_count == 1
+
+
+class TestConcurrency:
+    """Test the concurrency cap."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self, mock_hass):
+        """Test no more than max_concurrency calls are in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def _call(domain, service, data, blocking):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+        mock_hass.services.async_call = AsyncMock(side_effect=_call)
+        fanout = CommandFanout(mock_hass, "Test", max_concurrency=2)
+
+        await fanout.async_send(
+            "climate",
+            "set_temperature",
+            "temperature",
+            {f"climate.trv_{i}": 20 + i for i in range(5)},
+        )
+
+        assert mock_hass.services.async_call.call_count == 5
+        assert peak == 2
+
+
+class TestScheduling:
+    """Test use of the house-wide command scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_calls_acquire_tokens_with_priority(self, mock_hass):
+        """Test each call takes one token per device at the given priority."""
+        scheduler = Mock()
+        scheduler.async_acquire = AsyncMock()
+        fanout = CommandFanout(mock_hass, "Test", scheduler=scheduler)
+
+        await fanout.async_send(
+            "number", "set_value", "value", {"number.a": 0, "number.b": 0}, priority=0
+        )
+
+        scheduler.async_acquire.assert_awaited_once_with(0, 2)
+
+
+class TestResilience:
+    """Test timeouts, retries and circuit breakers."""
+
+    @pytest.fixture(autouse=True)
+    def no_backoff(self, monkeypatch):
+        """Skip the retry backoff delays."""
+        sleeps = []
+
+        async def _sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(fanout_module.asyncio, "sleep", _sleep)
+        return sleeps
+
+    @pytest.mark.asyncio
+    async def test_hanging_call_times_out(self, mock_hass):
+        """Test an unresponsive device does not block the send forever."""
+        async def _hang(domain, service, data, blocking):
+            await asyncio.Event().wait()
+
+        mock_hass.services.async_call = AsyncMock(side_effect=_hang)
+        fanout = CommandFanout(mock_hass, "Test", timeout=0.01)
+
+        results = await fanout.async_send("number", "set_value", "value", {"number.a": 0})
+
+        assert results == {"number.a": False}
+        assert fanout.get_stats()["command_timeouts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_with_exponential_backoff(self, mock_hass, no_backoff):
+        """Test a failing entity is retried with growing delays."""
+        mock_hass.services.async_call = AsyncMock(
+            side_effect=[RuntimeError("busy"), RuntimeError("busy"), None]
+        )
+        fanout = CommandFanout(mock_hass, "Test", retries=3)
+
+        results = await fanout.async_send("number", "set_value", "value", {"number.a": 0})
+
+        assert results == {"number.a": True}
+        assert no_backoff == [1.0, 2.0]
+        assert fanout.get_stats()["command_retries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_skips_device(self, mock_hass):
+        """Test a dead device is skipped while its breaker is open."""
+        mock_hass.services.async_call = AsyncMock(side_effect=RuntimeError("offline"))
+        breakers = CircuitBreakers("Test", failure_threshold=3)
+        fanout = CommandFanout(mock_hass, "Test", retries=2, breakers=breakers)
+
+        await fanout.async_send("number", "set_value", "value", {"number.a": 0})
+        assert mock_hass.services.async_call.call_count == 3
+        assert breakers.get_state("number.a") == STATE_OPEN
+
+        results = await fanout.async_send("number", "set_value", "value", {"number.a": 0})
+        assert results == {"number.a": False}
+        assert mock_hass.services.async_call.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_dead_device_does_not_block_others(self, mock_hass):
+        """Test healthy devices of a group still succeed next to a dead one."""
+        async def _call(domain, service, data, blocking):
+            if data["entity_id"] != "number.a":
+                raise RuntimeError("device offline")
+
+        mock_hass.services.async_call = AsyncMock(side_effect=_call)
+        breakers = CircuitBreakers("Test", failure_threshold=1)
+        fanout = CommandFanout(mock_hass, "Test", breakers=breakers)
+
+        await fanout.async_send("number", "set_value", "value", {"number.a": 0, "number.b": 0})
+        mock_hass.services.async_call.reset_mock()
+        results = await fanout.async_send(
+            "number", "set_value", "value", {"number.a": 0, "number.b": 0}
+        )
+
+        assert results == {"number.a": True, "number.b": False}
+        mock_hass.services.async_call.assert_called_once()
+
+
+class TestMetrics:
+    """Test service call instrumentation."""
+
+    @pytest.mark.asyncio
+    async def test_calls_are_recorded(self, mock_hass):
+        """Test every service call is timed and failures are counted."""
+        async def _call(domain, service, data, blocking):
+            if data["entity_id"] == "number.b":
+                raise Exception("offline")
+
+        mock_hass.services.async_call = AsyncMock(side_effect=_call)
+        metrics = ControlMetrics("Test")
+        fanout = CommandFanout(mock_hass, "Test", metrics=metrics)
+
+        await fanout.async_send("number", "set_value", "value", {"number.a": 0, "number.b": 100})
+
+        stats = metrics.get_stats()
+        assert stats["service_calls_per_hour"] == 2
+        assert stats["service_calls_failed"] == 1
+        assert stats["service_call_ms"]["count"] == 2
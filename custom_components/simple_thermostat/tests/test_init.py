@@ -2,6 +2,7 @@
 import pytest
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from pathlib import Path
+import voluptuous as vol
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.typing import ConfigType
@@ -10,7 +11,9 @@ from .. import (
     async_setup,
     DOMAIN,
     SERVICE_SET_PRESET_TEMPERATURE,
+    SET_PRESET_TEMPERATURE_SCHEMA,
 )
+from ..coordinator import async_get_coordinator
 
 
 @pytest.fixture
@@ -87,6 +90,125 @@ class TestSetPresetTemperatureService:
         assert schema is not None
 
 
+    @pytest.mark.asyncio
+    async def test_service_uses_thermostat_index(self, mock_hass, mock_config):
+        """Test the service finds the thermostat through the entity_id index."""
+        thermostat = Mock()
+        thermostat.entity_id = "climate.st_living"
+        thermostat._control_actor.async_refresh = AsyncMock()
+        async_get_coordinator(mock_hass).async_register_thermostat(thermostat)
+
+        await async_setup(mock_hass, mock_config)
+        handler = mock_hass.services.async_register.call_args[0][2]
+        call = Mock()
+        call.data = {"entity_id": "climate.st_living", "away_temp": 15.0}
+        await handler(call)
+
+        assert thermostat._away_temp == 15.0
+        thermostat._update_target_temp_from_preset.assert_called_once()
+        thermostat._control_actor.async_refresh.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_bulk_relative_change(self, mock_hass, mock_config):
+        """Test a delta is applied to every targeted thermostat in one call."""
+        thermostats = []
+        for name in ("living", "kitchen", "office"):
+            thermostat = Mock()
+            thermostat.entity_id = f"climate.st_{name}"
+            thermostat._away_temp = 17.0
+            thermostat._present_temp = 21.0
+            thermostat.min_temp = 7.0
+            thermostat.max_temp = 35.0
+            thermostat._control_actor.async_refresh = AsyncMock()
+            async_get_coordinator(mock_hass).async_register_thermostat(thermostat)
+            thermostats.append(thermostat)
+
+        await async_setup(mock_hass, mock_config)
+        handler = mock_hass.services.async_register.call_args[0][2]
+        call = Mock()
+        call.data = SET_PRESET_TEMPERATURE_SCHEMA({
+            "entity_id": ["climate.st_living", "climate.st_kitchen"],
+            "away_temp_delta": -1,
+        })
+        await handler(call)
+
+        assert thermostats[0]._away_temp == 16.0
+        assert thermostats[1]._away_temp == 16.0
+        assert thermostats[0]._present_temp == 21.0
+        assert thermostats[2]._away_temp == 17.0
+        thermostats[0]._control_actor.async_refresh.assert_awaited_once()
+        thermostats[2]._control_actor.async_refresh.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_relative_change_clamped_to_range(self, mock_hass, mock_config):
+        """Test repeated deltas cannot push a preset outside min_temp/max_temp."""
+        thermostat = Mock()
+        thermostat.entity_id = "climate.st_living"
+        thermostat._away_temp = 9.0
+        thermostat._cosy_temp = 33.0
+        thermostat.min_temp = 7.0
+        thermostat.max_temp = 35.0
+        thermostat._control_actor.async_refresh = AsyncMock()
+        async_get_coordinator(mock_hass).async_register_thermostat(thermostat)
+
+        await async_setup(mock_hass, mock_config)
+        handler = mock_hass.services.async_register.call_args[0][2]
+        call = Mock()
+        call.data = SET_PRESET_TEMPERATURE_SCHEMA({
+            "entity_id": "climate.st_living",
+            "away_temp_delta": -5,
+            "cosy_temp_delta": 5,
+        })
+        await handler(call)
+
+        assert thermostat._away_temp == 7.0
+        assert thermostat._cosy_temp == 35.0
+
+    @pytest.mark.asyncio
+    async def test_all_thermostats(self, mock_hass, mock_config):
+        """Test entity_id: all targets every thermostat."""
+        thermostats = []
+        for name in ("living", "kitchen"):
+            thermostat = Mock()
+            thermostat.entity_id = f"climate.st_{name}"
+            thermostat._control_actor.async_refresh = AsyncMock()
+            async_get_coordinator(mock_hass).async_register_thermostat(thermostat)
+            thermostats.append(thermostat)
+
+        await async_setup(mock_hass, mock_config)
+        handler = mock_hass.services.async_register.call_args[0][2]
+        call = Mock()
+        call.data = SET_PRESET_TEMPERATURE_SCHEMA({"entity_id": "all", "cosy_temp": 22.5})
+        await handler(call)
+
+        assert [thermostat._cosy_temp for thermostat in thermostats] == [22.5, 22.5]
+
+    def test_absolute_and_delta_are_exclusive(self):
+        """Test a value and a delta for the same preset are rejected."""
+        with pytest.raises(vol.Invalid):
+            SET_PRESET_TEMPERATURE_SCHEMA({
+                "entity_id": "climate.st_living",
+                "away_temp": 16,
+                "away_temp_delta": -1,
+            })
+
+    def test_target_required(self):
+        """Test a target is required."""
+        with pytest.raises(vol.Invalid):
+            SET_PRESET_TEMPERATURE_SCHEMA({"away_temp": 16})
+
+    @pytest.mark.asyncio
+    async def test_service_unknown_entity(self, mock_hass, mock_config):
+        """Test an unknown entity_id is ignored."""
+        await async_setup(mock_hass, mock_config)
+        handler = mock_hass.services.async_register.call_args[0][2]
+        call = Mock()
+        call.data = {"entity_id": "climate.unknown", "away_temp": 15.0}
+
+        # Should not raise
+        await handler(call)
+
+
 class TestWWWPathRegistration:
     """Test custom card www path registration."""
 
@@ -0,0 +1,150 @@
+"""Tests for the control loop metrics."""
+import pytest
+
+from .. import metrics
+from ..metrics import (
+    HISTOGRAM_CONTROL_CYCLE,
+    HISTOGRAM_EVENT_TO_COMMAND,
+    ControlMetrics,
+    LatencyHistogram,
+    merge_stats,
+)
+
+
+@pytest.fixture
+def mock_clock(monkeypatch):
+    """Control the monotonic clock used for timings."""
+    class MockClock:
+        now = 1000.0
+
+        @classmethod
+        def monotonic(cls):
+            return cls.now
+
+    monkeypatch.setattr(metrics, "monotonic", MockClock.monotonic)
+    return MockClock
+
+
+class TestLatencyHistogram:
+    """Test bucketing and summary values."""
+
+    def test_samples_land_in_buckets(self):
+        """Test samples are counted in the first bucket that fits."""
+        histogram = LatencyHistogram()
+        histogram.observe(0.005)
+        histogram.observe(0.2)
+        histogram.observe(30)
+
+        stats = histogram.get_stats()
+        assert stats["count"] == 3
+        assert stats["max_ms"] == 30000
+        assert stats["avg_ms"] == 10068
+        assert stats["buckets"]["le_10"] == 1
+        assert stats["buckets"]["le_250"] == 1
+        assert stats["buckets"]["gt_10000"] == 1
+
+    def test_empty(self):
+        """Test an empty histogram reports zeros."""
+        stats = LatencyHistogram().get_stats()
+        assert stats["count"] == 0
+        assert stats["avg_ms"] == 0
+
+
+class TestControlMetrics:
+    """Test cycle, command and service call instrumentation."""
+
+    def test_event_to_last_command(self, mock_clock):
+        """Test the latency runs from the temperature event to the last command sent."""
+        control = ControlMetrics("Test")
+        control.mark_event()
+
+        mock_clock.now += 2.0  # debounce
+        started_at = control.start_cycle()
+        mock_clock.now += 0.1
+        control.record_commands(sent=2)
+        mock_clock.now += 0.3
+        control.record_commands(sent=1, failed=1)
+        mock_clock.now += 0.05
+        control.finish_cycle(started_at)
+
+        stats = control.get_stats()
+        assert stats[HISTOGRAM_EVENT_TO_COMMAND]["max_ms"] == 2400
+        assert stats[HISTOGRAM_CONTROL_CYCLE]["max_ms"] == 450
+        assert stats["commands_failed"] == 1
+
+    def test_first_event_counts_until_served(self, mock_clock):
+        """Test coalesced events are measured from the earliest one."""
+        control = ControlMetrics("Test")
+        control.mark_event()
+        mock_clock.now += 1.0
+        control.mark_event()
+
+        started_at = control.start_cycle()
+        control.record_commands(sent=1)
+        control.finish_cycle(started_at)
+
+        assert control.get_stats()[HISTOGRAM_EVENT_TO_COMMAND]["max_ms"] == 1000
+
+    def test_cycle_without_commands_serves_event(self, mock_clock):
+        """Test an event whose cycle sent nothing is not measured by a later cycle."""
+        control = ControlMetrics("Test")
+        control.mark_event()
+        control.finish_cycle(control.start_cycle())
+
+        mock_clock.now += 600
+        started_at = control.start_cycle()
+        control.record_commands(sent=1)
+        control.finish_cycle(started_at)
+
+        assert HISTOGRAM_EVENT_TO_COMMAND not in control.get_stats()
+        assert control.get_stats()["control_cycles"] == 2
+
+    def test_mode_durations(self, mock_clock):
+        """Test mode methods get a histogram each."""
+        control = ControlMetrics("Test")
+        control.observe_mode("proportional", 0.12)
+
+        assert control.get_stats()["proportional_ms"]["count"] == 1
+
+    def test_service_calls_per_hour(self, mock_clock):
+        """Test the call rate only counts the last hour."""
+        control = ControlMetrics("Test")
+        control.record_service_call(0.05, True)
+        mock_clock.now += 1800
+        control.record_service_call(0.05, False)
+        control.record_service_call(0.05, True)
+
+        assert control.get_service_calls_per_hour() == 3
+        mock_clock.now += 1801
+        assert control.get_service_calls_per_hour() == 2
+        assert control.get_stats()["service_calls_failed"] == 1
+        assert control.get_stats()["service_call_ms"]["count"] == 3
+
+
+class TestMergeStats:
+    """Test the house-wide aggregation."""
+
+    def test_counters_and_histograms(self):
+        """Test counters are summed and histograms combined."""
+        first = ControlMetrics("First")
+        first.observe(HISTOGRAM_CONTROL_CYCLE, 0.1)
+        first.record_commands(sent=2, failed=1)
+        first.record_service_call(0.05, True)
+        second = ControlMetrics("Second")
+        second.observe(HISTOGRAM_CONTROL_CYCLE, 0.3)
+        second.observe(HISTOGRAM_CONTROL_CYCLE, 0.5)
+        second.record_commands(sent=4, failed=2)
+
+        merged = merge_stats([first.get_stats(), second.get_stats()])
+
+        assert merged["commands_failed"] == 3
+        assert merged["service_calls_per_hour"] == 1
+        assert merged[HISTOGRAM_CONTROL_CYCLE]["count"] == 3
+        assert merged[HISTOGRAM_CONTROL_CYCLE]["avg_ms"] == 300
+        assert merged[HISTOGRAM_CONTROL_CYCLE]["max_ms"] == 500
+        assert merged[HISTOGRAM_CONTROL_CYCLE]["buckets"]["le_100"] == 1
+        assert merged[HISTOGRAM_CONTROL_CYCLE]["buckets"]["le_500"] == 2
+
+    def test_no_rooms(self):
+        """Test aggregating nothing gives an empty view."""
+        assert merge_stats([]) == {}
@@ -1,8 +1,9 @@
 """Tests for PresetManager."""
 import pytest
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, AsyncMock
 
+from custom_components.simple_thermostat import preset_manager as preset_manager_module
 from custom_components.simple_thermostat.preset_manager import PresetManager
 from homeassistant.const import STATE_ON, STATE_OFF, STATE_UNAVAILABLE
 
@@ -123,6 +124,111 @@ class TestScheduleCalculation:
         assert manager._scheduled_preset == "cosy"
 
 
+class TestScheduleTransitions:
+    """Test the compiled weekly timeline and exact-time transitions."""
+
+    def test_timeline_covers_week(self, mock_hass, basic_schedule_config):
+        """Test weekday entries repeat Mon-Fri and weekend entries Sat-Sun."""
+        manager = PresetManager(
+            mock_hass, "Test", basic_schedule_config, None, None, None, None
+        )
+
+        assert len(manager._timeline) == 5 * 4 + 2 * 2
+        assert manager._timeline[0] == (360, "present")  # Monday 06:00
+        assert manager._timeline[-1] == (6 * 1440 + 1380, "cosy")  # Sunday 23:00
+
+    def test_next_transition_same_day(self, mock_hass, basic_schedule_config):
+        """Test the next transition later the same day."""
+        manager = PresetManager(
+            mock_hass, "Test", basic_schedule_config, None, None, None, None
+        )
+
+        when, preset = manager._get_next_transition(datetime(2024, 1, 15, 12, 0))
+
+        assert when == datetime(2024, 1, 15, 17, 0)
+        assert preset == "present"
+
+    def test_next_transition_wraps_week(self, mock_hass, basic_schedule_config):
+        """Test Sunday night wraps to Monday morning."""
+        manager = PresetManager(
+            mock_hass, "Test", basic_schedule_config, None, None, None, None
+        )
+
+        when, preset = manager._get_next_transition(datetime(2024, 1, 21, 23, 30))
+
+        assert when == datetime(2024, 1, 22, 6, 0)
+        assert preset == "present"
+
+    def test_next_transition_across_dst(self, mock_hass, basic_schedule_config):
+        """Test a transition after the spring DST switch keeps its wall-clock time."""
+        from zoneinfo import ZoneInfo
+
+        manager = PresetManager(
+            mock_hass, "Test", basic_schedule_config, None, None, None, None
+        )
+        tz = ZoneInfo("Europe/Berlin")
+
+        # Saturday 23:30 CET; clocks go forward at 02:00 Sunday
+        when, preset = manager._get_next_transition(datetime(2024, 3, 30, 23, 30, tzinfo=tz))
+
+        assert (when.day, when.hour, when.minute) == (31, 8, 0)
+        assert when.utcoffset() == timedelta(hours=2)
+        assert preset == "present"
+
+    def test_no_transition_without_schedule(self, mock_hass):
+        """Test nothing is armed without a schedule."""
+        manager = PresetManager(mock_hass, "Test", None, None, None, None, None)
+
+        assert manager._get_next_transition(datetime(2024, 1, 15, 12, 0)) is None
+
+    @pytest.mark.asyncio
+    async def test_transition_is_armed(
+        self, mock_hass, basic_schedule_config, mock_datetime
+    ):
+        """Test a point-in-time callback is armed and re-armed at each transition."""
+        mock_datetime.set_time(datetime(2024, 1, 15, 12, 0))
+        manager = PresetManager(
+            mock_hass, "Test", basic_schedule_config, None, None, None, None
+        )
+        manager._track_transitions = True
+
+        with patch.object(
+            preset_manager_module, "async_track_point_in_time", return_value=Mock()
+        ) as track_point:
+            await manager._async_update_schedule(None)
+            assert track_point.call_args[0][2] == datetime(2024, 1, 15, 17, 0)
+
+            mock_datetime.set_time(datetime(2024, 1, 15, 17, 0))
+            await manager._async_handle_transition(None)
+            assert track_point.call_args[0][2] == datetime(2024, 1, 15, 22, 0)
+
+        assert manager._scheduled_preset == "present"
+        status = manager.get_override_status()
+        assert status["next_transition"] == "2024-01-15T22:00:00"
+        assert status["next_transition_preset"] == "cosy"
+
+    @pytest.mark.asyncio
+    async def test_listeners_notified_on_change(
+        self, mock_hass, basic_schedule_config, mock_datetime
+    ):
+        """Test registered listeners are notified only when the preset changes."""
+        mock_hass.async_run_hass_job = Mock()
+        mock_datetime.set_time(datetime(2024, 1, 15, 12, 0))
+        manager = PresetManager(
+            mock_hass, "Test", basic_schedule_config, None, None, None, None
+        )
+        remove = manager.async_add_listener(Mock())
+
+        await manager._async_update_schedule(None)
+        await manager._async_update_schedule(None)
+        assert mock_hass.async_run_hass_job.call_count == 1
+
+        remove()
+        mock_datetime.set_time(datetime(2024, 1, 15, 17, 0))
+        await manager._async_update_schedule(None)
+        assert mock_hass.async_run_hass_job.call_count == 1
+
+
 class TestManualOverride:
     """Test manual preset override behavior."""
 
@@ -235,12 +341,9 @@ class TestPresenceOverride:
         assert manager.get_active_preset() == "present"
 
     @pytest.mark.asyncio
-    async def test_presence_15_minute_delay(
-        self, mock_hass, mock_state, mock_datetime
-    ):
-        """Test 15-minute delay after presence clears."""
-        from datetime import timedelta
-
+    async def test_presence_15_minute_delay(self, mock_hass, mock_state):
+        """Test the override clears via a 15-minute timer after presence clears."""
+        mock_hass.async_run_hass_job = Mock()
         manager = PresetManager(
             mock_hass,
             "Test",
@@ -260,25 +363,157 @@ class TestPresenceOverride:
         await manager._update_presence_state()
         assert manager._presence_override_active is True
 
-        # Presence cleared
+        # Presence cleared → timer armed, override still active
         mock_hass.states.get.return_value = mock_state(
             "binary_sensor.test_presence", STATE_OFF
         )
-        await manager._update_presence_state()
+        with patch.object(
+            preset_manager_module, "async_call_later", return_value=Mock()
+        ) as call_later:
+            await manager._update_presence_state()
+            await manager._update_presence_state()
 
-        # Should still be active (within 15 minutes)
+        call_later.assert_called_once()
+        assert call_later.call_args[0][1] == pytest.approx(15 * 60, abs=1)
         assert manager._presence_override_active is True
-        assert manager._last_presence_clear_time is not None
+        assert manager._presence_expires_at is not None
+
+        # Timer fires without any further sensor update
+        expired_callback = call_later.call_args[0][2]
+        expired_callback(None)
 
-        # Simulate 15 minutes passing
-        original_time = manager._last_presence_clear_time
-        mock_datetime.set_time(original_time + timedelta(minutes=16))
+        assert manager._presence_override_active is False
+        assert manager._presence_expires_at is None
+        assert manager.get_active_preset() == "away"
+
+    @pytest.mark.asyncio
+    async def test_presence_return_cancels_timer(self, mock_hass, mock_state):
+        """Test presence returning before the delay cancels the expiry timer."""
+        manager = PresetManager(
+            mock_hass, "Test", None, "binary_sensor.test_presence", None, None, None,
+            initial_preset="away",
+        )
+        mock_hass.states.get.return_value = mock_state(
+            "binary_sensor.test_presence", STATE_ON
+        )
         await manager._update_presence_state()
 
-        # Should now be cleared
+        cancel = Mock()
+        mock_hass.states.get.return_value = mock_state(
+            "binary_sensor.test_presence", STATE_OFF
+        )
+        with patch.object(preset_manager_module, "async_call_later", return_value=cancel):
+            await manager._update_presence_state()
+
+        mock_hass.states.get.return_value = mock_state(
+            "binary_sensor.test_presence", STATE_ON
+        )
+        await manager._update_presence_state()
+
+        cancel.assert_called_once()
+        assert manager._presence_override_active is True
+        assert manager._presence_expires_at is None
+
+    def test_restore_in_flight_timer(self, mock_hass):
+        """Test a timer that was running before a restart resumes with the remaining time."""
+        import homeassistant.util.dt as dt_util
+
+        mock_hass.async_run_hass_job = Mock()
+        manager = PresetManager(
+            mock_hass, "Test", None, "binary_sensor.test_presence", None, None, None,
+            initial_preset="away",
+        )
+        expires_at = dt_util.utcnow() + timedelta(minutes=5)
+
+        with patch.object(
+            preset_manager_module, "async_call_later", return_value=Mock()
+        ) as call_later:
+            manager.restore_presence_expiry(expires_at)
+
+        assert manager._presence_override_active is True
+        assert manager.get_active_preset() == "present"
+        assert 0 < call_later.call_args[0][1] <= 5 * 60
+        assert manager.get_override_status()["presence_expires_at"] == expires_at.isoformat()
+
+    def test_restore_expired_timer(self, mock_hass):
+        """Test a timer that expired during the restart is not resumed."""
+        import homeassistant.util.dt as dt_util
+
+        manager = PresetManager(
+            mock_hass, "Test", None, "binary_sensor.test_presence", None, None, None,
+            initial_preset="away",
+        )
+
+        with patch.object(preset_manager_module, "async_call_later") as call_later:
+            manager.restore_presence_expiry(dt_util.utcnow() - timedelta(minutes=1))
+
+        call_later.assert_not_called()
         assert manager._presence_override_active is False
 
 
+class TestPersistedState:
+    """Test override state kept across restarts."""
+
+    @pytest.mark.asyncio
+    async def test_manual_override_restored(
+        self, mock_hass, basic_schedule_config, mock_datetime
+    ):
+        """Test a manual override survives a restart within the same schedule slot."""
+        mock_datetime.set_time(datetime(2024, 1, 15, 12, 0))  # Monday 12:00 (away)
+        manager = PresetManager(
+            mock_hass, "Test", basic_schedule_config, None, None, None, None
+        )
+        await manager._async_update_schedule(None)
+        manager.set_manual_preset("cosy")
+        data = manager.get_persisted_state()
+
+        restarted = PresetManager(
+            mock_hass, "Test", basic_schedule_config, None, None, None, None
+        )
+        await restarted._async_update_schedule(None)
+        restarted.restore_state(data)
+
+        assert restarted.get_active_preset() == "cosy"
+
+    @pytest.mark.asyncio
+    async def test_manual_override_dropped_after_missed_transition(
+        self, mock_hass, basic_schedule_config, mock_datetime
+    ):
+        """Test a schedule transition missed while stopped clears the override."""
+        mock_datetime.set_time(datetime(2024, 1, 15, 12, 0))  # Monday 12:00 (away)
+        manager = PresetManager(
+            mock_hass, "Test", basic_schedule_config, None, None, None, None
+        )
+        await manager._async_update_schedule(None)
+        manager.set_manual_preset("cosy")
+        data = manager.get_persisted_state()
+
+        mock_datetime.set_time(datetime(2024, 1, 15, 18, 0))  # Restarted after 17:00
+        restarted = PresetManager(
+            mock_hass, "Test", basic_schedule_config, None, None, None, None
+        )
+        await restarted._async_update_schedule(None)
+        restarted.restore_state(data)
+
+        assert restarted.get_active_preset() == "present"
+
+    def test_presence_timer_restored(self, mock_hass):
+        """Test a running presence timer is part of the persisted state."""
+        import homeassistant.util.dt as dt_util
+
+        expires_at = dt_util.utcnow() + timedelta(minutes=5)
+        manager = PresetManager(
+            mock_hass, "Test", None, "binary_sensor.test_presence", None, None, None,
+            initial_preset="away",
+        )
+
+        with patch.object(preset_manager_module, "async_call_later", return_value=Mock()):
+            manager.restore_state({"presence_expires_at": expires_at.isoformat()})
+
+        assert manager.get_active_preset() == "present"
+        assert manager.get_persisted_state()["presence_expires_at"] == expires_at.isoformat()
+
+
 class TestWindowOverride:
     """Test window open/close override behavior."""
 
@@ -381,6 +616,87 @@ class TestWindowOverride:
         assert manager.get_active_preset() == "present"
 
 
+class TestActivePresetNotifications:
+    """Test that override changes are pushed to listeners immediately."""
+
+    @pytest.mark.asyncio
+    async def test_window_open_notifies_listener(self, mock_hass, mock_state):
+        """Test opening a window notifies listeners from the sensor event."""
+        mock_hass.async_run_hass_job = Mock()
+        manager = PresetManager(
+            mock_hass, "Test", None, None, "binary_sensor.test_window", None, None,
+            initial_preset="present",
+        )
+        manager._last_active_preset = "present"
+        listener = Mock()
+        manager.async_add_listener(listener)
+
+        mock_hass.states.get.return_value = mock_state(
+            "binary_sensor.test_window", STATE_ON
+        )
+        await manager._async_window_changed(None)
+
+        mock_hass.async_run_hass_job.assert_called_once()
+        assert mock_hass.async_run_hass_job.call_args[0][0].target is listener
+
+    @pytest.mark.asyncio
+    async def test_no_notification_without_preset_change(self, mock_hass, mock_state):
+        """Test overrides that leave the active preset unchanged stay silent."""
+        mock_hass.async_run_hass_job = Mock()
+        manager = PresetManager(
+            mock_hass, "Test", None, "binary_sensor.presence", None, None, None,
+            initial_preset="present",
+        )
+        manager._last_active_preset = "present"
+        manager.async_add_listener(Mock())
+
+        # Presence only overrides AWAY, so PRESENT stays PRESENT
+        mock_hass.states.get.return_value = mock_state("binary_sensor.presence", STATE_ON)
+        await manager._async_presence_changed(None)
+
+        mock_hass.async_run_hass_job.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_global_away_notifies_listener(self, mock_hass, mock_state):
+        """Test global away activation notifies listeners."""
+        mock_hass.async_run_hass_job = Mock()
+        manager = PresetManager(
+            mock_hass, "Test", None, None, None, None, "binary_sensor.house_empty",
+            initial_preset="present",
+        )
+        manager._last_active_preset = "present"
+        manager.async_add_listener(Mock())
+
+        mock_hass.states.get.return_value = mock_state("binary_sensor.house_empty", STATE_ON)
+        await manager._async_global_away_changed(None)
+
+        assert manager.get_active_preset() == "away"
+        mock_hass.async_run_hass_job.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cleared_manual_override_notifies_listener(
+        self, mock_hass, mock_state, basic_schedule_config, mock_datetime
+    ):
+        """Test clearing a manual override notifies even if the preset returns to the last notified one."""
+        mock_hass.async_run_hass_job = Mock()
+        mock_datetime.set_time(datetime(2024, 1, 15, 12, 0))  # Monday 12:00 (away)
+        manager = PresetManager(
+            mock_hass, "Test", basic_schedule_config, None, None, None,
+            "binary_sensor.house_empty",
+        )
+        mock_hass.states.get.return_value = mock_state("binary_sensor.house_empty", STATE_ON)
+        await manager._async_global_away_changed(None)
+        await manager._async_update_schedule(None)
+        manager.async_add_listener(Mock())
+
+        manager.set_manual_preset("cosy")
+        mock_datetime.set_time(datetime(2024, 1, 15, 17, 0))  # present, but globally away
+        await manager._async_update_schedule(None)
+
+        assert manager.get_active_preset() == "away"
+        mock_hass.async_run_hass_job.assert_called_once()
+
+
 class TestOutdoorTemperature:
     """Test outdoor temperature override."""
 
@@ -613,6 +929,7 @@ class TestOverrideStatus:
 
         status = manager.get_override_status()
 
+        assert status["next_transition_preset"] == "present"
         assert status["scheduled_preset"] == "present"
         assert status["manual_override"] == "cosy"
         assert status["presence_override"] is False
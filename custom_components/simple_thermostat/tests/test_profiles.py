@@ -0,0 +1,70 @@
+"""Tests for the TRV device profiles."""
+import pytest
+
+from ..profiles import (
+    DEFAULT_PROFILE,
+    PROFILE_BOSCH_BTH_RA,
+    PROFILE_GENERIC,
+    DeviceProfile,
+    get_profile,
+)
+
+
+class TestQuantize:
+    """Test setpoints are mapped to what the device can represent."""
+
+    @pytest.mark.parametrize(
+        "temperature, expected",
+        [(21.0, 21.0), (21.2, 21.0), (21.3, 21.5), (21.74, 21.5), (2.0, 5.0), (35.0, 30.0)],
+    )
+    def test_bosch_half_degree_steps(self, temperature, expected):
+        """Test Bosch setpoints are rounded to 0.5°C and clamped to 5-30°C."""
+        assert get_profile(PROFILE_BOSCH_BTH_RA).quantize(temperature) == expected
+
+    def test_no_float_noise(self):
+        """Test rounded values have no binary float residue."""
+        profile = DeviceProfile("fine", setpoint_step=0.1)
+
+        assert profile.quantize(21.34) == 21.3
+
+    def test_zero_step_only_clamps(self):
+        """Test a profile without a step keeps the precision."""
+        profile = DeviceProfile("continuous", setpoint_step=0)
+
+        assert profile.quantize(21.37) == 21.37
+
+
+class TestNaming:
+    """Test entity and topic naming."""
+
+    def test_bosch_valve_entity(self):
+        """Test the Bosch valve entity pattern."""
+        profile = get_profile(PROFILE_BOSCH_BTH_RA)
+
+        assert profile.get_valve_entity("kitchen_trv") == "number.kitchen_trv_pi_heating_demand"
+
+    def test_bosch_topic(self):
+        """Test the Zigbee2MQTT topic is built from the friendly name."""
+        profile = get_profile(PROFILE_BOSCH_BTH_RA)
+
+        assert profile.get_command_topic("Kitchen TRV") == "zigbee2mqtt/Kitchen TRV/set"
+
+    def test_generic_has_no_valve_or_topic(self):
+        """Test the generic profile only supports setpoints."""
+        profile = get_profile(PROFILE_GENERIC)
+
+        assert profile.get_valve_entity("kitchen_trv") is None
+        assert profile.get_command_topic("Kitchen TRV") is None
+        assert not profile.supports_remote_temperature
+
+
+class TestRegistry:
+    """Test profile lookup."""
+
+    def test_default_profile(self):
+        """Test None selects the default profile."""
+        assert get_profile(None).name == DEFAULT_PROFILE
+
+    def test_unknown_profile_falls_back(self):
+        """Test an unknown name falls back to the default profile."""
+        assert get_profile("unknown").name == DEFAULT_PROFILE
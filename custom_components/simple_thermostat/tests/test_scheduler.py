@@ -0,0 +1,137 @@
+"""Tests for the house-wide command scheduler."""
+import asyncio
+
+import pytest
+from unittest.mock import Mock
+
+from .. import DOMAIN
+from .. import scheduler as scheduler_module
+from ..scheduler import (
+    PRIORITY_CONTROL,
+    PRIORITY_INIT,
+    PRIORITY_SAFETY,
+    PRIORITY_SYNC,
+    CommandScheduler,
+    async_get_scheduler,
+)
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance."""
+    hass = Mock()
+    hass.data = {}
+    return hass
+
+
+class TestSchedulerLookup:
+    """Test the domain-level scheduler instance."""
+
+    def test_scheduler_is_shared(self, mock_hass):
+        """Test the same scheduler is returned for every room."""
+        first = async_get_scheduler(mock_hass)
+
+        assert async_get_scheduler(mock_hass) is first
+        assert mock_hass.data[DOMAIN]["scheduler"] is first
+
+
+class TestRateLimit:
+    """Test the token bucket."""
+
+    @pytest.mark.asyncio
+    async def test_burst_passes_immediately(self, mock_hass):
+        """Test commands within the burst are not delayed."""
+        scheduler = CommandScheduler(mock_hass, rate=1, burst=3)
+
+        for _ in range(3):
+            await asyncio.wait_for(scheduler.async_acquire(), 0.01)
+
+        assert scheduler.get_stats()["commands_rate_limited"] == 0
+
+    @pytest.mark.asyncio
+    async def test_commands_beyond_burst_wait(self, mock_hass):
+        """Test commands beyond the burst wait for tokens to refill."""
+        scheduler = CommandScheduler(mock_hass, rate=50, burst=1)
+        loop = asyncio.get_running_loop()
+
+        start = loop.time()
+        await scheduler.async_acquire()
+        await scheduler.async_acquire()
+        await scheduler.async_acquire()
+
+        assert loop.time() - start >= 0.03
+        stats = scheduler.get_stats()
+        assert stats["commands_rate_limited"] == 2
+        assert stats["command_wait_max_ms"] > 0
+        assert stats["command_queue_depth"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cost_counts_devices(self, mock_hass):
+        """Test a multi-entity command takes one token per device."""
+        scheduler = CommandScheduler(mock_hass, rate=1, burst=4)
+
+        await scheduler.async_acquire(PRIORITY_CONTROL, cost=4)
+
+        assert scheduler._tokens < 1
+
+
+class TestPriorities:
+    """Test that queued commands are released in priority order."""
+
+    @pytest.mark.asyncio
+    async def test_safety_overtakes_sync(self, mock_hass):
+        """Test a safety command queued last is sent first."""
+        scheduler = CommandScheduler(mock_hass, rate=100, burst=1)
+        await scheduler.async_acquire()  # Empty the bucket
+        order = []
+
+        async def _send(priority, label):
+            await scheduler.async_acquire(priority)
+            order.append(label)
+
+        tasks = [
+            asyncio.create_task(_send(PRIORITY_INIT, "init")),
+            asyncio.create_task(_send(PRIORITY_SYNC, "sync")),
+            asyncio.create_task(_send(PRIORITY_SAFETY, "safety")),
+        ]
+        await asyncio.sleep(0)
+        assert scheduler.get_queue_depth() == {
+            "safety": 1, "control": 0, "sync": 1, "init": 1
+        }
+
+        await asyncio.wait_for(asyncio.gather(*tasks), 1)
+
+        assert order == ["safety", "sync", "init"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_is_removed(self, mock_hass):
+        """Test a cancelled command leaves the queue."""
+        scheduler = CommandScheduler(mock_hass, rate=1, burst=1)
+        await scheduler.async_acquire()
+
+        task = asyncio.create_task(scheduler.async_acquire(PRIORITY_SYNC))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert scheduler.get_stats()["command_queue_depth"] == 0
+
+
+class TestStartupJitter:
+    """Test startup staggering."""
+
+    def test_startup_delay_within_jitter(self, mock_hass, monkeypatch):
+        """Test the startup delay is drawn from the configured window."""
+        scheduler = CommandScheduler(mock_hass, startup_jitter=30)
+        monkeypatch.setattr(scheduler_module.random, "uniform", lambda low, high: high)
+
+        assert scheduler.get_startup_delay() == 30
+
+    def test_configure(self, mock_hass):
+        """Test YAML options are applied."""
+        scheduler = CommandScheduler(mock_hass)
+        scheduler.async_configure(2.0, 3, 0)
+
+        assert scheduler.get_startup_delay() == 0
+        assert scheduler._tokens == 3
@@ -2,7 +2,16 @@
 import pytest
 from unittest.mock import Mock
 
+from homeassistant.components.sensor import SensorStateClass
+
 from ..sensor import (
+    DIAGNOSTICS_COMPACT,
+    DIAGNOSTICS_FULL,
+    DIAGNOSTICS_NONE,
+    DIAGNOSTICS_ROOM,
+    SimpleThermostatMetricsSensor,
+    SimpleThermostatTRVSummarySensor,
+    async_create_sensors,
     SimpleThermostatControlModeSensor,
     SimpleThermostatErrorSensor,
     SimpleThermostatHeatingBinarySensor,
@@ -25,6 +34,7 @@ def mock_climate_entity():
     entity._target_temp = 21.0
     entity._valve_positions = {"number.test_valve": 75.0}
     entity._valve_entities = ["number.test_valve"]
+    entity._trv_valve_entities = ["number.test_valve"]
     entity._trv_internal_temps = {0: 19.5}
     entity._trv_target_temps = {0: 21.5}
     entity._trv_names = ["Test Valve"]
@@ -50,13 +60,11 @@ class TestControlModeSensor:
 
         assert sensor.state == CONTROL_MODE_BINARY_HEAT
 
-    @pytest.mark.asyncio
-    async def test_sensor_update(self, mock_climate_entity):
-        """Test sensor async_update method."""
+    def test_sensor_not_polled(self, mock_climate_entity):
+        """Test the sensor is push-driven instead of polled."""
         sensor = SimpleThermostatControlModeSensor(mock_climate_entity)
 
-        # Should not raise any errors
-        await sensor.async_update()
+        assert sensor.should_poll is False
 
 
 class TestTemperatureErrorSensor:
@@ -204,7 +212,7 @@ class TestTRVValvePositionSensor:
 
     def test_sensor_state(self, mock_climate_entity):
         """Test sensor returns correct valve position."""
-        mock_climate_entity._valve_entities = ["number.test_valve"]
+        mock_climate_entity._trv_valve_entities = ["number.test_valve"]
         mock_climate_entity._valve_positions = {"number.test_valve": 75.0}
         sensor = SimpleThermostatTRVValvePositionSensor(mock_climate_entity, 0)
 
@@ -212,7 +220,7 @@ class TestTRVValvePositionSensor:
 
     def test_sensor_state_zero(self, mock_climate_entity):
         """Test sensor returns 0 when valve closed."""
-        mock_climate_entity._valve_entities = ["number.test_valve"]
+        mock_climate_entity._trv_valve_entities = ["number.test_valve"]
         mock_climate_entity._valve_positions = {"number.test_valve": 0}
         sensor = SimpleThermostatTRVValvePositionSensor(mock_climate_entity, 0)
 
@@ -220,7 +228,7 @@ class TestTRVValvePositionSensor:
 
     def test_sensor_state_missing(self, mock_climate_entity):
         """Test sensor returns 0 when valve position not tracked."""
-        mock_climate_entity._valve_entities = ["number.test_valve"]
+        mock_climate_entity._trv_valve_entities = ["number.test_valve"]
         mock_climate_entity._valve_positions = {}
         sensor = SimpleThermostatTRVValvePositionSensor(mock_climate_entity, 0)
 
@@ -240,7 +248,7 @@ class TestTRVHeatingBinarySensor:
 
     def test_sensor_on_when_valve_open(self, mock_climate_entity):
         """Test sensor is ON when this TRV's valve is open."""
-        mock_climate_entity._valve_entities = ["number.test_valve"]
+        mock_climate_entity._trv_valve_entities = ["number.test_valve"]
         mock_climate_entity._valve_positions = {"number.test_valve": 50}
         sensor = SimpleThermostatTRVHeatingBinarySensor(mock_climate_entity, 0)
 
@@ -248,7 +256,7 @@ class TestTRVHeatingBinarySensor:
 
     def test_sensor_off_when_valve_closed(self, mock_climate_entity):
         """Test sensor is OFF when this TRV's valve is closed."""
-        mock_climate_entity._valve_entities = ["number.test_valve"]
+        mock_climate_entity._trv_valve_entities = ["number.test_valve"]
         mock_climate_entity._valve_positions = {"number.test_valve": 0}
         sensor = SimpleThermostatTRVHeatingBinarySensor(mock_climate_entity, 0)
 
@@ -256,7 +264,7 @@ class TestTRVHeatingBinarySensor:
 
     def test_sensor_off_when_valve_missing(self, mock_climate_entity):
         """Test sensor is OFF when valve position not tracked."""
-        mock_climate_entity._valve_entities = ["number.test_valve"]
+        mock_climate_entity._trv_valve_entities = ["number.test_valve"]
         mock_climate_entity._valve_positions = {}
         sensor = SimpleThermostatTRVHeatingBinarySensor(mock_climate_entity, 0)
 
@@ -293,3 +301,188 @@ class TestSensorNaming:
 
         # Should use custom name
         assert "Hauptventil Internal Temp" in sensor._attr_name
+
+
+class TestPushUpdates:
+    """Test diagnostic entities follow the climate entity by push."""
+
+    @pytest.mark.asyncio
+    async def test_subscribes_to_climate_entity(self, mock_climate_entity):
+        """Test the sensor registers a diagnostic listener when added."""
+        remover = Mock()
+        mock_climate_entity.async_add_diagnostic_listener = Mock(return_value=remover)
+        sensor = SimpleThermostatTRVValvePositionSensor(mock_climate_entity, 0)
+        sensor.hass = Mock()
+
+        await sensor.async_added_to_hass()
+
+        mock_climate_entity.async_add_diagnostic_listener.assert_called_once_with(
+            sensor._async_parent_updated
+        )
+
+    def test_writes_only_when_value_changed(self, mock_climate_entity):
+        """Test the sensor writes state only when its own value changed."""
+        sensor = SimpleThermostatTRVValvePositionSensor(mock_climate_entity, 0)
+        sensor.async_write_ha_state = Mock()
+        sensor._last_value = 75.0
+
+        sensor._async_parent_updated()
+        sensor.async_write_ha_state.assert_not_called()
+
+        mock_climate_entity._valve_positions = {"number.test_valve": 20.0}
+        sensor._async_parent_updated()
+        sensor.async_write_ha_state.assert_called_once()
+
+    def test_binary_sensor_push(self, mock_climate_entity):
+        """Test binary sensors are push-driven too."""
+        sensor = SimpleThermostatHeatingBinarySensor(mock_climate_entity)
+        sensor.async_write_ha_state = Mock()
+        sensor._last_value = True
+
+        mock_climate_entity._valve_positions = {"number.test_valve": 0}
+        sensor._async_parent_updated()
+
+        assert sensor.should_poll is False
+        sensor.async_write_ha_state.assert_called_once()
+
+    def test_measurement_state_class(self, mock_climate_entity):
+        """Test numeric sensors feed long-term statistics."""
+        assert SimpleThermostatErrorSensor(mock_climate_entity).state_class == SensorStateClass.MEASUREMENT
+        assert SimpleThermostatTRVInternalTempSensor(mock_climate_entity, 0).state_class == SensorStateClass.MEASUREMENT
+        assert SimpleThermostatTRVTargetTempSensor(mock_climate_entity, 0).state_class == SensorStateClass.MEASUREMENT
+        assert SimpleThermostatTRVValvePositionSensor(mock_climate_entity, 0).state_class == SensorStateClass.MEASUREMENT
+        assert SimpleThermostatControlModeSensor(mock_climate_entity).state_class is None
+
+
+class TestDiagnosticsLevels:
+    """Test the number of entities created per diagnostics level."""
+
+    @pytest.fixture
+    def three_trv_entity(self, mock_climate_entity):
+        """Create a mock climate entity with three TRVs."""
+        mock_climate_entity._trv_names = [None, None, None]
+        mock_climate_entity._climate_entities = ["climate.a", "climate.b", "climate.c"]
+        mock_climate_entity._valve_entities = ["number.a", "number.b", "number.c"]
+        mock_climate_entity._trv_valve_entities = ["number.a", "number.b", "number.c"]
+        mock_climate_entity._valve_positions = {"number.a": 0, "number.b": 60.0}
+        return mock_climate_entity
+
+    @pytest.mark.asyncio
+    async def test_full(self, three_trv_entity):
+        """Test full creates room sensors plus four sensors per TRV."""
+        sensors = await async_create_sensors(Mock(), three_trv_entity, DIAGNOSTICS_FULL)
+        assert len(sensors) == 3 + 4 * 3
+
+    @pytest.mark.asyncio
+    async def test_default_is_full(self, three_trv_entity):
+        """Test the default level keeps the previous behavior."""
+        sensors = await async_create_sensors(Mock(), three_trv_entity)
+        assert len(sensors) == 15
+
+    @pytest.mark.asyncio
+    async def test_full_mixed_profiles(self, mock_climate_entity):
+        """Test TRVs without a valve entity get no valve or heating sensors."""
+        mock_climate_entity._trv_names = [None, None]
+        mock_climate_entity._climate_entities = ["climate.a", "climate.b"]
+        mock_climate_entity._valve_entities = ["number.b_pi_heating_demand"]
+        mock_climate_entity._trv_valve_entities = [None, "number.b_pi_heating_demand"]
+        mock_climate_entity._valve_positions = {"number.b_pi_heating_demand": 40.0}
+
+        sensors = await async_create_sensors(Mock(), mock_climate_entity, DIAGNOSTICS_FULL)
+
+        assert len(sensors) == 3 + 2 + 4
+        valve_sensors = [
+            sensor for sensor in sensors
+            if isinstance(sensor, (SimpleThermostatTRVValvePositionSensor, SimpleThermostatTRVHeatingBinarySensor))
+        ]
+        assert [sensor._trv_index for sensor in valve_sensors] == [1, 1]
+        assert valve_sensors[0].state == 40.0
+        assert valve_sensors[1].is_on is True
+
+    @pytest.mark.asyncio
+    async def test_compact(self, three_trv_entity):
+        """Test compact creates room sensors plus one summary sensor."""
+        sensors = await async_create_sensors(Mock(), three_trv_entity, DIAGNOSTICS_COMPACT)
+        assert len(sensors) == 4
+        assert isinstance(sensors[-1], SimpleThermostatTRVSummarySensor)
+
+    @pytest.mark.asyncio
+    async def test_room(self, three_trv_entity):
+        """Test room creates only the room-level sensors."""
+        sensors = await async_create_sensors(Mock(), three_trv_entity, DIAGNOSTICS_ROOM)
+        assert len(sensors) == 3
+
+    @pytest.mark.asyncio
+    async def test_none(self, three_trv_entity):
+        """Test none creates no entities."""
+        assert await async_create_sensors(Mock(), three_trv_entity, DIAGNOSTICS_NONE) == []
+
+    def test_summary_sensor_values(self, three_trv_entity):
+        """Test the summary sensor carries all per-TRV values."""
+        three_trv_entity._trv_internal_temps = {1: 19.5}
+        sensor = SimpleThermostatTRVSummarySensor(three_trv_entity)
+
+        assert sensor._attr_unique_id == "test_thermostat_trvs"
+        assert sensor.state == 60.0
+        attributes = sensor.extra_state_attributes
+        assert attributes["trv_2_internal_temp"] == 19.5
+        assert attributes["trv_2_heating"] is True
+        assert attributes["trv_1_heating"] is False
+        assert attributes["trv_3_valve_position"] == 0
+
+    def test_summary_sensor_mixed_profiles(self, mock_climate_entity):
+        """Test values stay with their TRV when one TRV has no valve entity."""
+        mock_climate_entity._trv_names = [None, None]
+        mock_climate_entity._climate_entities = ["climate.a", "climate.b"]
+        mock_climate_entity._trv_valve_entities = [None, "number.b"]
+        mock_climate_entity._valve_positions = {"number.b": 40.0}
+        mock_climate_entity._trv_internal_temps = {0: 19.0, 1: 20.5}
+        mock_climate_entity._trv_target_temps = {}
+        sensor = SimpleThermostatTRVSummarySensor(mock_climate_entity)
+
+        assert sensor.extra_state_attributes == {
+            "trv_1_internal_temp": 19.0,
+            "trv_1_target_temp": None,
+            "trv_2_internal_temp": 20.5,
+            "trv_2_target_temp": None,
+            "trv_2_valve_position": 40.0,
+            "trv_2_heating": True,
+        }
+        assert sensor.state == 40.0
+
+    def test_summary_sensor_without_valves(self, mock_climate_entity):
+        """Test TRVs are listed even if no valve entities are configured."""
+        mock_climate_entity._trv_valve_entities = []
+        sensor = SimpleThermostatTRVSummarySensor(mock_climate_entity)
+
+        assert sensor.extra_state_attributes == {
+            "test_valve_internal_temp": 19.5,
+            "test_valve_target_temp": 21.5,
+        }
+        assert sensor.state == 0
+
+    @pytest.mark.asyncio
+    async def test_metrics_sensor_is_opt_in(self, three_trv_entity):
+        """Test the metrics sensor is added on request, even without diagnostics."""
+        sensors = await async_create_sensors(
+            Mock(), three_trv_entity, DIAGNOSTICS_NONE, metrics=True
+        )
+
+        assert len(sensors) == 1
+        assert isinstance(sensors[0], SimpleThermostatMetricsSensor)
+
+
+class TestMetricsSensor:
+    """Test the control loop metrics sensor."""
+
+    def test_state_and_attributes(self, mock_climate_entity):
+        """Test the state is the hourly call rate and metrics are attributes."""
+        metrics = {"service_calls_per_hour": 42, "commands_failed": 1}
+        mock_climate_entity.get_metrics = Mock(return_value=metrics)
+        sensor = SimpleThermostatMetricsSensor(mock_climate_entity)
+
+        assert sensor._attr_unique_id == "test_thermostat_control_metrics"
+        assert sensor.state == 42
+        assert sensor.extra_state_attributes == metrics
+        assert "control_cycle_ms" in sensor._unrecorded_attributes
+
@@ -0,0 +1,87 @@
+"""Tests for the domain-wide diagnostic sensor registry."""
+import pytest
+from unittest.mock import Mock, patch
+
+from homeassistant.components.binary_sensor import BinarySensorEntity
+from homeassistant.components.sensor import SensorEntity
+
+from .. import DOMAIN
+from .. import sensor_registry as registry_module
+from ..sensor_registry import (
+    PLATFORM_BINARY_SENSOR,
+    PLATFORM_SENSOR,
+    async_get_sensor_registry,
+)
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance."""
+    hass = Mock()
+    hass.data = {}
+    return hass
+
+
+@pytest.fixture
+def mock_load_platform():
+    """Patch the platform loader."""
+    with patch.object(registry_module, "async_load_platform", Mock()) as load:
+        yield load
+
+
+def _room_sensors():
+    """Return the mixed sensor list of one room."""
+    return [Mock(spec=SensorEntity), Mock(spec=SensorEntity), Mock(spec=BinarySensorEntity)]
+
+
+class TestPlatformLoading:
+    """Test each platform is loaded once for all rooms."""
+
+    def test_registry_is_shared(self, mock_hass):
+        """Test the same registry is returned for every room."""
+        registry = async_get_sensor_registry(mock_hass)
+
+        assert async_get_sensor_registry(mock_hass) is registry
+        assert mock_hass.data[DOMAIN]["sensor_registry"] is registry
+
+    def test_many_rooms_load_each_platform_once(self, mock_hass, mock_load_platform):
+        """Test startup triggers one load per platform regardless of room count."""
+        registry = async_get_sensor_registry(mock_hass)
+
+        for _ in range(20):
+            registry.async_add_sensors(_room_sensors(), {})
+
+        assert mock_load_platform.call_count == 2
+        assert {c.args[1] for c in mock_load_platform.call_args_list} == {
+            PLATFORM_SENSOR,
+            PLATFORM_BINARY_SENSOR,
+        }
+        assert registry.platform_loads == 2
+
+    def test_queued_entities_added_in_one_batch(self, mock_hass, mock_load_platform):
+        """Test entities queued while loading are added with one call."""
+        registry = async_get_sensor_registry(mock_hass)
+        for _ in range(3):
+            registry.async_add_sensors(_room_sensors(), {})
+
+        add_sensors = Mock()
+        add_binary_sensors = Mock()
+        registry.async_register_platform(PLATFORM_SENSOR, add_sensors)
+        registry.async_register_platform(PLATFORM_BINARY_SENSOR, add_binary_sensors)
+
+        add_sensors.assert_called_once()
+        assert len(add_sensors.call_args[0][0]) == 6
+        assert len(add_binary_sensors.call_args[0][0]) == 3
+
+    def test_late_room_added_directly(self, mock_hass, mock_load_platform):
+        """Test rooms set up after the platform loaded skip the platform load."""
+        registry = async_get_sensor_registry(mock_hass)
+        registry.async_add_sensors(_room_sensors(), {})
+        add_sensors = Mock()
+        registry.async_register_platform(PLATFORM_SENSOR, add_sensors)
+
+        late = [Mock(spec=SensorEntity)]
+        registry.async_add_sensors(late, {})
+
+        add_sensors.assert_called_with(late)
+        assert mock_load_platform.call_count == 2
@@ -0,0 +1,98 @@
+"""Tests for the persistent controller state store."""
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from .. import DOMAIN
+from .. import storage as storage_module
+from ..storage import SAVE_DELAY, async_get_state_store
+
+
+@pytest.fixture
+def mock_store():
+    """Patch the HA Store used by the state store."""
+    with patch.object(storage_module, "Store") as store_cls:
+        store = store_cls.return_value
+        store.async_load = AsyncMock(return_value=None)
+        yield store
+
+
+class TestLoading:
+    """Test loading the shared state file."""
+
+    @pytest.mark.asyncio
+    async def test_store_is_shared_and_loaded_once(self, mock_hass, mock_store):
+        """Test every room gets the same store and the file is read once."""
+        mock_hass.data = {}
+        mock_store.async_load.return_value = {"rooms": {"living": {"hvac_mode": "heat"}}}
+
+        first = await async_get_state_store(mock_hass)
+        second = await async_get_state_store(mock_hass)
+
+        assert first is second
+        assert mock_hass.data[DOMAIN]["state_store"] is first
+        assert first.get("living") == {"hvac_mode": "heat"}
+        assert first.get("kitchen") is None
+        mock_store.async_load.assert_awaited_once()
+
+
+class TestSaving:
+    """Test debounced, batched saves."""
+
+    @pytest.mark.asyncio
+    async def test_saves_are_batched(self, mock_hass, mock_store):
+        """Test many save requests schedule a single delayed write."""
+        mock_hass.data = {}
+        state_store = await async_get_state_store(mock_hass)
+
+        for _ in range(10):
+            state_store.async_schedule_save()
+
+        mock_store.async_delay_save.assert_called_once()
+        assert mock_store.async_delay_save.call_args[0][1] == SAVE_DELAY
+
+    @pytest.mark.asyncio
+    async def test_snapshots_taken_at_write_time(self, mock_hass, mock_store):
+        """Test all rooms are snapshotted when the file is written."""
+        mock_hass.data = {}
+        state_store = await async_get_state_store(mock_hass)
+        living = {"hvac_mode": "off"}
+        state_store.async_register("living", lambda: dict(living))
+        state_store.async_register("kitchen", lambda: {"hvac_mode": "heat"})
+
+        state_store.async_schedule_save()
+        living["hvac_mode"] = "heat"
+        data_func = mock_store.async_delay_save.call_args[0][0]
+
+        assert data_func() == {
+            "rooms": {"living": {"hvac_mode": "heat"}, "kitchen": {"hvac_mode": "heat"}}
+        }
+
+        # A new window opens after the write
+        state_store.async_schedule_save()
+        assert mock_store.async_delay_save.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unregister_keeps_final_snapshot(self, mock_hass, mock_store):
+        """Test a removed room keeps its last snapshot in the file."""
+        mock_hass.data = {}
+        state_store = await async_get_state_store(mock_hass)
+        unregister = state_store.async_register("living", lambda: {"hvac_mode": "heat"})
+
+        unregister()
+
+        assert state_store.get("living") == {"hvac_mode": "heat"}
+        data_func = mock_store.async_delay_save.call_args[0][0]
+        assert data_func() == {"rooms": {"living": {"hvac_mode": "heat"}}}
+
+    @pytest.mark.asyncio
+    async def test_failing_provider_keeps_other_rooms(self, mock_hass, mock_store):
+        """Test one broken room does not prevent saving the others."""
+        mock_hass.data = {}
+        state_store = await async_get_state_store(mock_hass)
+        state_store.async_register("broken", Mock(side_effect=RuntimeError("boom")))
+        state_store.async_register("living", lambda: {"hvac_mode": "heat"})
+
+        state_store.async_schedule_save()
+        data_func = mock_store.async_delay_save.call_args[0][0]
+
+        assert data_func() == {"rooms": {"living": {"hvac_mode": "heat"}}}
@@ -0,0 +1,276 @@
+"""Tests for the TRV transport backends."""
+import json
+import pytest
+from unittest.mock import AsyncMock, Mock
+
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+
+from ..profiles import PROFILE_BOSCH_BTH_RA, PROFILE_GENERIC, get_profile
+from ..scheduler import PRIORITY_INIT, PRIORITY_SYNC
+from ..transport import (
+    TRANSPORT_CLIMATE,
+    TRANSPORT_ZHA,
+    TRANSPORT_ZIGBEE2MQTT,
+    TRVTransport,
+    ZHATransport,
+    Zigbee2MQTTTransport,
+    create_transport,
+)
+
+BOSCH = get_profile(PROFILE_BOSCH_BTH_RA)
+GENERIC = get_profile(PROFILE_GENERIC)
+
+
+class FakeBroker:
+    """Stand-in for a local MQTT broker that records every publish."""
+
+    def __init__(self):
+        self.messages = []
+
+    async def async_publish(self, topic, payload):
+        self.messages.append((topic, json.loads(payload)))
+
+    @property
+    def topics(self):
+        return [topic for topic, _ in self.messages]
+
+
+@pytest.fixture
+def devices():
+    """Device registry contents: device_id -> (name, identifiers)."""
+    return {
+        "dev_living": ("Living Room TRV", {("mqtt", "zigbee2mqtt_0x01")}),
+        "dev_zha": ("BTH-RA", {("zha", "00:11:22:33:44:55:66:77")}),
+    }
+
+
+@pytest.fixture
+def mock_hass(devices):
+    """Create a mock Home Assistant instance with entity and device registries."""
+    entity_to_device = {
+        "climate.living_trv": "dev_living",
+        "climate.zha_trv": "dev_zha",
+    }
+
+    def _get_entry(entity_id):
+        if entity_id not in entity_to_device:
+            return None
+        return Mock(device_id=entity_to_device[entity_id])
+
+    def _get_device(device_id):
+        device_name, identifiers = devices[device_id]
+        device = Mock(identifiers=identifiers)
+        device.name = device_name
+        return device
+
+    hass = Mock()
+    hass.services = Mock()
+    hass.services.async_call = AsyncMock()
+    hass.data = {
+        er.DATA_REGISTRY: Mock(async_get=Mock(side_effect=_get_entry)),
+        dr.DATA_REGISTRY: Mock(async_get=Mock(side_effect=_get_device)),
+    }
+    return hass
+
+
+@pytest.fixture
+def broker():
+    """Create a fake MQTT broker."""
+    return FakeBroker()
+
+
+class TestZigbee2MQTT:
+    """Test the Zigbee2MQTT backend."""
+
+    @pytest.mark.asyncio
+    async def test_friendly_name_from_device_registry(self, mock_hass, broker):
+        """Test topics use the device name, not the entity id."""
+        transport = Zigbee2MQTTTransport(mock_hass, "Test", publisher=broker.async_publish)
+
+        await transport.async_send_remote_temperature([("climate.living_trv", BOSCH)], 20.5)
+
+        assert broker.messages == [
+            ("zigbee2mqtt/Living Room TRV/set", {"remote_temperature": 20.5})
+        ]
+
+    @pytest.mark.asyncio
+    async def test_registry_friendly_name_is_cached(self, mock_hass, broker):
+        """Test a device found in the registry is looked up once."""
+        transport = Zigbee2MQTTTransport(mock_hass, "Test", publisher=broker.async_publish)
+
+        await transport.async_send_remote_temperature([("climate.living_trv", BOSCH)], 20.5)
+        await transport.async_send_remote_temperature([("climate.living_trv", BOSCH)], 21.0)
+
+        assert broker.topics == ["zigbee2mqtt/Living Room TRV/set"] * 2
+        assert mock_hass.data[er.DATA_REGISTRY].async_get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_fallback_friendly_name_is_not_cached(self, mock_hass, broker, devices):
+        """Test unknown entities fall back to the object id until their device is registered."""
+        transport = Zigbee2MQTTTransport(mock_hass, "Test", publisher=broker.async_publish)
+
+        await transport.async_send_remote_temperature([("climate.kitchen_trv", BOSCH)], 20.5)
+        devices["dev_kitchen"] = ("Kitchen TRV", {("mqtt", "zigbee2mqtt_0x02")})
+        mock_hass.data[er.DATA_REGISTRY].async_get.side_effect = lambda entity_id: Mock(
+            device_id="dev_kitchen"
+        )
+        await transport.async_send_remote_temperature([("climate.kitchen_trv", BOSCH)], 21.0)
+
+        assert broker.topics == [
+            "zigbee2mqtt/kitchen trv/set",
+            "zigbee2mqtt/Kitchen TRV/set",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_group_topic_reaches_room_in_one_publish(self, mock_hass, broker):
+        """Test a room with a Zigbee2MQTT group gets one publish for all TRVs."""
+        transport = Zigbee2MQTTTransport(
+            mock_hass,
+            "Test",
+            mqtt_group="Living Room",
+            group_members=["climate.living_trv", "climate.kitchen_trv"],
+            publisher=broker.async_publish,
+        )
+
+        await transport.async_set_manual_mode(
+            [("climate.living_trv", BOSCH), ("climate.kitchen_trv", BOSCH)]
+        )
+
+        assert broker.messages == [
+            ("zigbee2mqtt/Living Room/set", {"operating_mode": "manual"})
+        ]
+        assert transport.messages_sent == 1
+
+    @pytest.mark.asyncio
+    async def test_group_not_used_for_partial_support(self, mock_hass, broker):
+        """Test the group topic is skipped if not every TRV supports the command."""
+        transport = Zigbee2MQTTTransport(
+            mock_hass,
+            "Test",
+            mqtt_group="Living Room",
+            group_members=["climate.living_trv", "climate.kitchen_trv"],
+            publisher=broker.async_publish,
+        )
+
+        await transport.async_send_remote_temperature(
+            [("climate.living_trv", BOSCH), ("climate.kitchen_trv", GENERIC)], 20.5
+        )
+
+        assert broker.topics == ["zigbee2mqtt/Living Room TRV/set"]
+
+    @pytest.mark.asyncio
+    async def test_group_not_used_for_some_members(self, mock_hass, broker):
+        """Test a command for part of the group (e.g. TRVs still to initialize) goes per device."""
+        transport = Zigbee2MQTTTransport(
+            mock_hass,
+            "Test",
+            mqtt_group="Living Room",
+            group_members=["climate.living_trv", "climate.kitchen_trv"],
+            publisher=broker.async_publish,
+        )
+
+        await transport.async_set_manual_mode([("climate.living_trv", BOSCH)])
+
+        assert broker.topics == ["zigbee2mqtt/Living Room TRV/set"]
+
+    @pytest.mark.asyncio
+    async def test_publishes_within_command_budget(self, mock_hass, broker):
+        """Test each publish waits for the scheduler with its priority."""
+        scheduler = Mock(async_acquire=AsyncMock())
+        transport = Zigbee2MQTTTransport(
+            mock_hass, "Test", scheduler, publisher=broker.async_publish
+        )
+
+        await transport.async_set_manual_mode([("climate.living_trv", BOSCH)])
+        await transport.async_send_remote_temperature([("climate.living_trv", BOSCH)], 20.5)
+
+        assert [c.args[0] for c in scheduler.async_acquire.call_args_list] == [
+            PRIORITY_INIT,
+            PRIORITY_SYNC,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_publish_failure_is_logged(self, mock_hass):
+        """Test a failing publish does not raise."""
+        transport = Zigbee2MQTTTransport(
+            mock_hass, "Test", publisher=AsyncMock(side_effect=Exception("offline"))
+        )
+
+        await transport.async_set_manual_mode([("climate.living_trv", BOSCH)])
+
+        assert transport.messages_sent == 0
+
+    @pytest.mark.asyncio
+    async def test_default_publisher_uses_mqtt_service(self, mock_hass):
+        """Test the default publisher calls mqtt.publish."""
+        transport = Zigbee2MQTTTransport(mock_hass, "Test")
+
+        await transport.async_set_manual_mode([("climate.living_trv", BOSCH)])
+
+        mock_hass.services.async_call.assert_called_once_with(
+            "mqtt",
+            "publish",
+            {"topic": "zigbee2mqtt/Living Room TRV/set", "payload": '{"operating_mode": "manual"}'},
+            blocking=False,
+        )
+
+
+class TestZHA:
+    """Test the ZHA backend."""
+
+    @pytest.mark.asyncio
+    async def test_remote_temperature_attribute(self, mock_hass):
+        """Test the remote temperature is written in 0.01°C to the TRV's IEEE."""
+        transport = ZHATransport(mock_hass, "Test")
+
+        await transport.async_send_remote_temperature([("climate.zha_trv", BOSCH)], 20.5)
+
+        mock_hass.services.async_call.assert_called_once_with(
+            "zha",
+            "set_zigbee_cluster_attribute",
+            {
+                "ieee": "00:11:22:33:44:55:66:77",
+                "endpoint_id": 1,
+                "cluster_id": 0x0201,
+                "attribute": 0x4040,
+                "value": 2050,
+                "manufacturer": 0x1209,
+            },
+            blocking=False,
+        )
+
+    @pytest.mark.asyncio
+    async def test_non_zha_device_is_skipped(self, mock_hass):
+        """Test TRVs without a ZHA identifier get no attribute writes."""
+        transport = ZHATransport(mock_hass, "Test")
+
+        await transport.async_set_manual_mode([("climate.living_trv", BOSCH)])
+
+        mock_hass.services.async_call.assert_not_called()
+
+
+class TestClimateBackend:
+    """Test the plain climate backend and backend selection."""
+
+    @pytest.mark.asyncio
+    async def test_no_side_channel(self, mock_hass):
+        """Test the climate backend sends nothing besides setpoints."""
+        transport = TRVTransport(mock_hass, "Test")
+
+        await transport.async_set_manual_mode([("climate.living_trv", BOSCH)])
+        await transport.async_send_remote_temperature([("climate.living_trv", BOSCH)], 20.5)
+
+        mock_hass.services.async_call.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "kind, expected",
+        [
+            (TRANSPORT_ZIGBEE2MQTT, Zigbee2MQTTTransport),
+            (TRANSPORT_ZHA, ZHATransport),
+            (TRANSPORT_CLIMATE, TRVTransport),
+        ],
+    )
+    def test_create_transport(self, mock_hass, kind, expected):
+        """Test the configured backend is created."""
+        assert type(create_transport(mock_hass, "Test", kind)) is expected
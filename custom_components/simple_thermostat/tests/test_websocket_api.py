@@ -0,0 +1,121 @@
+"""Tests for the websocket API used by the card."""
+import pytest
+from unittest.mock import Mock, patch
+
+from .. import websocket_api as websocket_module
+from ..coordinator import async_get_coordinator
+from ..websocket_api import ws_get_details, ws_get_metrics, ws_subscribe_details
+
+
+@pytest.fixture
+def mock_thermostat():
+    """Create a mock Simple Thermostat entity."""
+    thermostat = Mock()
+    thermostat.get_details = Mock(return_value={"action_history": [], "schedule": None})
+    return thermostat
+
+
+@pytest.fixture
+def mock_hass(mock_thermostat):
+    """Create a mock Home Assistant instance with one thermostat."""
+    hass = Mock()
+    hass.data = {}
+    mock_thermostat.entity_id = "climate.st_living"
+    async_get_coordinator(hass).async_register_thermostat(mock_thermostat)
+    return hass
+
+
+@pytest.fixture
+def mock_connection():
+    """Create a mock websocket connection."""
+    connection = Mock()
+    connection.subscriptions = {}
+    return connection
+
+
+class TestGetDetails:
+    """Test the one-shot details command."""
+
+    def test_returns_details(self, mock_hass, mock_connection):
+        """Test details of a known thermostat are returned."""
+        ws_get_details(
+            mock_hass,
+            mock_connection,
+            {"id": 1, "type": "simple_thermostat/details", "entity_id": "climate.st_living"},
+        )
+
+        mock_connection.send_result.assert_called_once_with(
+            1, {"action_history": [], "schedule": None}
+        )
+
+    def test_unknown_entity(self, mock_hass, mock_connection):
+        """Test an unknown entity returns an error."""
+        ws_get_details(
+            mock_hass,
+            mock_connection,
+            {"id": 1, "type": "simple_thermostat/details", "entity_id": "climate.other"},
+        )
+
+        mock_connection.send_error.assert_called_once()
+        mock_connection.send_result.assert_not_called()
+
+
+class TestSubscribeDetails:
+    """Test the details subscription."""
+
+    def test_sends_initial_and_updates(self, mock_hass, mock_connection, mock_thermostat):
+        """Test details are sent on subscribe and after every state write."""
+        unsub = Mock()
+        with patch.object(
+            websocket_module, "async_track_state_change_event", return_value=unsub
+        ) as track:
+            ws_subscribe_details(
+                mock_hass,
+                mock_connection,
+                {
+                    "id": 5,
+                    "type": "simple_thermostat/subscribe_details",
+                    "entity_id": "climate.st_living",
+                },
+            )
+
+        mock_connection.send_result.assert_called_once_with(5)
+        assert mock_connection.subscriptions[5] is unsub
+        assert mock_connection.send_message.call_count == 1
+
+        forward = track.call_args[0][2]
+        forward(Mock())
+
+        assert mock_connection.send_message.call_count == 2
+        assert mock_connection.send_message.call_args[0][0]["event"] == (
+            mock_thermostat.get_details.return_value
+        )
+
+    def test_unknown_entity(self, mock_hass, mock_connection):
+        """Test subscribing to an unknown entity returns an error."""
+        ws_subscribe_details(
+            mock_hass,
+            mock_connection,
+            {"id": 5, "type": "simple_thermostat/subscribe_details", "entity_id": "climate.other"},
+        )
+
+        mock_connection.send_error.assert_called_once()
+        assert mock_connection.subscriptions == {}
+
+
+class TestGetMetrics:
+    """Test the house-wide metrics command."""
+
+    def test_returns_rooms_and_total(self, mock_hass, mock_thermostat, mock_connection):
+        """Test metrics of all rooms are returned with totals."""
+        mock_thermostat.get_metrics = Mock(return_value={"control_cycles": 4})
+
+        ws_get_metrics(mock_hass, mock_connection, {"id": 7, "type": "simple_thermostat/metrics"})
+
+        mock_connection.send_result.assert_called_once_with(
+            7,
+            {
+                "rooms": {"climate.st_living": {"control_cycles": 4}},
+                "total": {"control_cycles": 4},
+            },
+        )
@@ -0,0 +1,281 @@
+"""TRV Transport - Delivers device-specific commands (manual mode, remote temperature)."""
+import json
+import logging
+from typing import Awaitable, Callable, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+
+from .profiles import DeviceProfile
+from .scheduler import PRIORITY_INIT, PRIORITY_SYNC, CommandScheduler
+
+_LOGGER = logging.getLogger(__name__)
+
+TRANSPORT_ZIGBEE2MQTT = "zigbee2mqtt"
+TRANSPORT_ZHA = "zha"
+TRANSPORT_CLIMATE = "climate"
+
+TRANSPORTS = [TRANSPORT_ZIGBEE2MQTT, TRANSPORT_ZHA, TRANSPORT_CLIMATE]
+DEFAULT_TRANSPORT = TRANSPORT_ZIGBEE2MQTT
+
+# Thermostat cluster, written by the ZHA transport
+ZHA_THERMOSTAT_CLUSTER = 0x0201
+ZHA_ENDPOINT = 1
+
+# async publisher(topic, payload)
+Publisher = Callable[[str, str], Awaitable[None]]
+
+
+def create_transport(
+    hass: HomeAssistant,
+    name: str,
+    kind: str,
+    scheduler: Optional[CommandScheduler] = None,
+    mqtt_group: Optional[str] = None,
+    group_members: Optional[list[str]] = None,
+    publisher: Optional[Publisher] = None,
+) -> "TRVTransport":
+    """Return the transport backend configured for a room."""
+    if kind == TRANSPORT_ZIGBEE2MQTT:
+        return Zigbee2MQTTTransport(
+            hass, name, scheduler, mqtt_group, group_members, publisher
+        )
+    if kind == TRANSPORT_ZHA:
+        return ZHATransport(hass, name, scheduler)
+    return TRVTransport(hass, name, scheduler)
+
+
+class TRVTransport:
+    """Plain Home Assistant ``climate`` backend.
+
+    Setpoints are always sent through ``climate.set_temperature`` (see
+    CommandFanout); this base backend has no side channel, so manual mode and
+    remote temperature are not available. Subclasses talk to the Zigbee stack.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        scheduler: Optional[CommandScheduler] = None,
+    ):
+        """Initialize the transport."""
+        self.hass = hass
+        self.name = name
+        self._scheduler = scheduler
+
+        # Statistics
+        self.messages_sent = 0
+
+    async def async_set_manual_mode(self, trvs: list[tuple[str, DeviceProfile]]):
+        """Switch TRVs (climate entity, profile) to manual operating mode."""
+
+    async def async_send_remote_temperature(
+        self, trvs: list[tuple[str, DeviceProfile]], temperature: float
+    ):
+        """Send the external room temperature to TRVs (climate entity, profile)."""
+
+    async def _async_acquire(self, priority: int):
+        """Wait for a slot in the house-wide command budget."""
+        if self._scheduler is not None:
+            await self._scheduler.async_acquire(priority)
+
+    def _get_device(self, entity_id: str):
+        """Return the device registry entry of an entity, if any."""
+        entry = er.async_get(self.hass).async_get(entity_id)
+        if entry is None or entry.device_id is None:
+            return None
+        return dr.async_get(self.hass).async_get(entry.device_id)
+
+
+class Zigbee2MQTTTransport(TRVTransport):
+    """Publishes to Zigbee2MQTT ``<base>/<friendly name>/set`` topics.
+
+    Friendly names are resolved from the device registry (Zigbee2MQTT
+    discovery names devices after them) and cached. With ``mqtt_group``, a
+    command that goes to every TRV of the group (``group_members``, the
+    room's climate entities) is published once to the group topic instead of
+    once per device.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        scheduler: Optional[CommandScheduler] = None,
+        mqtt_group: Optional[str] = None,
+        group_members: Optional[list[str]] = None,
+        publisher: Optional[Publisher] = None,
+    ):
+        """Initialize the transport."""
+        super().__init__(hass, name, scheduler)
+        self._mqtt_group = mqtt_group
+        self._group_members = set(group_members or [])
+        self._publisher = publisher or self._async_publish_service
+        self._friendly_names: dict[str, str] = {}
+
+    async def async_set_manual_mode(self, trvs):
+        """Publish the profile's manual-mode payload."""
+        supported = [
+            (entity, profile) for entity, profile in trvs if profile.manual_mode_payload
+        ]
+        await self._async_publish_all(
+            supported, lambda profile: profile.manual_mode_payload, PRIORITY_INIT
+        )
+
+    async def async_send_remote_temperature(self, trvs, temperature):
+        """Publish ``remote_temperature`` to TRVs that accept it."""
+        payload = json.dumps({"remote_temperature": temperature})
+        supported = [
+            (entity, profile)
+            for entity, profile in trvs
+            if profile.supports_remote_temperature
+        ]
+        await self._async_publish_all(supported, lambda profile: payload, PRIORITY_SYNC)
+
+    async def _async_publish_all(self, trvs, get_payload, priority):
+        """Publish to the group topic if the TRVs are exactly the group, else per device."""
+        if not trvs:
+            return
+
+        _, first_profile = trvs[0]
+        group_topic = (
+            first_profile.get_command_topic(self._mqtt_group) if self._mqtt_group else None
+        )
+        if (
+            group_topic is not None
+            and {entity for entity, _ in trvs} == self._group_members
+            and all(profile is first_profile for _, profile in trvs)
+        ):
+            await self._async_publish(group_topic, get_payload(first_profile), priority)
+            return
+
+        for entity, profile in trvs:
+            topic = profile.get_command_topic(self.get_friendly_name(entity))
+            if topic is not None:
+                await self._async_publish(topic, get_payload(profile), priority)
+
+    async def _async_publish(self, topic: str, payload: str, priority: int):
+        """Publish one message within the command budget."""
+        try:
+            await self._async_acquire(priority)
+            await self._publisher(topic, payload)
+            self.messages_sent += 1
+            _LOGGER.debug("%s: Published %s to %s", self.name, payload, topic)
+        except Exception as err:
+            _LOGGER.warning("%s: Failed to publish to %s: %s", self.name, topic, err)
+
+    async def _async_publish_service(self, topic: str, payload: str):
+        """Default publisher: the ``mqtt.publish`` service."""
+        await self.hass.services.async_call(
+            "mqtt", "publish", {"topic": topic, "payload": payload}, blocking=False
+        )
+
+    def get_friendly_name(self, climate_entity: str) -> str:
+        """Return the Zigbee2MQTT friendly name of a TRV (cached once found in the registry)."""
+        friendly_name = self._friendly_names.get(climate_entity)
+        if friendly_name is not None:
+            return friendly_name
+
+        device = self._get_device(climate_entity)
+        if device is not None and device.name:
+            self._friendly_names[climate_entity] = device.name
+            return device.name
+
+        # Not in the registry (yet) - assume the friendly name matches the object id;
+        # not cached, so a device registered later is picked up
+        friendly_name = climate_entity.split(".", 1)[-1].replace("_", " ")
+        _LOGGER.debug(
+            "%s: No device for %s, using friendly name '%s'",
+            self.name,
+            climate_entity,
+            friendly_name,
+        )
+        return friendly_name
+
+
+class ZHATransport(TRVTransport):
+    """Writes the profile's manufacturer attributes with ``zha.set_zigbee_cluster_attribute``.
+
+    The IEEE address is resolved once from the device registry and cached.
+    ZHA has no group writes for manufacturer attributes, so each TRV gets its
+    own call.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        scheduler: Optional[CommandScheduler] = None,
+    ):
+        """Initialize the transport."""
+        super().__init__(hass, name, scheduler)
+        self._ieee: dict[str, Optional[str]] = {}
+
+    async def async_set_manual_mode(self, trvs):
+        """Write the manual operating mode attribute."""
+        for entity, profile in trvs:
+            attributes = profile.zha_attributes or {}
+            if "operating_mode" in attributes:
+                await self._async_write_attribute(
+                    entity,
+                    attributes,
+                    attributes["operating_mode"],
+                    attributes["operating_mode_manual"],
+                    PRIORITY_INIT,
+                )
+
+    async def async_send_remote_temperature(self, trvs, temperature):
+        """Write the remote temperature attribute (in 0.01°C)."""
+        for entity, profile in trvs:
+            attributes = profile.zha_attributes or {}
+            if profile.supports_remote_temperature and "remote_temperature" in attributes:
+                await self._async_write_attribute(
+                    entity,
+                    attributes,
+                    attributes["remote_temperature"],
+                    round(temperature * 100),
+                    PRIORITY_SYNC,
+                )
+
+    async def _async_write_attribute(self, entity, attributes, attribute, value, priority):
+        """Write one thermostat cluster attribute within the command budget."""
+        ieee = self.get_ieee(entity)
+        if ieee is None:
+            _LOGGER.warning("%s: No ZHA device found for %s", self.name, entity)
+            return
+
+        try:
+            await self._async_acquire(priority)
+            data = {
+                "ieee": ieee,
+                "endpoint_id": ZHA_ENDPOINT,
+                "cluster_id": ZHA_THERMOSTAT_CLUSTER,
+                "attribute": attribute,
+                "value": value,
+            }
+            if "manufacturer" in attributes:
+                data["manufacturer"] = attributes["manufacturer"]
+            await self.hass.services.async_call(
+                "zha", "set_zigbee_cluster_attribute", data, blocking=False
+            )
+            self.messages_sent += 1
+        except Exception as err:
+            _LOGGER.warning(
+                "%s: Failed to write attribute %#06x of %s: %s", self.name, attribute, entity, err
+            )
+
+    def get_ieee(self, climate_entity: str) -> Optional[str]:
+        """Return (and cache) the IEEE address of a ZHA TRV."""
+        if climate_entity not in self._ieee:
+            device = self._get_device(climate_entity)
+            self._ieee[climate_entity] = next(
+                (
+                    identifier
+                    for domain, identifier in (device.identifiers if device else ())
+                    if domain == TRANSPORT_ZHA
+                ),
+                None,
+            )
+        return self._ieee[climate_entity]
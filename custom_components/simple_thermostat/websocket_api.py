@@ -0,0 +1,89 @@
+"""Websocket API - Serves bulky thermostat details to the Lovelace card."""
+import logging
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_track_state_change_event
+
+from .const import DOMAIN
+from .coordinator import async_get_coordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+WS_TYPE_GET_DETAILS = f"{DOMAIN}/details"
+WS_TYPE_SUBSCRIBE_DETAILS = f"{DOMAIN}/subscribe_details"
+WS_TYPE_GET_METRICS = f"{DOMAIN}/metrics"
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant):
+    """Register the websocket commands used by the card."""
+    websocket_api.async_register_command(hass, ws_get_details)
+    websocket_api.async_register_command(hass, ws_subscribe_details)
+    websocket_api.async_register_command(hass, ws_get_metrics)
+
+
+@callback
+def _async_get_thermostat(hass: HomeAssistant, entity_id: str):
+    """Return the Simple Thermostat entity for an entity_id, if any."""
+    return async_get_coordinator(hass).get_thermostat(entity_id)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_TYPE_GET_DETAILS,
+        vol.Required("entity_id"): cv.entity_id,
+    }
+)
+@callback
+def ws_get_details(hass: HomeAssistant, connection, msg: dict):
+    """Return history, schedule and per-TRV values of a thermostat."""
+    thermostat = _async_get_thermostat(hass, msg["entity_id"])
+    if thermostat is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"{msg['entity_id']} not found"
+        )
+        return
+
+    connection.send_result(msg["id"], thermostat.get_details())
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): WS_TYPE_SUBSCRIBE_DETAILS,
+        vol.Required("entity_id"): cv.entity_id,
+    }
+)
+@callback
+def ws_subscribe_details(hass: HomeAssistant, connection, msg: dict):
+    """Send thermostat details now and after every state write of the entity."""
+    entity_id = msg["entity_id"]
+    if _async_get_thermostat(hass, entity_id) is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"{entity_id} not found"
+        )
+        return
+
+    @callback
+    def _async_send_details(_event=None):
+        thermostat = _async_get_thermostat(hass, entity_id)
+        if thermostat is not None:
+            connection.send_message(
+                websocket_api.event_message(msg["id"], thermostat.get_details())
+            )
+
+    connection.subscriptions[msg["id"]] = async_track_state_change_event(
+        hass, [entity_id], _async_send_details
+    )
+    connection.send_result(msg["id"])
+    _async_send_details()
+
+
+@websocket_api.websocket_command({vol.Required("type"): WS_TYPE_GET_METRICS})
+@callback
+def ws_get_metrics(hass: HomeAssistant, connection, msg: dict):
+    """Return control loop metrics of every room and the house-wide totals."""
+    connection.send_result(msg["id"], async_get_coordinator(hass).get_metrics())
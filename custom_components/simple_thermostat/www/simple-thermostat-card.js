@@ -4,12 +4,24 @@ class SimpleThermostatCard extends HTMLElement {
     this.attachShadow({ mode: 'open' });
     this._config = {};
     this._hass = null;
+    this._details = null;
+    this._unsubDetails = null;
+    // Failed subscriptions are retried with backoff (attributes are used meanwhile)
+    this._detailsRetryAt = 0;
+    this._detailsBackoff = 0;
   }
 
   setConfig(config) {
     if (!config.entity) {
       throw new Error('Please define an entity');
     }
+    if (this._config.entity !== config.entity) {
+      // Details belong to the previous entity
+      this._unsubscribeDetails();
+      this._details = null;
+      this._detailsRetryAt = 0;
+      this._detailsBackoff = 0;
+    }
     this._config = config;
   }
 
@@ -21,9 +33,57 @@ class SimpleThermostatCard extends HTMLElement {
       this._initialized = true;
     }
 
+    this._subscribeDetails();
     this._updateContent();
   }
 
+  disconnectedCallback() {
+    this._unsubscribeDetails();
+  }
+
+  _subscribeDetails() {
+    // History, schedule and per-TRV values come over the websocket API
+    // (they are not stored by the recorder)
+    if (this._unsubDetails || !this._hass.connection || !this._hass.states[this._config.entity]) return;
+    if (Date.now() < this._detailsRetryAt) return;
+
+    const subscription = this._hass.connection.subscribeMessage(
+      (details) => {
+        this._details = details;
+        this._detailsBackoff = 0;
+        this._updateContent();
+      },
+      { type: 'simple_thermostat/subscribe_details', entity_id: this._config.entity }
+    ).catch((err) => {
+      // e.g. not_found while the thermostat is still starting up
+      if (!this._detailsBackoff) {
+        console.warn('Simple Thermostat details subscription failed, using attributes:', err);
+      }
+      this._detailsBackoff = Math.min((this._detailsBackoff || 2500) * 2, 300000);
+      this._detailsRetryAt = Date.now() + this._detailsBackoff;
+      if (this._unsubDetails === subscription) {
+        this._unsubDetails = null;
+      }
+      return null;
+    });
+    this._unsubDetails = subscription;
+  }
+
+  _unsubscribeDetails() {
+    if (this._unsubDetails) {
+      this._unsubDetails.then((unsub) => unsub && unsub());
+      this._unsubDetails = null;
+    }
+  }
+
+  _getDetail(entity, key) {
+    // Prefer websocket details; fall back to the state attribute
+    if (this._details && this._details[key] !== undefined) {
+      return this._details[key];
+    }
+    return entity.attributes[key];
+  }
+
   _initialize() {
     const style = document.createElement('style');
     style.textContent = `
@@ -638,7 +698,7 @@ class SimpleThermostatCard extends HTMLElement {
 
   _updateLogs(entity) {
     const logsSection = this.shadowRoot.getElementById('logs');
-    const actionHistory = entity.attributes.action_history || [];
+    const actionHistory = this._getDetail(entity, 'action_history') || [];
 
     if (actionHistory.length === 0) {
       logsSection.innerHTML = '<div style="padding: 8px; color: var(--secondary-text-color);">No recent actions</div>';
@@ -953,8 +1013,8 @@ class SimpleThermostatCard extends HTMLElement {
   _updateScheduleChart(entity) {
     const scheduleChartSection = this.shadowRoot.getElementById('schedule-chart');
 
-    // Get schedule data from entity attributes
-    const scheduleData = entity.attributes.schedule;
+    // Get schedule data (websocket details, falling back to entity attributes)
+    const scheduleData = this._getDetail(entity, 'schedule');
     if (!scheduleData || (!scheduleData.weekday && !scheduleData.weekend)) {
       scheduleChartSection.innerHTML = `
         <div style="padding: 16px; margin-top: 16px; border-top: 1px solid var(--divider-color);">